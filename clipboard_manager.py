@@ -11,6 +11,7 @@ Key Features:
 - Duplicate detection and handling
 - Thread-safe operations with proper locking
 - Callback system for clipboard change notifications
+- History-changed callbacks, so views refresh only on real changes
 - Graceful start/stop of monitoring services
 
 The clipboard manager uses pyperclip for cross-platform clipboard access and
@@ -23,7 +24,7 @@ Version: 1.0.0
 import pyperclip
 import threading
 import time
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
 from collections import deque
 import config
 
@@ -74,8 +75,16 @@ class ClipboardManager:
         # Callback system for clipboard change notifications
         self.callbacks = []
         
+        # Callbacks called whenever the history itself changes
+        self.history_callbacks = []
+        
         # Thread safety lock
         self._lock = threading.Lock()
+        
+        # Truncated display strings of the history items for the last display
+        # length asked for (see get_display_history)
+        self._display_length = None
+        self._display_cache = {}
     
     def add_callback(self, callback: Callable[[str], None]):
         """
@@ -112,6 +121,45 @@ class ClipboardManager:
         if callback in self.callbacks:
             self.callbacks.remove(callback)
     
+    def add_history_callback(self, callback: Callable[[], None]):
+        """
+        Add a callback function to be called when the clipboard history changes.
+        
+        Callbacks are called after an item is added to (or moved to the front
+        of) the history and after the history is cleared, so views can refresh
+        on real changes instead of polling. They run on the thread that made
+        the change, which may be the monitoring thread.
+        
+        Args:
+            callback (Callable[[], None]): Function to call after a history change.
+                                          Adding the same function twice has no effect.
+        
+        Example:
+            clipboard_manager.add_history_callback(dashboard.schedule_clipboard_refresh)
+        """
+        if callback not in self.history_callbacks:
+            self.history_callbacks.append(callback)
+    
+    def remove_history_callback(self, callback: Callable[[], None]):
+        """
+        Remove a previously added history callback.
+        
+        Args:
+            callback (Callable[[], None]): The callback function to remove.
+        """
+        if callback in self.history_callbacks:
+            self.history_callbacks.remove(callback)
+    
+    def _notify_history_changed(self):
+        """
+        Call the history callbacks (outside the history lock).
+        """
+        for callback in self.history_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in clipboard history callback: {e}")
+    
     def _notify_callbacks(self, new_content: str):
         """
         Notify all registered callbacks of a clipboard change.
@@ -190,29 +238,16 @@ class ClipboardManager:
         try:
             self.current_clipboard = pyperclip.paste()
             # Add initial content to history if it's not empty
-            if self.current_clipboard.strip():
-                self._add_to_history(self.current_clipboard)
+            if self.current_clipboard.strip() and self._add_to_history(self.current_clipboard):
+                self._notify_history_changed()
         except Exception as e:
             print(f"Error initializing clipboard: {e}")
         
         # Main monitoring loop
         while self.monitoring:
             try:
-                # Get current clipboard content
-                new_content = pyperclip.paste()
-                
-                # Check if clipboard content has changed
-                if new_content != self.current_clipboard:
-                    # Update our tracking
-                    self.current_clipboard = new_content
-                    
-                    # Only process non-empty text content
-                    if new_content and new_content.strip():
-                        # Add to history
-                        self._add_to_history(new_content)
-                        
-                        # Notify callbacks
-                        self._notify_callbacks(new_content)
+                # Get current clipboard content and record it if it changed
+                self.capture(pyperclip.paste())
                 
                 # Sleep for the configured interval
                 time.sleep(config.CLIPBOARD_MONITOR_INTERVAL)
@@ -222,7 +257,38 @@ class ClipboardManager:
                 # Wait longer on error to prevent spam
                 time.sleep(1)
     
-    def _add_to_history(self, content: str):
+    def capture(self, new_content: str) -> bool:
+        """
+        Record clipboard content that was just read from the system clipboard.
+        
+        Used by the polling loop and by the UI, which is notified of clipboard
+        changes directly (QClipboard.dataChanged) and can hand the new text
+        over immediately instead of waiting for the next poll.
+        
+        Args:
+            new_content (str): The current clipboard text
+            
+        Returns:
+            bool: True if the content differed from the last seen clipboard
+        """
+        # Check if clipboard content has changed
+        if new_content == self.current_clipboard:
+            return False
+        
+        # Update our tracking
+        self.current_clipboard = new_content
+        
+        # Only process non-empty text content
+        if new_content and new_content.strip():
+            # Add to history
+            if self._add_to_history(new_content):
+                self._notify_history_changed()
+            
+            # Notify callbacks
+            self._notify_callbacks(new_content)
+        return True
+    
+    def _add_to_history(self, content: str) -> bool:
         """
         Add content to clipboard history with duplicate handling.
         
@@ -233,8 +299,16 @@ class ClipboardManager:
         
         Args:
             content (str): The clipboard content to add to history.
+        
+        Returns:
+            bool: True if the history changed (False if the content already
+                  was the most recent item).
         """
         with self._lock:
+            # Already the most recent item - nothing to reorder
+            if self.clipboard_history and self.clipboard_history[0] == content:
+                return False
+            
             # Remove duplicate if it exists
             # We search through the deque and remove the duplicate
             # This ensures the most recent copy is at the front
@@ -247,6 +321,7 @@ class ClipboardManager:
             # Add new content to the front of the history
             # deque.appendleft() adds to the front efficiently
             self.clipboard_history.appendleft(content)
+            return True
     
     def get_clipboard_history(self) -> List[str]:
         """
@@ -269,6 +344,37 @@ class ClipboardManager:
             # Convert deque to list for safe return
             return list(self.clipboard_history)
     
+    def get_display_history(self, max_length: int) -> List[Tuple[str, str]]:
+        """
+        Get the clipboard history with display strings truncated for the UI.
+        
+        Each item is truncated once and the result is kept while the item
+        stays in history, so repeated calls only look the strings up.
+        
+        Args:
+            max_length (int): Longest display string before it is cut and
+                             "..." is appended.
+        
+        Returns:
+            List[Tuple[str, str]]: (full text, display text) pairs, most recent first.
+        """
+        with self._lock:
+            if max_length != self._display_length:
+                self._display_length = max_length
+                self._display_cache = {}
+            
+            # Keep only the truncations of items still in history
+            previous = self._display_cache
+            self._display_cache = cache = {}
+            history = []
+            for item in self.clipboard_history:
+                display = previous.get(item)
+                if display is None:
+                    display = item[:max_length] + "..." if len(item) > max_length else item
+                cache[item] = display
+                history.append((item, display))
+            return history
+    
     def copy_to_clipboard(self, content: str):
         """
         Copy content to the system clipboard.
@@ -328,7 +434,10 @@ class ClipboardManager:
             print("Clipboard history cleared")
         """
         with self._lock:
+            changed = bool(self.clipboard_history)
             self.clipboard_history.clear()
+        if changed:
+            self._notify_history_changed()
     
     def get_history_item(self, index: int) -> Optional[str]:
         """
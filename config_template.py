@@ -143,16 +143,15 @@ DATABASE_FOLDER = "SnapPad"
 # This file will contain all persistent notes and application data
 DATABASE_FILENAME = "snappad.db"
 
+# How long a database write waits for another connection's lock, in milliseconds
+# The database runs in WAL mode, so reads never wait; only concurrent writes do
+# Range: 100-60000 milliseconds (validated by validate_config())
+DATABASE_BUSY_TIMEOUT = 5000
+
 # =============================================================================
 # UI SETTINGS
 # =============================================================================
 
-# How often to refresh the UI in milliseconds
-# Lower values make the UI more responsive but use more CPU
-# Higher values save CPU but may make the UI feel less responsive
-# Range: 100-10000 milliseconds (validated by validate_config())
-REFRESH_INTERVAL = 500
-
 # Maximum length of clipboard text to display in the UI
 # Longer text will be truncated with "..." for better readability
 # Range: 20-500 characters (validated by validate_config())
@@ -247,10 +246,11 @@ def validate_config():
     if not (0.1 <= CLIPBOARD_MONITOR_INTERVAL <= 5.0):
         errors.append("CLIPBOARD_MONITOR_INTERVAL must be between 0.1 and 5.0 seconds")
     
-    # Validate UI settings
-    if not (100 <= REFRESH_INTERVAL <= 10000):
-        errors.append("REFRESH_INTERVAL must be between 100 and 10000 milliseconds")
+    # Validate database settings
+    if not (100 <= DATABASE_BUSY_TIMEOUT <= 60000):
+        errors.append("DATABASE_BUSY_TIMEOUT must be between 100 and 60000 milliseconds")
     
+    # Validate UI settings
     if not (20 <= CLIPBOARD_DISPLAY_MAX_LENGTH <= 500):
         errors.append("CLIPBOARD_DISPLAY_MAX_LENGTH must be between 20 and 500 characters")
     
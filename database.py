@@ -22,12 +22,111 @@ Author: SnapPad Team
 Version: 1.0.0
 """
 
+import logging
 import sqlite3
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 import config
 
+log = logging.getLogger(__name__)
+
+
+# Columns of a notes row in NoteRec field order; the null fallbacks are applied
+# by SQLite so rows can be passed straight to NoteRec(*row)
+_NOTE_COLUMNS = """
+    id, COALESCE(title, 'Untitled'), content, COALESCE(priority, 1), created_at, updated_at
+"""
+
+# Note queries, built once so every call passes the same SQL text and is
+# served from the connection's statement cache
+_SQL_ALL_NOTES = f"SELECT {_NOTE_COLUMNS} FROM notes ORDER BY updated_at DESC"
+_SQL_NOTE_BY_ID = f"SELECT {_NOTE_COLUMNS} FROM notes WHERE id = ?"
+
+
+@dataclass(frozen=True)
+class NoteRec:
+    """
+    Lightweight, immutable record for a single note.
+    
+    Uses __slots__ instead of a per-instance dict, so every note shares one
+    set of field names and attribute access avoids a hash lookup. Instances
+    are produced once by DatabaseManager and handed straight to the UI.
+    
+    Records are never changed after construction; an edit builds a new one
+    with with_changes(). That makes it safe to read the same records from
+    other threads (e.g. the notes filter running in the thread pool).
+    
+    Attributes:
+        id (int): Unique note identifier
+        title (str): Note title
+        content (str): Note text content
+        priority (int): Priority level (1=normal, 2=high, 3=urgent)
+        created_at (str): Creation timestamp (ISO format)
+        updated_at (str): Last update timestamp (ISO format)
+        title_lc (str): Lower-cased title, precomputed for sorting by title
+        search_text (str): Lower-cased title and content joined by a newline,
+            precomputed so a search is one substring test per note
+    """
+    __slots__ = ('id', 'title', 'content', 'priority', 'created_at', 'updated_at',
+                 'title_lc', 'search_text')
+    
+    id: int
+    title: str
+    content: str
+    priority: int
+    created_at: str
+    updated_at: str
+    
+    # title_lc/search_text are slots but not dataclass fields: they are derived
+    # in __post_init__ and left out of __init__, repr and comparisons
+    
+    def __post_init__(self):
+        """
+        Precompute the lower-cased sort and search fields once per record.
+        
+        The record is frozen, so the derived slots are set with
+        object.__setattr__.
+        """
+        title_lc = self.title.lower()
+        object.__setattr__(self, 'title_lc', title_lc)
+        object.__setattr__(self, 'search_text', f"{title_lc}\n{self.content.lower()}")
+    
+    def with_changes(self, title: str, content: str, priority: int) -> 'NoteRec':
+        """
+        Build a copy of the record with new editable fields.
+        
+        The search fields of the copy are derived again; this record is left
+        unchanged.
+        
+        Args:
+            title (str): New note title
+            content (str): New note content
+            priority (int): New priority level
+            
+        Returns:
+            NoteRec: The edited record
+        """
+        return replace(self, title=title, content=content, priority=priority)
+    
+    @classmethod
+    def from_row(cls, row) -> 'NoteRec':
+        """
+        Build a note record from a notes row selected with _NOTE_COLUMNS.
+        
+        Args:
+            row: Tuple of (id, title, content, priority, created_at, updated_at)
+            
+        Returns:
+            NoteRec: The note record
+        """
+        return cls(*row)
+
 
 class DatabaseManager:
     """
@@ -57,6 +156,27 @@ class DatabaseManager:
         5. Ensures the database is ready for operations
         """
         self.db_path = self._get_db_path()
+        
+        # Monotonic counter bumped on every note write, so callers can tell
+        # whether a cached get_all_notes() result is still current
+        self._notes_version = 0
+        
+        # Callbacks for note changes (called with no arguments after each write)
+        self.notes_callbacks = []
+        
+        # Long-lived connection for the notes methods, opened on first use.
+        # Reusing it keeps SQLite's per-connection statement cache warm, so
+        # repeated note queries and writes skip parsing and planning.
+        # It belongs to the thread that opens it (the GUI thread); see
+        # _notes_connection.
+        self._notes_conn = None
+        self._notes_conn_thread = None
+        
+        # Per-thread write connection of a NoteWriter thread: note writes made
+        # on that thread go through it and are reported by the writer instead
+        # of calling notes callbacks
+        self._writer_local = threading.local()
+        
         self._ensure_db_directory()
         self._initialize_database()
         self._migrate_database()
@@ -97,6 +217,70 @@ class DatabaseManager:
         if not os.path.exists(db_dir):
             os.makedirs(db_dir)
     
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """
+        Open a connection to the database with SnapPad's connection settings.
+        
+        WAL journaling (enabled once in _initialize_database) lets readers
+        run alongside a writer, so synchronous=NORMAL is safe there and
+        commits skip the extra sync of the default FULL mode. Writers
+        wait up to DATABASE_BUSY_TIMEOUT for each other's locks, and
+        temporary tables and the page cache stay in memory.
+        
+        Args:
+            **kwargs: Extra keyword arguments for sqlite3.connect
+            
+        Returns:
+            sqlite3.Connection: The configured connection
+        """
+        busy_timeout = getattr(config, 'DATABASE_BUSY_TIMEOUT', 5000)
+        conn = sqlite3.connect(self.db_path, timeout=busy_timeout / 1000, **kwargs)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')  # Negative: size in KiB (about 20 MB)
+        return conn
+    
+    def _notes_connection(self) -> sqlite3.Connection:
+        """
+        Get the long-lived connection used by the notes methods.
+        
+        The connection is in autocommit mode (isolation_level=None); writes
+        open their transactions explicitly. Its statement cache is sized so
+        every notes statement stays prepared.
+        
+        GUI thread only: the connection keeps sqlite3's default
+        check_same_thread=True and is bound to the thread that first opened
+        it, which is the GUI thread (get_all_notes, get_note_by_id and the
+        fallback writes of a stopped NoteWriter all run there). Other
+        threads must not call the notes methods; a NoteWriter thread writes
+        through its own connection from open_writer_connection instead.
+        
+        Returns:
+            sqlite3.Connection: The notes connection
+            
+        Raises:
+            RuntimeError: If called from a thread other than the one that
+                opened the connection
+        """
+        if self._notes_conn is None:
+            self._notes_conn = self._connect(isolation_level=None, cached_statements=256)
+            self._notes_conn_thread = threading.get_ident()
+        elif self._notes_conn_thread != threading.get_ident():
+            raise RuntimeError("The notes connection is GUI-thread-only; "
+                               "it was used from a thread other than the one that opened it")
+        return self._notes_conn
+    
+    def close(self):
+        """
+        Close the notes connection.
+        
+        Call once when the application quits.
+        """
+        if self._notes_conn is not None:
+            self._notes_conn.close()
+            self._notes_conn = None
+            self._notes_conn_thread = None
+    
     def _initialize_database(self):
         """
         Initialize the database with required tables.
@@ -120,9 +304,13 @@ class DatabaseManager:
         - created_at: TEXT DEFAULT CURRENT_TIMESTAMP (when created)
         - updated_at: TEXT DEFAULT CURRENT_TIMESTAMP (when last modified)
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
+            # Write-ahead logging is stored in the database file, so enabling
+            # it once here applies to every later connection
+            cursor.execute('PRAGMA journal_mode=WAL')
+            
             # Create the notes table with proper schema including title and priority
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS notes (
@@ -135,6 +323,12 @@ class DatabaseManager:
                 )
             ''')
             
+            # Index the default "most recently updated first" order, so
+            # get_all_notes() reads rows in order instead of sorting them
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_notes_updated_at ON notes(updated_at)
+            ''')
+            
             # Create the enhanced_prompts table for storing AI-enhanced prompts
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS enhanced_prompts (
@@ -158,7 +352,7 @@ class DatabaseManager:
         that might not have the title or priority columns. It checks if the columns exist
         and adds them if necessary.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Check what columns exist in notes table
@@ -227,7 +421,7 @@ class DatabaseManager:
         # Get the current timestamp in ISO format
         current_time = datetime.now().isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Insert the new enhanced prompt
@@ -298,7 +492,7 @@ class DatabaseManager:
                 status = "Saved" if prompt['is_saved'] else "Temporary"
                 print(f"Prompt {prompt['id']}: {prompt['title']} ({status})")
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Query all enhanced prompts ordered by most recent update first
@@ -338,7 +532,7 @@ class DatabaseManager:
             temp_prompts = db.get_unsaved_enhanced_prompts()
             print(f"Found {len(temp_prompts)} temporary prompts")
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Query only unsaved enhanced prompts
@@ -391,7 +585,7 @@ class DatabaseManager:
         # Get the current timestamp for the update
         current_time = datetime.now().isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Build the update query dynamically based on provided parameters
@@ -452,7 +646,7 @@ class DatabaseManager:
             else:
                 print("Enhanced prompt not found or deletion failed")
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Delete the prompt by ID
@@ -491,7 +685,7 @@ class DatabaseManager:
             else:
                 print("Enhanced prompt not found")
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Query for the specific enhanced prompt
@@ -562,6 +756,109 @@ class DatabaseManager:
         """
         return self.update_enhanced_prompt(prompt_id, is_saved=False)
 
+    # Note Writer Connections
+    
+    def open_writer_connection(self):
+        """
+        Open a write connection and bind it to the calling thread.
+        
+        Used by a NoteWriter thread. Until close_writer_connection() is
+        called, add_note, update_note and delete_note made on this thread
+        run on that connection, inside the transaction of the enclosing
+        writer_transaction() block, and don't call notes callbacks - the
+        writer reports its commits instead.
+        """
+        self._writer_local.conn = self._connect(isolation_level=None)
+        self._writer_local.changed = False
+    
+    def close_writer_connection(self):
+        """
+        Close the calling thread's write connection (if it has one).
+        """
+        conn = getattr(self._writer_local, 'conn', None)
+        if conn is not None:
+            self._writer_local.conn = None
+            conn.close()
+    
+    @contextmanager
+    def writer_transaction(self):
+        """
+        Run the note writes of the block as one transaction on the calling
+        thread's write connection (see open_writer_connection).
+        
+        The transaction is committed when the block exits and rolled back if
+        the block or the commit raises; the exception propagates. Afterwards
+        writer_changed() tells whether any note changed.
+        
+        Example:
+            with db.writer_transaction():
+                db.delete_note(1)
+                db.delete_note(2)  # One commit for both deletes
+        """
+        conn = self._writer_local.conn
+        self._writer_local.changed = False
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+            conn.execute('COMMIT')
+        except BaseException:
+            self._writer_local.changed = False
+            try:
+                conn.execute('ROLLBACK')
+            except sqlite3.Error:
+                pass  # No transaction left to roll back
+            raise
+    
+    def writer_changed(self) -> bool:
+        """
+        Tell whether the calling thread's last writer transaction changed a note.
+        
+        Returns:
+            bool: True if a committed note write affected a row
+        """
+        return getattr(self._writer_local, 'changed', False)
+    
+    @contextmanager
+    def _note_write(self):
+        """
+        Get a cursor for a note write.
+        
+        On a thread with a writer connection the write joins that thread's
+        writer transaction. Otherwise it runs in its own transaction on the
+        notes connection, committed when the block exits and rolled back if
+        the block or the commit raises, so the autocommit notes connection is
+        never left inside an open transaction.
+        
+        Yields:
+            sqlite3.Cursor: Cursor to execute the write with
+        """
+        writer_conn = getattr(self._writer_local, 'conn', None)
+        if writer_conn is not None:
+            yield writer_conn.cursor()
+            return
+        
+        conn = self._notes_connection()
+        conn.execute('BEGIN')
+        try:
+            yield conn.cursor()
+            conn.execute('COMMIT')
+        except BaseException:
+            try:
+                conn.execute('ROLLBACK')
+            except sqlite3.Error:
+                pass  # No transaction left to roll back
+            raise
+    
+    def _note_written(self):
+        """
+        Record a successful note write (reported by the writer on a
+        NoteWriter thread).
+        """
+        if getattr(self._writer_local, 'conn', None) is not None:
+            self._writer_local.changed = True
+        else:
+            self._notes_changed()
+    
     # Original Notes Methods (unchanged)
     
     def add_note(self, content: str, title: str = None, priority: int = 1) -> int:
@@ -593,32 +890,91 @@ class DatabaseManager:
         # Get the current timestamp in ISO format
         current_time = datetime.now().isoformat()
         
-        # Use a context manager for automatic connection handling
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
+        # Write on the notes connection, or in the writer thread's transaction
+        with self._note_write() as cursor:
             # Insert the new note with title, priority, and timestamps
             cursor.execute('''
                 INSERT INTO notes (title, content, priority, created_at, updated_at)
                 VALUES (?, ?, ?, ?, ?)
             ''', (title, content, priority, current_time, current_time))
-            
-            # Commit the transaction
-            conn.commit()
-            
-            # Return the ID of the newly created note
-            return cursor.lastrowid
+        self._note_written()
+        
+        # Return the ID of the newly created note
+        return cursor.lastrowid
+    
+    def add_notes_callback(self, callback: Callable[[], None]):
+        """
+        Add a callback function to be called when notes change.
+        
+        Callbacks are called after a note is added, updated or deleted through
+        this manager, so views can refresh without every writer having to
+        know about them.
+        
+        Args:
+            callback (Callable[[], None]): Function to call after a note write.
+                                          Adding the same function twice has no effect.
+        
+        Example:
+            database_manager.add_notes_callback(dashboard.schedule_notes_refresh)
+        """
+        if callback not in self.notes_callbacks:
+            self.notes_callbacks.append(callback)
+    
+    def remove_notes_callback(self, callback: Callable[[], None]):
+        """
+        Remove a previously added notes callback.
+        
+        Args:
+            callback (Callable[[], None]): The callback function to remove.
+        """
+        if callback in self.notes_callbacks:
+            self.notes_callbacks.remove(callback)
+    
+    def notify_notes_changed(self):
+        """
+        Report note writes made outside this manager's own connection.
+        
+        Bumps the notes version and calls the notes callbacks. Call it from
+        the thread the callbacks expect (the GUI thread) once writes made by
+        a NoteWriter have been committed.
+        """
+        self._notes_changed()
+    
+    def _notes_changed(self):
+        """
+        Record a note write: bump the notes version and notify callbacks.
+        """
+        self._notes_version += 1
+        for callback in self.notes_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in notes callback: {e}")
     
-    def get_all_notes(self) -> List[Dict]:
+    @property
+    def notes_version(self) -> int:
+        """
+        Get the current notes version.
+        
+        The version increases whenever a note is added, updated or deleted
+        through this manager. Comparing it with the version seen at the last
+        fetch tells whether cached notes are stale without querying SQLite.
+        
+        Returns:
+            int: Monotonic notes version
+        """
+        return self._notes_version
+    
+    def get_all_notes(self) -> List[NoteRec]:
         """
         Retrieve all notes from the database.
         
-        This method fetches all notes and returns them as a list of dictionaries,
-        ordered by most recently updated first. Each dictionary contains all
-        note fields for easy access.
+        This method fetches all notes and returns them as a list of NoteRec
+        records, ordered by most recently updated first. Each record contains
+        all note fields as attributes.
         
         Returns:
-            List[Dict]: List of note dictionaries, each containing:
+            List[NoteRec]: List of note records, each containing:
                 - id (int): Unique note identifier
                 - title (str): Note title
                 - content (str): Note text content
@@ -629,33 +985,19 @@ class DatabaseManager:
         Example:
             notes = db.get_all_notes()
             for note in notes:
-                print(f"Note {note['id']}: {note['title']} (Priority: {note['priority']}) - {note['content']}")
+                print(f"Note {note.id}: {note.title} (Priority: {note.priority}) - {note.content}")
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Query all notes ordered by most recent update first (keeping original sorting)
-            cursor.execute('''
-                SELECT id, title, content, priority, created_at, updated_at
-                FROM notes
-                ORDER BY updated_at DESC
-            ''')
-            
-            # Fetch all results
-            rows = cursor.fetchall()
-            
-            # Convert rows to dictionaries for easier access
-            return [
-                {
-                    'id': row[0],
-                    'title': row[1] or "Untitled",  # Fallback for null titles
-                    'content': row[2],
-                    'priority': row[3] if row[3] is not None else 1,  # Fallback for null priorities
-                    'created_at': row[4],
-                    'updated_at': row[5]
-                }
-                for row in rows
-            ]
+        cursor = self._notes_connection().cursor()
+        
+        # Query all notes ordered by most recent update first (keeping original sorting)
+        cursor.execute(_SQL_ALL_NOTES)
+        
+        # Fetch all results
+        rows = cursor.fetchall()
+        
+        # Convert rows to note records once, shared with the UI (the
+        # columns already match NoteRec's fields, fallbacks included)
+        return [NoteRec(*row) for row in rows]
     
     def update_note(self, note_id: int, content: str, title: str = None, priority: int = None) -> bool:
         """
@@ -688,9 +1030,7 @@ class DatabaseManager:
         if priority is not None:
             priority = max(1, min(3, priority))
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
+        with self._note_write() as cursor:
             if title is not None and priority is not None:
                 # Update content, title, priority and timestamp
                 cursor.execute('''
@@ -719,12 +1059,12 @@ class DatabaseManager:
                     SET content = ?, updated_at = ?
                     WHERE id = ?
                 ''', (content, current_time, note_id))
-            
-            # Commit the changes
-            conn.commit()
-            
-            # Return True if at least one row was affected
-            return cursor.rowcount > 0
+        
+        # Return True if at least one row was affected
+        if cursor.rowcount > 0:
+            self._note_written()
+            return True
+        return False
     
     def delete_note(self, note_id: int) -> bool:
         """
@@ -746,19 +1086,17 @@ class DatabaseManager:
             else:
                 print("Note not found or deletion failed")
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
+        with self._note_write() as cursor:
             # Delete the note by ID
             cursor.execute('DELETE FROM notes WHERE id = ?', (note_id,))
-            
-            # Commit the changes
-            conn.commit()
-            
-            # Return True if at least one row was affected
-            return cursor.rowcount > 0
+        
+        # Return True if at least one row was affected
+        if cursor.rowcount > 0:
+            self._note_written()
+            return True
+        return False
     
-    def get_note_by_id(self, note_id: int) -> Optional[Dict]:
+    def get_note_by_id(self, note_id: int) -> Optional[NoteRec]:
         """
         Retrieve a specific note by its ID.
         
@@ -769,8 +1107,8 @@ class DatabaseManager:
             note_id (int): The ID of the note to retrieve
             
         Returns:
-            Optional[Dict]: Note dictionary if found, None otherwise
-            The dictionary contains:
+            Optional[NoteRec]: Note record if found, None otherwise
+            The record contains:
                 - id (int): Unique note identifier
                 - title (str): Note title
                 - content (str): Note text content
@@ -781,33 +1119,206 @@ class DatabaseManager:
         Example:
             note = db.get_note_by_id(1)
             if note:
-                print(f"Found note: {note['title']} (Priority: {note['priority']}) - {note['content']}")
+                print(f"Found note: {note.title} (Priority: {note.priority}) - {note.content}")
             else:
                 print("Note not found")
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Query for the specific note
-            cursor.execute('''
-                SELECT id, title, content, priority, created_at, updated_at
-                FROM notes
-                WHERE id = ?
-            ''', (note_id,))
-            
-            # Fetch the result
-            row = cursor.fetchone()
-            
-            # Return the note as a dictionary if found
-            if row:
-                return {
-                    'id': row[0],
-                    'title': row[1] or "Untitled",  # Fallback for null titles
-                    'content': row[2],
-                    'priority': row[3] if row[3] is not None else 1,  # Fallback for null priorities
-                    'created_at': row[4],
-                    'updated_at': row[5]
-                }
+        cursor = self._notes_connection().cursor()
+        
+        # Query for the specific note
+        cursor.execute(_SQL_NOTE_BY_ID, (note_id,))
+        
+        # Fetch the result
+        row = cursor.fetchone()
+        
+        # Return the note as a record if found
+        if row:
+            return NoteRec.from_row(row)
+        
+        # Return None if note not found
+        return None 
+
+
+class NoteWriter:
+    """
+    Applies note writes on a background thread so callers never wait on SQLite.
+    
+    add_note, update_note and delete_note only queue the write and return.
+    The writer thread owns its own connection and applies everything queued
+    so far in one transaction, then commits and calls on_committed once - so
+    a burst of writes costs a single commit. The queue is bounded: if the
+    writer falls max_pending writes behind, callers wait for it.
+    
+    on_committed is called on the writer thread with (writes, changed,
+    complete): the number of queued writes the transaction covered, whether
+    any note actually changed, and whether every one of those writes reached
+    the database. A burst that could not be committed (e.g. the database
+    stayed locked past the busy timeout) is rolled back and reported with
+    changed=False and complete=False. A write that fails on its own is
+    skipped: the rest of its burst is still committed and reported with
+    complete=False, and changed says whether the surviving writes changed
+    a note. Whenever complete is False the receiver should reload the notes
+    from the database instead of trusting what it mirrored. Hand it to the thread that owns
+    the notes callbacks, which should then call
+    DatabaseManager.notify_notes_changed().
+    
+    Example:
+        writer = NoteWriter(db, on_committed=signal.emit)
+        writer.delete_note(1)
+        writer.delete_note(2)  # Usually committed together with the first
+        writer.stop()          # Apply what's left and end the thread
+    """
+    
+    def __init__(self, database_manager: DatabaseManager,
+                 on_committed: Optional[Callable[[int, bool, bool], None]] = None,
+                 max_pending: int = 256):
+        """
+        Initialize the writer and start its thread.
+        
+        Args:
+            database_manager (DatabaseManager): Manager whose note methods do the writes
+            on_committed (Callable[[int, bool, bool], None], optional): Called on
+                the writer thread after each transaction
+            max_pending (int): Queued writes after which callers wait
+        """
+        self.database_manager = database_manager
+        self.on_committed = on_committed
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="NoteWriter", daemon=True)
+        self._thread.start()
+    
+    def add_note(self, content: str, title: str = None, priority: int = 1):
+        """
+        Queue adding a note (see DatabaseManager.add_note).
+        """
+        self._put((self.database_manager.add_note, (content, title, priority)))
+    
+    def update_note(self, note_id: int, content: str, title: str = None, priority: int = None):
+        """
+        Queue updating a note (see DatabaseManager.update_note).
+        """
+        self._put((self.database_manager.update_note, (note_id, content, title, priority)))
+    
+    def delete_note(self, note_id: int):
+        """
+        Queue deleting a note (see DatabaseManager.delete_note).
+        """
+        self._put((self.database_manager.delete_note, (note_id,)))
+    
+    def _put(self, write):
+        """
+        Queue a write, or apply it on the calling thread if the writer thread is gone.
+        
+        A write applied directly goes through the manager's notes connection
+        and calls the notes callbacks itself, so it is neither lost nor left
+        blocking on a queue nobody empties.
+        
+        Args:
+            write: (bound note method, args) tuple
+        """
+        if self._thread.is_alive():
+            self._queue.put(write)
+        else:
+            method, args = write
+            method(*args)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every write queued so far has been applied (or rolled back).
+        
+        Args:
+            timeout (float, optional): Longest time to wait, in seconds
             
-            # Return None if note not found
-            return None 
\ No newline at end of file
+        Returns:
+            bool: True once the writes were applied; False on timeout or if
+                  the writer thread is not running
+        """
+        if not self._thread.is_alive():
+            return False
+        
+        deadline = None if timeout is None else time.monotonic() + timeout
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return done.wait(remaining)
+    
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Apply the remaining writes and end the writer thread.
+        
+        Args:
+            timeout (float, optional): Longest time to wait, in seconds
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout)
+    
+    def _run(self):
+        """
+        Writer thread loop: apply queued writes one transaction per burst.
+        
+        Every queued item is marked done (and flush() waiters released) even
+        if its burst fails, so the thread keeps running and neither flush()
+        nor a full queue can leave callers waiting forever.
+        """
+        db = self.database_manager
+        try:
+            db.open_writer_connection()
+        except Exception as e:
+            log.warning("Error opening note writer connection: %s", e)
+            return
+        try:
+            stopping = False
+            while not stopping:
+                # Take the next item and everything already queued behind it
+                batch = [self._queue.get()]
+                while batch[-1] is not None:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stopping = batch[-1] is None
+                
+                try:
+                    self._apply([item for item in batch if isinstance(item, tuple)])
+                except Exception as e:
+                    log.warning("Error in note writer: %s", e)
+                finally:
+                    for item in batch:
+                        if isinstance(item, threading.Event):
+                            item.set()  # A flush() marker
+                        self._queue.task_done()
+        finally:
+            db.close_writer_connection()
+    
+    def _apply(self, writes: list):
+        """
+        Apply one burst of writes in a single transaction and report it.
+        
+        Args:
+            writes (list): (bound note method, args) tuples, oldest first
+        """
+        if not writes:
+            return
+        
+        db = self.database_manager
+        complete = True
+        try:
+            with db.writer_transaction():
+                for method, args in writes:
+                    try:
+                        method(*args)
+                    except Exception as e:
+                        log.warning("Error applying queued note write: %s", e)
+                        complete = False
+            changed = db.writer_changed()
+        except Exception as e:
+            # BEGIN or COMMIT failed: the whole burst was rolled back
+            log.warning("Error committing queued note writes (rolled back): %s", e)
+            changed = complete = False
+        
+        if self.on_committed:
+            self.on_committed(len(writes), changed, complete)
@@ -31,6 +31,7 @@ from clipboard_manager import ClipboardManager
 from hotkey_manager import HotkeyManager
 from openai_manager import OpenAIManager
 from ui.dashboard import Dashboard
+from ui.workers import stop_api_threads
 import config
 
 
@@ -444,8 +445,10 @@ class SnapPadApp:
         
         This method ensures proper cleanup of all resources:
         1. Stop background service
-        2. Hide system tray icon
-        3. Exit the Qt application
+        2. Commit batched note writes and close the database connection
+        3. Stop the OpenAI request threads
+        4. Hide system tray icon
+        5. Exit the Qt application
         
         This prevents resource leaks and ensures clean shutdown.
         """
@@ -455,6 +458,15 @@ class SnapPadApp:
         if self.background_service:
             self.background_service.stop()
         
+        # Commit note writes still queued with the dashboard's note writer
+        if self.dashboard:
+            self.dashboard.flush_note_writes()
+        if self.database_manager:
+            self.database_manager.close()
+        
+        # Stop the OpenAI request threads
+        stop_api_threads()
+        
         # Hide the system tray icon
         if self.system_tray:
             self.system_tray.hide()
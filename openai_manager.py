@@ -20,7 +20,7 @@ Version: 1.0.0
 
 import os
 import threading
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 from openai import OpenAI
 import config
 
@@ -110,7 +110,8 @@ class OpenAIManager:
         """
         return self.is_configured and self.client is not None
     
-    def enhance_prompt(self, original_prompt: str) -> Optional[str]:
+    def enhance_prompt(self, original_prompt: str,
+                       on_chunk: Optional[Callable[[str], None]] = None) -> Optional[str]:
         """
         Enhance a user prompt using OpenAI's GPT model.
         
@@ -118,8 +119,14 @@ class OpenAIManager:
         to generate an enhanced version that is more effective, clear,
         and detailed for AI model interactions.
         
+        With on_chunk, the response is streamed: on_chunk is called with each
+        piece of text as it arrives (so a UI can show it right away), and the
+        complete text is still returned at the end.
+        
         Args:
             original_prompt (str): The original prompt to enhance
+            on_chunk (Callable[[str], None], optional): Called with each
+                streamed piece of the response
             
         Returns:
             Optional[str]: The enhanced prompt, or None if enhancement failed
@@ -161,11 +168,21 @@ class OpenAIManager:
                         }
                     ],
                     max_tokens=config.OPENAI_MAX_TOKENS,
-                    temperature=config.OPENAI_TEMPERATURE
+                    temperature=config.OPENAI_TEMPERATURE,
+                    stream=on_chunk is not None
                 )
                 
                 # Extract the enhanced prompt from the response
-                enhanced_prompt = response.choices[0].message.content.strip()
+                if on_chunk is not None:
+                    parts = []
+                    for chunk in response:
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            parts.append(delta)
+                            on_chunk(delta)
+                    enhanced_prompt = ''.join(parts).strip()
+                else:
+                    enhanced_prompt = response.choices[0].message.content.strip()
                 
                 if enhanced_prompt:
                     print(f"Prompt enhanced successfully. Original: {len(original_prompt)} chars, Enhanced: {len(enhanced_prompt)} chars")
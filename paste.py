@@ -0,0 +1,99 @@
+"""
+Paste Helper for SnapPad
+
+This module sends a paste keystroke (Ctrl+V) to the application that has
+focus, so generated text placed on the clipboard replaces the user's
+selection.
+
+Key Features:
+- Native SendInput call on Windows: the four key events (Ctrl down, V down,
+  V up, Ctrl up) are built once and injected in a single call
+- Falls back to the keyboard library on other platforms
+
+Author: SnapPad Team
+Version: 1.0.0
+"""
+
+import sys
+
+import keyboard
+
+
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+
+    _INPUT_KEYBOARD = 1
+    _KEYEVENTF_KEYUP = 0x0002
+    _VK_CONTROL = 0x11
+    _VK_V = 0x56
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [('wVk', wintypes.WORD),
+                    ('wScan', wintypes.WORD),
+                    ('dwFlags', wintypes.DWORD),
+                    ('time', wintypes.DWORD),
+                    ('dwExtraInfo', ctypes.c_size_t)]
+
+    class _MOUSEINPUT(ctypes.Structure):
+        # Only here so the INPUT union has its full size
+        _fields_ = [('dx', wintypes.LONG),
+                    ('dy', wintypes.LONG),
+                    ('mouseData', wintypes.DWORD),
+                    ('dwFlags', wintypes.DWORD),
+                    ('time', wintypes.DWORD),
+                    ('dwExtraInfo', ctypes.c_size_t)]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [('ki', _KEYBDINPUT), ('mi', _MOUSEINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _fields_ = [('type', wintypes.DWORD), ('union', _INPUTUNION)]
+
+    def _key_input(vk: int, flags: int = 0) -> '_INPUT':
+        """Build a keyboard INPUT event for a virtual key."""
+        return _INPUT(type=_INPUT_KEYBOARD,
+                      union=_INPUTUNION(ki=_KEYBDINPUT(wVk=vk, dwFlags=flags)))
+
+    # Ctrl+V as one array of key events, built once at import
+    _PASTE_INPUTS = (_INPUT * 4)(
+        _key_input(_VK_CONTROL),
+        _key_input(_VK_V),
+        _key_input(_VK_V, _KEYEVENTF_KEYUP),
+        _key_input(_VK_CONTROL, _KEYEVENTF_KEYUP),
+    )
+
+    # Key-up events that release whatever a partial send left held down,
+    # keyed by the number of events SendInput reported as injected
+    _RELEASE_INPUTS = {
+        1: (_INPUT * 1)(_key_input(_VK_CONTROL, _KEYEVENTF_KEYUP)),
+        2: (_INPUT * 2)(_key_input(_VK_V, _KEYEVENTF_KEYUP),
+                        _key_input(_VK_CONTROL, _KEYEVENTF_KEYUP)),
+        3: (_INPUT * 1)(_key_input(_VK_CONTROL, _KEYEVENTF_KEYUP)),
+    }
+
+    _send_input = ctypes.windll.user32.SendInput
+    _send_input.argtypes = (wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int)
+    _send_input.restype = wintypes.UINT
+
+
+def send_paste():
+    """
+    Send Ctrl+V to the application that has keyboard focus.
+
+    On Windows the keystrokes are injected with a single SendInput call.
+    Only if it injected nothing (e.g. blocked by UIPI), or on other
+    platforms, does the keyboard library send them instead. If SendInput
+    injected some of the events, the chord is not replayed (it may already
+    have pasted); only key-ups for the keys it left down are sent, so Ctrl
+    is never left stuck.
+    """
+    if sys.platform == 'win32':
+        sent = _send_input(len(_PASTE_INPUTS), _PASTE_INPUTS, ctypes.sizeof(_INPUT))
+        if sent == len(_PASTE_INPUTS):
+            return
+        if sent:
+            release = _RELEASE_INPUTS[sent]
+            _send_input(len(release), release, ctypes.sizeof(_INPUT))
+            return
+    keyboard.send('ctrl+v')
@@ -7,10 +7,35 @@ This module contains reusable UI components used throughout the application.
 import time
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QTextEdit, QFrame, QApplication)
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt6.QtCore import (Qt, QTimer, QThread, QObject, pyqtSignal, QAbstractListModel,
+                          QModelIndex)
 from PyQt6.QtGui import QFont, QPixmap, QPainter, QColor
 
 
+def make_font(pixel_size: int, bold: bool = False, italic: bool = False) -> QFont:
+    """
+    Build a shared font to set on widgets with setFont().
+    
+    Only the explicitly set attributes are resolved against the widget's
+    inherited font, so the family still follows the application default.
+    
+    Args:
+        pixel_size (int): Font size in pixels
+        bold (bool): Whether the font is bold
+        italic (bool): Whether the font is italic
+        
+    Returns:
+        QFont: Configured font instance
+    """
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    if bold:
+        font.setBold(True)
+    if italic:
+        font.setItalic(True)
+    return font
+
+
 class LoadingSpinner(QWidget):
     """
     A simple loading spinner widget that shows an animated loading indicator.
@@ -29,7 +54,7 @@ class LoadingSpinner(QWidget):
         super().__init__(parent)
         self.setFixedSize(20, 20)
         self.angle = 0
-        self.timer = QTimer()
+        self.timer = QTimer(self)
         self.timer.timeout.connect(self.rotate)
         self.is_animating = False
         
@@ -53,9 +78,37 @@ class LoadingSpinner(QWidget):
         self.timer.stop()
         self.hide()
     
+    def showEvent(self, event):
+        """
+        Resume the animation when the spinner comes back on screen.
+        
+        Args:
+            event: Show event
+        """
+        super().showEvent(event)
+        if self.is_animating and not self.timer.isActive():
+            self.timer.start(50)
+    
+    def hideEvent(self, event):
+        """
+        Pause the animation while the spinner is off screen.
+        
+        The spinner is also hidden along with its window (e.g. when the
+        dashboard is toggled away mid-request), so no frames are ticked or
+        repainted that nobody can see.
+        
+        Args:
+            event: Hide event
+        """
+        super().hideEvent(event)
+        self.timer.stop()
+    
     def rotate(self):
         """
         Rotate the spinner by updating the angle.
+        
+        Only this 20x20 widget is invalidated, so sibling widgets are not
+        repainted or laid out again on each frame.
         """
         if self.is_animating:
             self.angle = (self.angle + 30) % 360
@@ -272,74 +325,135 @@ class SmartResponsePopup(QWidget):
         event.accept()
 
 
-class ClickableLabel(QLabel):
+class ClipboardModel(QAbstractListModel):
     """
-    A clickable label widget that emits signals when clicked.
+    List model exposing the clipboard history to a QListView.
     
-    This custom QLabel provides clickable functionality for clipboard history items.
-    When clicked, it emits a signal with the label's text content, allowing the
-    parent widget to handle the click event (typically to copy the text back
-    to the clipboard).
-    
-    Features:
-    - Hover effects with color changes
-    - Word wrapping for long text
-    - Custom styling with borders and padding
-    - Click detection and signal emission
-    - Pointer cursor on hover
+    The view only lays out and paints the rows inside its viewport, so a long
+    history costs no more widgets than a short one. The display role carries
+    the numbered, truncated text shown in the list; FullTextRole carries the
+    untruncated item that is copied back when a row is clicked.
     """
     
-    # Signal emitted when the label is clicked, passing the text content
-    clicked = pyqtSignal(str)
+    # Custom role returning the full text of a history item
+    FullTextRole = Qt.ItemDataRole.UserRole + 1
     
-    def __init__(self, text: str, *args, **kwargs):
+    def __init__(self, parent=None):
         """
-        Initialize the clickable label.
+        Initialize an empty clipboard history model.
         
         Args:
-            text (str): The text content to display in the label.
-            *args: Additional positional arguments passed to QLabel.
-            **kwargs: Additional keyword arguments passed to QLabel.
+            parent: Parent QObject (optional)
+        """
+        super().__init__(parent)
+        self._items = []  # (full text, display text) per row
+    
+    def set_history(self, history):
         """
-        super().__init__(text, *args, **kwargs)
+        Replace the model contents.
         
-        # Enable word wrapping for long text
-        self.setWordWrap(True)
+        Args:
+            history: (full text, truncated display text) pairs, newest first,
+                     as returned by ClipboardManager.get_display_history
+        """
+        self.beginResetModel()
+        # Numbered once here rather than on every data() call while painting
+        self._items = [(item, f"{i+1}. {display_text}")
+                       for i, (item, display_text) in enumerate(history)]
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Get the number of history items (flat list, so children have none).
+        """
+        return 0 if parent.isValid() else len(self._items)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Get the data for a row.
         
-        # Apply custom styling
-        self.setStyleSheet("""
-            QLabel {
-                background: #ffffff;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                padding: 6px;
-                margin: 2px;
-                color: #333333;
-                font-size: 12px;
-            }
-            QLabel:hover {
-                background: #f5f5f5;
-                border-color: #4a90e2;
-            }
-        """)
+        Args:
+            index (QModelIndex): The row index
+            role: Qt.ItemDataRole.DisplayRole or ClipboardModel.FullTextRole
+            
+        Returns:
+            The display text, the full text, or None
+        """
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
         
-        # Set cursor to pointer to indicate clickability
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        item, display_text = self._items[index.row()]
+        if role == self.FullTextRole:
+            return item
+        if role == Qt.ItemDataRole.DisplayRole:
+            return display_text
+        return None
+
+
+class ClipboardBridge(QObject):
+    """
+    Debounced wrapper around the Qt system clipboard.
+    
+    Some toolkits (notably GTK) fire several dataChanged notifications for a
+    single clipboard update, and our own writes echo straight back as change
+    events. Reacting to each of those makes the dashboard rebuild its history
+    list repeatedly. This bridge:
+    - Ignores change notifications fired shortly after our own set_text()
+    - Coalesces bursts of notifications into a single changed signal
+    """
     
-    def mousePressEvent(self, event):
+    # Signal emitted once per burst of external clipboard changes
+    clipboard_changed = pyqtSignal()
+    
+    def __init__(self, parent=None, debounce_ms: int = 50, ignore_own_ms: int = 100):
+        """
+        Initialize the clipboard bridge.
+        
+        Args:
+            parent: Parent QObject (optional)
+            debounce_ms (int): Window in milliseconds used to coalesce bursts
+            ignore_own_ms (int): Window in milliseconds after set_text() during
+                                 which change notifications are ignored
         """
-        Handle mouse press events to detect clicks.
+        super().__init__(parent)
+        
+        self._ignore_own_seconds = ignore_own_ms / 1000.0
+        self._mine_until = 0.0
         
-        This method is called when the user clicks on the label. It emits
-        the clicked signal with the label's text content if the left mouse
-        button was pressed.
+        # Single-shot timer reused for debouncing instead of posting a new one per event
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self.clipboard_changed)
+        
+        self._clipboard = QApplication.clipboard()
+        self._clipboard.dataChanged.connect(self._on_changed)
+    
+    def set_text(self, text: str):
+        """
+        Put text on the system clipboard without echoing a change event.
         
         Args:
-            event: The mouse press event containing button and position information.
+            text (str): The text to place on the clipboard
+        """
+        self._mine_until = time.monotonic() + self._ignore_own_seconds
+        self._clipboard.setText(text)
+    
+    def text(self) -> str:
+        """
+        Get the current clipboard text.
+        
+        Returns:
+            str: Current clipboard text (empty string if none)
+        """
+        return self._clipboard.text()
+    
+    def _on_changed(self):
+        """
+        Handle QClipboard.dataChanged, skipping our own writes and debouncing bursts.
         """
-        if event.button() == Qt.MouseButton.LeftButton:
-            # Emit the clicked signal with the label's text
-            self.clicked.emit(self.text())
+        if time.monotonic() < self._mine_until:
+            return
         
-        # Call the parent implementation to ensure proper event handling
-        super().mousePressEvent(event) 
\ No newline at end of file
+        # Restarting a running single-shot timer coalesces the burst
+        self._debounce_timer.start()
@@ -5,24 +5,229 @@ This module contains the main dashboard window that orchestrates all UI componen
 """
 
 import sys
+import logging
+import importlib
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QLineEdit, QPushButton, QTextEdit, QMessageBox, 
-                             QSplitter, QFrame, QScrollArea, QComboBox,
-                             QApplication, QProgressBar, QDialog)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QFont, QIcon, QAction, QShortcut, QKeySequence
+                             QSplitter, QFrame, QComboBox, QListView,
+                             QAbstractItemView, QApplication, QProgressBar, QDialog)
+from PyQt6.QtCore import Qt, QTimer, QThreadPool, QModelIndex, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QFont, QIcon, QAction, QShortcut, QKeySequence, QTextCursor
 from typing import List, Dict, Optional, Callable
 import threading
+from collections import OrderedDict, deque
+from operator import itemgetter
 from datetime import datetime
 import config
+from database import NoteWriter
+from paste import send_paste
 
 # Import UI components
-from .components import LoadingSpinner, ClickableLabel
-from .workers import OpenAIWorker, SmartResponseWorker
-from .notes import EditableNoteWidget, AddNoteDialog
+from .components import (make_font, LoadingSpinner, ClipboardModel, ClipboardBridge,
+                         SmartResponsePopup)
+from .workers import OpenAIWorker, SmartResponseWorker, ClipboardCaptureTask
+from .notes import (EditableNoteWidget, NotesListView, AddNoteDialog,
+                    filter_and_sort_notes, note_sort_model)
 from .windows import NotesWindow
 from .settings import SettingsWindow
 
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)  # hotkey-path DEBUG messages are skipped before formatting
+
+# Fonts of the dashboard's styled widgets keyed by object name. They are set
+# with setFont() (see _apply_named_fonts) rather than through font rules in
+# _DASHBOARD_QSS, so Qt doesn't resolve fonts through the stylesheet per widget.
+_DASHBOARD_FONTS = {
+    "settingsBtn": make_font(12, bold=True),
+    "sectionTitle": make_font(13, bold=True),
+    "fieldLabel": make_font(11),
+    "statusLabel": make_font(10, italic=True),
+    "emptyHint": make_font(12, italic=True),
+    "clipboardList": make_font(12),
+    "addNoteBtn": make_font(11, bold=True),
+    "openNotesBtn": make_font(11, bold=True),
+    "notesSearch": make_font(12),
+    "notesSort": make_font(12),
+    "promptInput": make_font(12),
+    "promptOutput": make_font(12),
+    "enhanceBtn": make_font(12, bold=True),
+    "generateResponseBtn": make_font(12, bold=True),
+    "copyResultBtn": make_font(11, bold=True),
+}
+
+
+def _apply_named_fonts(root: QWidget):
+    """
+    Set the _DASHBOARD_FONTS font of a widget and its descendants by object name.
+    
+    Args:
+        root (QWidget): Widget whose subtree (itself included) gets its fonts
+    """
+    for widget in [root] + root.findChildren(QWidget):
+        font = _DASHBOARD_FONTS.get(widget.objectName())
+        if font is not None:
+            widget.setFont(font)
+
+
+# Stylesheet for the whole dashboard, installed once on the window; widgets
+# pick up their rules by object name instead of each parsing its own sheet.
+# Like the per-frame sheets it replaces, the section frame rule also reaches
+# QFrame-based children (labels, text edits, list views), so their rules
+# are scoped under #sectionFrame to take precedence.
+_DASHBOARD_QSS = """
+    QMainWindow {
+        background: #f8f9fa;
+    }
+    QSplitter#sectionSplitter::handle {
+        background-color: #bdc3c7;
+        border-radius: 1px;
+        margin: 1px;
+    }
+    QSplitter#sectionSplitter::handle:hover {
+        background-color: #95a5a6;
+    }
+    QPushButton#settingsBtn {
+        background: #95a5a6;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 4px;
+    }
+    QPushButton#settingsBtn:hover {
+        background: #7f8c8d;
+    }
+    QFrame#sectionFrame, QFrame#sectionFrame QFrame {
+        border: 1px solid #d1d5db;
+        border-radius: 6px;
+        background: #ffffff;
+        padding: 4px;
+    }
+    QFrame#sectionFrame QLabel#sectionTitle {
+        color: #2c3e50;
+        margin-bottom: 2px;
+        background: transparent;
+    }
+    QFrame#sectionFrame QLabel#fieldLabel {
+        color: #7f8c8d;
+        background: transparent;
+    }
+    QFrame#sectionFrame QLabel#statusLabel {
+        color: #27ae60;
+        background: transparent;
+        padding: 2px;
+    }
+    QFrame#sectionFrame QLabel#emptyHint {
+        color: #7f8c8d; 
+        padding: 12px;
+        background: transparent;
+    }
+    QFrame#sectionFrame QListView#clipboardList {
+        border: none;
+        background: transparent;
+    }
+    QListView#clipboardList::item {
+        background: #ffffff;
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        padding: 6px;
+        margin: 2px;
+        color: #333333;
+    }
+    QListView#clipboardList::item:hover {
+        background: #f5f5f5;
+        border-color: #4a90e2;
+    }
+    QFrame#sectionFrame QListView QScrollBar:vertical {
+        background: #f1f3f4;
+        width: 8px;
+        border-radius: 4px;
+    }
+    QFrame#sectionFrame QListView QScrollBar::handle:vertical {
+        background: #bdc3c7;
+        border-radius: 4px;
+        min-height: 20px;
+    }
+    QFrame#sectionFrame QListView QScrollBar::handle:vertical:hover {
+        background: #95a5a6;
+    }
+    QPushButton#addNoteBtn, QPushButton#openNotesBtn {
+        background: #27ae60;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 4px 8px;
+    }
+    QPushButton#addNoteBtn:hover {
+        background: #229954;
+    }
+    QPushButton#openNotesBtn {
+        background: #3498db;
+    }
+    QPushButton#openNotesBtn:hover {
+        background: #2980b9;
+    }
+    QLineEdit#notesSearch, QComboBox#notesSort {
+        border: 1px solid #d1d5db;
+        border-radius: 4px;
+        padding: 6px;
+        background-color: #ffffff;
+        color: #2c3e50;
+    }
+    QLineEdit#notesSearch:focus, QComboBox#notesSort:focus {
+        border-color: #4a90e2;
+    }
+    QComboBox#notesSort::drop-down {
+        border: none;
+    }
+    QComboBox#notesSort::down-arrow {
+        image: none;
+        border: none;
+    }
+    QFrame#sectionFrame QTextEdit#promptInput, QFrame#sectionFrame QTextEdit#promptOutput {
+        border: 1px solid #d1d5db;
+        border-radius: 4px;
+        padding: 6px;
+        background-color: #ffffff;
+        color: #2c3e50;
+    }
+    QFrame#sectionFrame QTextEdit#promptInput:focus {
+        border-color: #4a90e2;
+    }
+    QFrame#sectionFrame QTextEdit#promptOutput {
+        background-color: #f8f9fa;
+    }
+    QPushButton#enhanceBtn, QPushButton#generateResponseBtn, QPushButton#copyResultBtn {
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px;
+    }
+    QPushButton#enhanceBtn {
+        background: #e67e22;
+    }
+    QPushButton#enhanceBtn:hover {
+        background: #d35400;
+    }
+    QPushButton#generateResponseBtn {
+        background: #9b59b6;
+    }
+    QPushButton#generateResponseBtn:hover {
+        background: #8e44ad;
+    }
+    QPushButton#copyResultBtn {
+        background: #27ae60;
+        padding: 6px;
+    }
+    QPushButton#copyResultBtn:hover {
+        background: #229954;
+    }
+    QPushButton#enhanceBtn:disabled, QPushButton#generateResponseBtn:disabled,
+    QPushButton#copyResultBtn:disabled {
+        background: #bdc3c7;
+        color: #7f8c8d;
+    }
+"""
+
 
 class Dashboard(QMainWindow):
     """
@@ -43,6 +248,12 @@ class Dashboard(QMainWindow):
     enhance_prompt_from_clipboard_signal = pyqtSignal()
     generate_smart_response_from_clipboard_signal = pyqtSignal()
     
+    # Emitted from the note writer thread after each transaction (writes, changed, complete)
+    _notes_committed = pyqtSignal(int, bool, bool)
+    
+    # Emitted (from any thread) when the clipboard manager's history changes
+    _clipboard_history_changed = pyqtSignal()
+    
     def __init__(self):
         """
         Initialize the dashboard window.
@@ -52,6 +263,13 @@ class Dashboard(QMainWindow):
         """
         super().__init__()
         
+        # Primary screen geometry, cached for positioning the dashboard and
+        # the loading popups; dropped when the primary screen or its
+        # geometry changes
+        self._screen_geometry = None
+        self._watched_screen = None
+        QApplication.instance().primaryScreenChanged.connect(self._invalidate_screen_geometry)
+        
         # Initialize managers
         self.clipboard_manager = None
         self.database_manager = None
@@ -60,18 +278,110 @@ class Dashboard(QMainWindow):
         # Initialize notes window reference
         self.notes_window = None
         
+        # Notes list widgets (created by _create_notes_list)
+        self.notes_view = None
+        self.notes_hint_label = None
+        
+        # Clipboard list widgets (created by _create_clipboard_list, if enabled)
+        self.clipboard_view = None
+        self.clipboard_hint_label = None
+        
+        # All notes from the last database fetch, reused by search/sort refreshes
+        # until the database's notes_version moves (i.e. a note was written)
+        self._notes_cache = None
+        self._notes_cache_version = -1
+        
+        # Filter/sort results for the cached notes keyed by
+        # (search term, sort option), least recently used first; cleared
+        # whenever the notes cache is reloaded
+        self._sorted_notes_cache = OrderedDict()
+        self._sorted_notes_cache_size = 16
+        
         # Initialize settings window reference
         self.settings_window = None
         
-        # Initialize worker thread
+        # Initialize worker threads
         self.openai_worker = None
+        self.smart_response_worker = None
+        
+        # Text the enhance hotkey copied from the selection (still on the
+        # clipboard while its enhancement runs)
+        self._last_selected_text = None
+        
+        # Floating hotkey loading popups (built on first use, then hidden and
+        # reused) and the smart response popup
+        self.loading_widget = None
+        self.smart_response_loading_widget = None
+        self.smart_response_popup = None
+        
+        # Warning box shared by every dashboard warning (built on first use)
+        self._warning_box = None
+        
+        # Hotkey selection capture running in the thread pool, if any
+        self._capture_task = None
+        
+        # Set from an enhance/smart response hotkey press until its request
+        # finishes; further presses are ignored meanwhile
+        self._clipboard_hotkey_busy = False
+        
+        # Debounced system clipboard access - ignores echoes of our own copies
+        self.clipboard_bridge = ClipboardBridge(self)
+        self.clipboard_bridge.clipboard_changed.connect(self._on_clipboard_changed)
+        
+        # Text waiting to be pasted once it is on the clipboard (see _paste_text).
+        # The paste is sent from the dataChanged slot or, if no change is
+        # reported, by the fallback timer - never from a local event loop.
+        self._pending_paste = None
+        self._paste_timer = QTimer(self)
+        self._paste_timer.setSingleShot(True)
+        self._paste_timer.setInterval(250)
+        self._paste_timer.timeout.connect(self._send_pending_paste)
+        QApplication.clipboard().dataChanged.connect(self._paste_when_copied)
+        
+        # Note writes schedule one deferred refresh per event-loop turn, so a
+        # burst of adds/updates/deletes redraws the notes list once
+        self._refresh_pending = False
+        
+        # Note writes from the dashboard are applied by a background writer
+        # (created in set_managers), which commits each burst of them at once
+        self.note_writer = None
+        self._notes_committed.connect(self._on_notes_committed)
+        
+        # One entry per queued write, oldest first: the notes cache version
+        # the write was mirrored against, or None if the caches don't mirror
+        # it; the caches stay valid after a commit only if every entry matches
+        self._pending_writes = deque()
+        
+        # Search debounce: typing restarts the timer, so a burst of keystrokes
+        # refreshes the notes list once (must exist before the UI is built)
+        self._notes_search_timer = QTimer(self)
+        self._notes_search_timer.setSingleShot(True)
+        self._notes_search_timer.setInterval(200)
+        self._notes_search_timer.timeout.connect(self.refresh_notes)
+        
+        # What the clipboard section last showed (view, history display
+        # pairs); a refresh that would show the same returns early
+        self._clip_shown = None
+        
+        # Notes changed while the dashboard was hidden are refreshed on show
+        # (the clipboard section is checked on every show)
+        self._notes_dirty = False
+        
+        # The clipboard section is refreshed when the clipboard manager reports
+        # a history change (see schedule_clipboard_refresh) instead of on a
+        # timer. The report may come from the manager's monitoring thread, so
+        # the refresh is queued to the GUI thread.
+        self._clipboard_history_changed.connect(
+            self.refresh_clipboard_history, Qt.ConnectionType.QueuedConnection)
+        
+        # Section frames whose widgets are built lazily, as (frame, builder)
+        self._pending_sections = []
         
         # Load settings and apply them (this will set up the UI)
         self.load_and_apply_settings()
         
         # Apply initial size adjustment if settings were loaded
         try:
-            from .settings import SettingsWindow
             temp_settings = SettingsWindow()
             settings = temp_settings.get_settings()
             temp_settings.close()
@@ -82,16 +392,34 @@ class Dashboard(QMainWindow):
         # Configure window properties
         self.setup_window_properties()
         
-        # Connect signals to their respective slots
-        self.toggle_visibility_signal.connect(self.toggle_visibility)
-        self.add_note_from_clipboard_signal.connect(self.add_note_from_clipboard)
-        self.enhance_prompt_from_clipboard_signal.connect(self.enhance_prompt_from_clipboard)
-        self.generate_smart_response_from_clipboard_signal.connect(self.generate_smart_response_from_clipboard)
+        # Connect signals to their respective slots. They are emitted from the
+        # hotkey listener thread, so the connections are explicitly queued
+        # (delivered on the GUI thread) rather than resolved on every emit.
+        queued = Qt.ConnectionType.QueuedConnection
+        self.toggle_visibility_signal.connect(self.toggle_visibility, queued)
+        self.add_note_from_clipboard_signal.connect(self.add_note_from_clipboard, queued)
+        self.enhance_prompt_from_clipboard_signal.connect(self.enhance_prompt_from_clipboard, queued)
+        self.generate_smart_response_from_clipboard_signal.connect(
+            self.generate_smart_response_from_clipboard, queued)
         
-        # Timer for refreshing clipboard history
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_clipboard_history)
-        self.refresh_timer.start(config.REFRESH_INTERVAL)  # Refresh based on config
+        # Window-level shortcut that saves whichever note editor has focus
+        # (one shortcut for the dashboard instead of one per note widget)
+        self.save_note_shortcut = QShortcut(QKeySequence("Ctrl+S"), self)
+        self.save_note_shortcut.activated.connect(self._save_focused_note)
+    
+    def _save_focused_note(self):
+        """
+        Save the note whose editor currently has keyboard focus.
+        
+        Walks up from the focused widget to the enclosing note widget and
+        saves it if it is in edit mode. Does nothing otherwise.
+        """
+        widget = QApplication.focusWidget()
+        while widget is not None and not isinstance(widget, EditableNoteWidget):
+            widget = widget.parentWidget()
+        
+        if widget is not None and widget.is_editing:
+            widget.save_note()
     
     def setup_ui(self):
         """
@@ -109,12 +437,8 @@ class Dashboard(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
-        # Set main window background
-        self.setStyleSheet("""
-            QMainWindow {
-                background: #f8f9fa;
-            }
-        """)
+        # Styles for the whole dashboard, matched by widget object name
+        self.setStyleSheet(_DASHBOARD_QSS)
         
         # Main layout - reduced margins
         main_layout = QVBoxLayout()
@@ -129,109 +453,34 @@ class Dashboard(QMainWindow):
         self.settings_btn.setMaximumWidth(30)
         self.settings_btn.setMaximumHeight(24)
         self.settings_btn.clicked.connect(self.open_settings)
-        self.settings_btn.setStyleSheet("""
-            QPushButton {
-                background: #95a5a6;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #7f8c8d;
-            }
-        """)
+        self.settings_btn.setObjectName("settingsBtn")
         
         header_layout.addWidget(self.settings_btn)
         header_layout.addStretch()
         
         # Create splitter for resizable sections
         splitter = QSplitter(Qt.Orientation.Vertical)
-        splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: #bdc3c7;
-                border-radius: 1px;
-                margin: 1px;
-            }
-            QSplitter::handle:hover {
-                background-color: #95a5a6;
-            }
-        """)
+        splitter.setObjectName("sectionSplitter")
         
         # Clipboard History Section
         clipboard_frame = QFrame()
         clipboard_frame.setFrameStyle(QFrame.Shape.Box)
-        clipboard_frame.setStyleSheet("""
-            QFrame {
-                border: 1px solid #d1d5db;
-                border-radius: 6px;
-                background: #ffffff;
-                padding: 4px;
-            }
-        """)
+        clipboard_frame.setObjectName("sectionFrame")
         clipboard_layout = QVBoxLayout()
         clipboard_layout.setSpacing(6)  # Reduced from 10
         clipboard_layout.setContentsMargins(6, 6, 6, 6)
         
         clipboard_title = QLabel("📋 Clipboard History")
-        clipboard_title.setStyleSheet("""
-            QLabel {
-                font-weight: bold; 
-                font-size: 13px;
-                color: #2c3e50;
-                margin-bottom: 2px;
-                background: transparent;
-            }
-        """)
+        clipboard_title.setObjectName("sectionTitle")
         clipboard_layout.addWidget(clipboard_title)
         
-        self.clipboard_scroll = QScrollArea()
-        self.clipboard_scroll.setWidgetResizable(True)
-        self.clipboard_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.clipboard_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.clipboard_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #f1f3f4;
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #bdc3c7;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #95a5a6;
-            }
-        """)
-        
-        self.clipboard_content = QWidget()
-        self.clipboard_content_layout = QVBoxLayout()
-        self.clipboard_content_layout.setSpacing(2)  # Reduced spacing
-        self.clipboard_content_layout.setContentsMargins(2, 2, 2, 2)
-        self.clipboard_content.setLayout(self.clipboard_content_layout)
-        self.clipboard_scroll.setWidget(self.clipboard_content)
-        
-        clipboard_layout.addWidget(self.clipboard_scroll)
+        self._create_clipboard_list(clipboard_layout)
         clipboard_frame.setLayout(clipboard_layout)
         
         # Notes Section
         notes_frame = QFrame()
         notes_frame.setFrameStyle(QFrame.Shape.Box)
-        notes_frame.setStyleSheet("""
-            QFrame {
-                border: 1px solid #d1d5db;
-                border-radius: 6px;
-                background: #ffffff;
-                padding: 4px;
-            }
-        """)
+        notes_frame.setObjectName("sectionFrame")
         notes_layout = QVBoxLayout()
         notes_layout.setSpacing(6)  # Reduced from 10
         notes_layout.setContentsMargins(6, 6, 6, 6)
@@ -241,55 +490,21 @@ class Dashboard(QMainWindow):
         notes_header_layout.setSpacing(10)
         
         notes_title = QLabel("📝 Notes")
-        notes_title.setStyleSheet("""
-            QLabel {
-                font-weight: bold; 
-                font-size: 13px;
-                color: #2c3e50;
-                margin-bottom: 2px;
-                background: transparent;
-            }
-        """)
+        notes_title.setObjectName("sectionTitle")
         
         # Add Note button
         self.add_note_btn = QPushButton("Add")
         self.add_note_btn.setMaximumWidth(50)
         self.add_note_btn.setMaximumHeight(24)
         self.add_note_btn.clicked.connect(self.show_add_note_dialog)
-        self.add_note_btn.setStyleSheet("""
-            QPushButton {
-                background: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #229954;
-            }
-        """)
+        self.add_note_btn.setObjectName("addNoteBtn")
         
         # Open Notes button
         self.open_notes_btn = QPushButton("Open")
         self.open_notes_btn.setMaximumWidth(60)
         self.open_notes_btn.setMaximumHeight(24)
         self.open_notes_btn.clicked.connect(self.open_all_notes)
-        self.open_notes_btn.setStyleSheet("""
-            QPushButton {
-                background: #3498db;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #2980b9;
-            }
-        """)
+        self.open_notes_btn.setObjectName("openNotesBtn")
         
         notes_header_layout.addWidget(notes_title)
         notes_header_layout.addStretch()
@@ -305,108 +520,30 @@ class Dashboard(QMainWindow):
         # Search bar
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search notes...")
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 12px;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QLineEdit:focus {
-                border-color: #4a90e2;
-            }
-        """)
-        self.search_input.textChanged.connect(self.refresh_notes)
+        self.search_input.setObjectName("notesSearch")
+        self.search_input.textChanged.connect(self._schedule_notes_search)
         
         # Sort dropdown
         self.sort_combo = QComboBox()
-        self.sort_combo.addItems([
-            "Updated (newest)",
-            "Updated (oldest)", 
-            "Created (newest)",
-            "Created (oldest)",
-            "Priority (high)",
-            "Priority (low)",
-            "Title (A-Z)",
-            "Title (Z-A)"
-        ])
+        self.sort_combo.setModel(note_sort_model())
         self.sort_combo.setCurrentIndex(0)  # Default to "Updated (newest)"
         self.sort_combo.setMaximumWidth(120)
-        self.sort_combo.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 12px;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QComboBox:focus {
-                border-color: #4a90e2;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-            }
-        """)
+        self.sort_combo.setObjectName("notesSort")
         self.sort_combo.currentTextChanged.connect(self.refresh_notes)
         
         search_sort_layout.addWidget(self.search_input)
         search_sort_layout.addWidget(self.sort_combo)
         notes_layout.addLayout(search_sort_layout)
         
-        # Notes scroll area
-        self.notes_scroll = QScrollArea()
-        self.notes_scroll.setWidgetResizable(True)
-        self.notes_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.notes_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.notes_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #f1f3f4;
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #bdc3c7;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #95a5a6;
-            }
-        """)
-        
-        self.notes_content = QWidget()
-        self.notes_content_layout = QVBoxLayout()
-        self.notes_content_layout.setSpacing(2)  # Reduced spacing
-        self.notes_content_layout.setContentsMargins(2, 2, 2, 2)
-        self.notes_content.setLayout(self.notes_content_layout)
-        self.notes_scroll.setWidget(self.notes_content)
-        
-        notes_layout.addWidget(self.notes_scroll)
+        # Notes list
+        self._create_notes_list(notes_layout)
         notes_frame.setLayout(notes_layout)
         
         # Prompt Enhancement Section (only if OpenAI is enabled)
         if config.OPENAI_ENABLED:
             prompt_frame = QFrame()
             prompt_frame.setFrameStyle(QFrame.Shape.Box)
-            prompt_frame.setStyleSheet("""
-                QFrame {
-                    border: 1px solid #d1d5db;
-                    border-radius: 6px;
-                    background: #ffffff;
-                    padding: 4px;
-                }
-            """)
+            prompt_frame.setObjectName("sectionFrame")
             prompt_layout = QVBoxLayout()
             prompt_layout.setSpacing(6)
             prompt_layout.setContentsMargins(6, 6, 6, 6)
@@ -416,15 +553,7 @@ class Dashboard(QMainWindow):
             prompt_header_layout.setSpacing(10)
             
             prompt_title = QLabel("🤖 AI Prompt Enhancement")
-            prompt_title.setStyleSheet("""
-                QLabel {
-                    font-weight: bold; 
-                    font-size: 13px;
-                    color: #2c3e50;
-                    margin-bottom: 2px;
-                    background: transparent;
-                }
-            """)
+            prompt_title.setObjectName("sectionTitle")
             
             prompt_header_layout.addWidget(prompt_title)
             prompt_header_layout.addStretch()
@@ -433,31 +562,13 @@ class Dashboard(QMainWindow):
             
             # Prompt input area
             prompt_input_label = QLabel("Paste your prompt here:")
-            prompt_input_label.setStyleSheet("""
-                QLabel {
-                    font-size: 11px;
-                    color: #7f8c8d;
-                    background: transparent;
-                }
-            """)
+            prompt_input_label.setObjectName("fieldLabel")
             prompt_layout.addWidget(prompt_input_label)
             
             self.prompt_input = QTextEdit()
             self.prompt_input.setMaximumHeight(80)
             self.prompt_input.setPlaceholderText("Paste your prompt here and click 'Enhance' to get an improved version...")
-            self.prompt_input.setStyleSheet("""
-                QTextEdit {
-                    border: 1px solid #d1d5db;
-                    border-radius: 4px;
-                    padding: 6px;
-                    font-size: 12px;
-                    background-color: #ffffff;
-                    color: #2c3e50;
-                }
-                QTextEdit:focus {
-                    border-color: #4a90e2;
-                }
-            """)
+            self.prompt_input.setObjectName("promptInput")
             prompt_layout.addWidget(self.prompt_input)
             
             # Loading spinner
@@ -467,87 +578,30 @@ class Dashboard(QMainWindow):
             # Enhance button
             self.enhance_btn = QPushButton("Enhance Prompt")
             self.enhance_btn.clicked.connect(self.enhance_prompt)
-            self.enhance_btn.setStyleSheet("""
-                QPushButton {
-                    background: #e67e22;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 8px;
-                    font-size: 12px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background: #d35400;
-                }
-                QPushButton:disabled {
-                    background: #bdc3c7;
-                    color: #7f8c8d;
-                }
-            """)
+            self.enhance_btn.setObjectName("enhanceBtn")
             prompt_layout.addWidget(self.enhance_btn)
             
             # Enhanced prompt display
             enhanced_label = QLabel("Enhanced prompt:")
-            enhanced_label.setStyleSheet("""
-                QLabel {
-                    font-size: 11px;
-                    color: #7f8c8d;
-                    background: transparent;
-                }
-            """)
+            enhanced_label.setObjectName("fieldLabel")
             prompt_layout.addWidget(enhanced_label)
             
             self.enhanced_prompt_display = QTextEdit()
             self.enhanced_prompt_display.setMaximumHeight(120)
             self.enhanced_prompt_display.setReadOnly(True)
             self.enhanced_prompt_display.setPlaceholderText("Enhanced prompt will appear here...")
-            self.enhanced_prompt_display.setStyleSheet("""
-                QTextEdit {
-                    border: 1px solid #d1d5db;
-                    border-radius: 4px;
-                    padding: 6px;
-                    font-size: 12px;
-                    background-color: #f8f9fa;
-                    color: #2c3e50;
-                }
-            """)
+            self.enhanced_prompt_display.setObjectName("promptOutput")
             prompt_layout.addWidget(self.enhanced_prompt_display)
             
             # Copy enhanced prompt button
             self.copy_enhanced_btn = QPushButton("Copy Enhanced")
             self.copy_enhanced_btn.clicked.connect(self.copy_enhanced_prompt)
-            self.copy_enhanced_btn.setStyleSheet("""
-                QPushButton {
-                    background: #27ae60;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 6px;
-                    font-size: 11px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background: #229954;
-                }
-                QPushButton:disabled {
-                    background: #bdc3c7;
-                    color: #7f8c8d;
-                }
-            """)
+            self.copy_enhanced_btn.setObjectName("copyResultBtn")
             prompt_layout.addWidget(self.copy_enhanced_btn)
             
             # Status label for feedback
             self.status_label = QLabel("")
-            self.status_label.setStyleSheet("""
-                QLabel {
-                    color: #27ae60;
-                    font-size: 10px;
-                    font-style: italic;
-                    background: transparent;
-                    padding: 2px;
-                }
-            """)
+            self.status_label.setObjectName("statusLabel")
             prompt_layout.addWidget(self.status_label)
             
             prompt_frame.setLayout(prompt_layout)
@@ -556,14 +610,7 @@ class Dashboard(QMainWindow):
             if config.SMART_RESPONSE_ENABLED:
                 smart_response_frame = QFrame()
                 smart_response_frame.setFrameStyle(QFrame.Shape.Box)
-                smart_response_frame.setStyleSheet("""
-                    QFrame {
-                        border: 1px solid #d1d5db;
-                        border-radius: 6px;
-                        background: #ffffff;
-                        padding: 4px;
-                    }
-                """)
+                smart_response_frame.setObjectName("sectionFrame")
                 smart_response_layout = QVBoxLayout()
                 smart_response_layout.setSpacing(6)
                 smart_response_layout.setContentsMargins(6, 6, 6, 6)
@@ -573,15 +620,7 @@ class Dashboard(QMainWindow):
                 smart_response_header_layout.setSpacing(10)
                 
                 smart_response_title = QLabel("🧠 AI Smart Response")
-                smart_response_title.setStyleSheet("""
-                    QLabel {
-                        font-weight: bold; 
-                        font-size: 13px;
-                        color: #2c3e50;
-                        margin-bottom: 2px;
-                        background: transparent;
-                    }
-                """)
+                smart_response_title.setObjectName("sectionTitle")
                 
                 smart_response_header_layout.addWidget(smart_response_title)
                 smart_response_header_layout.addStretch()
@@ -592,31 +631,13 @@ class Dashboard(QMainWindow):
                 
                 # Smart response input area
                 smart_response_input_label = QLabel("Enter your question, code, or prompt:")
-                smart_response_input_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 11px;
-                        color: #7f8c8d;
-                        background: transparent;
-                    }
-                """)
+                smart_response_input_label.setObjectName("fieldLabel")
                 smart_response_layout.addWidget(smart_response_input_label)
                 
                 self.smart_response_input = QTextEdit()
                 self.smart_response_input.setMaximumHeight(80)
                 self.smart_response_input.setPlaceholderText("Ask a question, paste code for review, or enter any prompt for AI response...")
-                self.smart_response_input.setStyleSheet("""
-                    QTextEdit {
-                        border: 1px solid #d1d5db;
-                        border-radius: 4px;
-                        padding: 6px;
-                        font-size: 12px;
-                        background-color: #ffffff;
-                        color: #2c3e50;
-                    }
-                    QTextEdit:focus {
-                        border-color: #4a90e2;
-                    }
-                """)
+                self.smart_response_input.setObjectName("promptInput")
                 smart_response_layout.addWidget(self.smart_response_input)
                 
                 # Smart response loading spinner
@@ -626,87 +647,30 @@ class Dashboard(QMainWindow):
                 # Generate response button
                 self.generate_response_btn = QPushButton("Generate Response")
                 self.generate_response_btn.clicked.connect(self.generate_smart_response)
-                self.generate_response_btn.setStyleSheet("""
-                    QPushButton {
-                        background: #9b59b6;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        padding: 8px;
-                        font-size: 12px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background: #8e44ad;
-                    }
-                    QPushButton:disabled {
-                        background: #bdc3c7;
-                        color: #7f8c8d;
-                    }
-                """)
+                self.generate_response_btn.setObjectName("generateResponseBtn")
                 smart_response_layout.addWidget(self.generate_response_btn)
                 
                 # Generated response display
                 generated_response_label = QLabel("AI Response:")
-                generated_response_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 11px;
-                        color: #7f8c8d;
-                        background: transparent;
-                    }
-                """)
+                generated_response_label.setObjectName("fieldLabel")
                 smart_response_layout.addWidget(generated_response_label)
                 
                 self.generated_response_display = QTextEdit()
                 self.generated_response_display.setMaximumHeight(120)
                 self.generated_response_display.setReadOnly(True)
                 self.generated_response_display.setPlaceholderText("AI response will appear here...")
-                self.generated_response_display.setStyleSheet("""
-                    QTextEdit {
-                        border: 1px solid #d1d5db;
-                        border-radius: 4px;
-                        padding: 6px;
-                        font-size: 12px;
-                        background-color: #f8f9fa;
-                        color: #2c3e50;
-                    }
-                """)
+                self.generated_response_display.setObjectName("promptOutput")
                 smart_response_layout.addWidget(self.generated_response_display)
                 
                 # Copy generated response button
                 self.copy_response_btn = QPushButton("Copy Response")
                 self.copy_response_btn.clicked.connect(self.copy_generated_response)
-                self.copy_response_btn.setStyleSheet("""
-                    QPushButton {
-                        background: #27ae60;
-                        color: white;
-                        border: none;
-                        border-radius: 4px;
-                        padding: 6px;
-                        font-size: 11px;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background: #229954;
-                    }
-                    QPushButton:disabled {
-                        background: #bdc3c7;
-                        color: #7f8c8d;
-                    }
-                """)
+                self.copy_response_btn.setObjectName("copyResultBtn")
                 smart_response_layout.addWidget(self.copy_response_btn)
                 
                 # Status label for feedback
                 self.smart_response_status_label = QLabel("")
-                self.smart_response_status_label.setStyleSheet("""
-                    QLabel {
-                        color: #27ae60;
-                        font-size: 10px;
-                        font-style: italic;
-                        background: transparent;
-                        padding: 2px;
-                    }
-                """)
+                self.smart_response_status_label.setObjectName("statusLabel")
                 smart_response_layout.addWidget(self.smart_response_status_label)
                 
                 smart_response_frame.setLayout(smart_response_layout)
@@ -734,6 +698,28 @@ class Dashboard(QMainWindow):
         main_layout.addWidget(splitter)
         
         central_widget.setLayout(main_layout)
+        _apply_named_fonts(central_widget)
+    
+    def _primary_screen_geometry(self):
+        """
+        Get the primary screen's geometry without asking the platform every time.
+        
+        Returns:
+            QRect: Geometry of the primary screen
+        """
+        if self._screen_geometry is None:
+            screen = QApplication.primaryScreen()
+            if screen is not self._watched_screen:
+                screen.geometryChanged.connect(self._invalidate_screen_geometry)
+                self._watched_screen = screen
+            self._screen_geometry = screen.geometry()
+        return self._screen_geometry
+    
+    def _invalidate_screen_geometry(self, *args):
+        """
+        Drop the cached screen geometry (the screen setup changed).
+        """
+        self._screen_geometry = None
     
     def setup_window_properties(self):
         """
@@ -750,8 +736,7 @@ class Dashboard(QMainWindow):
         self.resize(config.DASHBOARD_WIDTH, config.DASHBOARD_HEIGHT)
         
         # Position window on the right side of the screen
-        screen = QApplication.primaryScreen()
-        screen_geometry = screen.geometry()
+        screen_geometry = self._primary_screen_geometry()
         
         x = screen_geometry.width() - self.width() - config.DASHBOARD_POSITION_X_OFFSET
         y = (screen_geometry.height() - self.height()) // 2
@@ -770,8 +755,9 @@ class Dashboard(QMainWindow):
         """
         Set the clipboard and database managers for the dashboard.
         
-        This method assigns the provided managers to the dashboard's attributes
-        and triggers a refresh of the notes display.
+        This method assigns the provided managers to the dashboard's attributes.
+        Nothing is loaded from them until the dashboard is shown, so a hidden
+        dashboard costs no database queries at startup.
         
         Args:
             clipboard_manager: The manager responsible for clipboard operations.
@@ -782,82 +768,151 @@ class Dashboard(QMainWindow):
         self.database_manager = database_manager
         self.openai_manager = openai_manager
         
-        # Load initial notes and clipboard history with a small delay to ensure UI is ready
-        QTimer.singleShot(100, self.refresh_notes)
-        QTimer.singleShot(100, self.refresh_clipboard_history)
+        # Clipboard history changes (from the monitor or our own captures)
+        # refresh the clipboard section
+        if clipboard_manager:
+            clipboard_manager.add_history_callback(self.schedule_clipboard_refresh)
+        
+        # Note writes from anywhere (dashboard, All Notes window, hotkeys)
+        # schedule a refresh of the notes list
+        if database_manager:
+            database_manager.add_notes_callback(self.schedule_notes_refresh)
+            # Kept across dashboard rebuilds (which call set_managers again)
+            if self.note_writer is None or self.note_writer.database_manager is not database_manager:
+                self.flush_note_writes()
+                self.note_writer = NoteWriter(database_manager, on_committed=self._notes_committed.emit)
+        
+        # Load notes and clipboard history on the first show: showEvent always
+        # refreshes the clipboard section and refreshes the notes when dirty.
+        # A visible dashboard (set_managers again after a rebuild) gets no
+        # showEvent, so it loads them now.
+        self._notes_dirty = True
+        if self.isVisible():
+            self.refresh_notes()
+            self.refresh_clipboard_history()
+    
+    def _on_clipboard_changed(self):
+        """
+        Handle a (debounced) system clipboard change.
+        
+        The new text is handed straight to the clipboard manager, so history
+        updates as soon as something is copied rather than on the manager's
+        next poll. If the history changed, the manager's history callback
+        schedules the refresh of the list.
+        """
+        if self.clipboard_manager:
+            self.clipboard_manager.capture(self.clipboard_bridge.text())
+    
+    def schedule_clipboard_refresh(self):
+        """
+        Refresh the clipboard section on the GUI thread.
+        
+        Registered as a clipboard manager history callback, which may be
+        called on the manager's monitoring thread; the queued signal hands
+        the refresh over to the GUI thread. A hidden dashboard skips the
+        refresh and catches up in showEvent.
+        """
+        self._clipboard_history_changed.emit()
     
+    @pyqtSlot()
     def refresh_clipboard_history(self):
         """
         Refresh the display of clipboard history items.
         
-        This method clears existing items and repopulates the clipboard history
-        display with the latest history from the clipboard manager.
+        This method updates the clipboard history display with the latest
+        history from the clipboard manager. The rows live in the list view's
+        model, so a refresh only swaps the model contents; the view lays out
+        and paints just the rows that are scrolled into view.
         """
         try:
             if not self.clipboard_manager:
                 return
             
-            # Check if UI elements still exist (they might be deleted during rebuild)
-            if not hasattr(self, 'clipboard_content_layout') or self.clipboard_content_layout is None:
+            # Nothing to repaint while hidden - showEvent catches up instead
+            if not self.isVisible():
                 return
             
-            # Additional safety check
-            try:
-                self.clipboard_content_layout.count()
-            except Exception as e:
+            # Check if UI elements still exist (they might be deleted during rebuild)
+            if self.clipboard_view is None:
                 return
-            
-            # Clear existing items
-            for i in reversed(range(self.clipboard_content_layout.count())):
-                child = self.clipboard_content_layout.itemAt(i).widget()
-                if child:
-                    child.setParent(None)
         except Exception as e:
             print(f"Error in refresh_clipboard_history: {e}")
             return
         
-        # Add current clipboard history
-        history = self.clipboard_manager.get_clipboard_history()
-        
-        if not history:
-            no_history_label = QLabel("No clipboard history yet")
-            no_history_label.setStyleSheet("""
-                QLabel {
-                    color: #7f8c8d; 
-                    font-style: italic; 
-                    font-size: 12px;
-                    padding: 12px;
-                    background: transparent;
-                }
-            """)
-            self.clipboard_content_layout.addWidget(no_history_label)
-        else:
-            for i, item in enumerate(history):
-                # Truncate long text for display based on config
-                max_len = config.CLIPBOARD_DISPLAY_MAX_LENGTH
-                display_text = item[:max_len] + "..." if len(item) > max_len else item
-                
-                clip_label = ClickableLabel(f"{i+1}. {display_text}")
-                # Fix: Use a default parameter to capture the current value of item
-                clip_label.clicked.connect(lambda checked, full_text=item: self.copy_to_clipboard(full_text))
-                self.clipboard_content_layout.addWidget(clip_label)
+        # Nothing to do if the history is what the section already shows
+        # (e.g. on show, or after two reports of the same copy)
+        view = self.clipboard_view
+        history = self.clipboard_manager.get_display_history(config.CLIPBOARD_DISPLAY_MAX_LENGTH)
+        shown = (view, tuple(history))
+        if shown == self._clip_shown:
+            return
+        self._clip_shown = shown
+        
+        # Show current clipboard history (display strings come truncated,
+        # once per item, from the manager)
+        self.clipboard_hint_label.setVisible(not history)
+        view.model().set_history(history)
+    
+    def _create_clipboard_list(self, clipboard_layout):
+        """
+        Create the virtualized clipboard history list and its hint label.
+        
+        Args:
+            clipboard_layout (QVBoxLayout): Layout of the clipboard section to add them to
+        """
+        self.clipboard_hint_label = QLabel("No clipboard history yet")
+        self.clipboard_hint_label.setObjectName("emptyHint")
+        self.clipboard_hint_label.hide()
+        
+        # Rows are styled by the dashboard sheet (QListView#clipboardList::item)
+        # and clicking one copies its full text
+        self.clipboard_view = QListView()
+        self.clipboard_view.setObjectName("clipboardList")
+        self.clipboard_view.setModel(ClipboardModel(self.clipboard_view))
+        self.clipboard_view.setWordWrap(True)
+        self.clipboard_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.clipboard_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.clipboard_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.clipboard_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.clipboard_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.clipboard_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.clipboard_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.clipboard_view.setMouseTracking(True)  # For the ::item:hover highlight
+        self.clipboard_view.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self.clipboard_view.clicked.connect(self._on_clipboard_item_clicked)
+        
+        clipboard_layout.addWidget(self.clipboard_hint_label)
+        clipboard_layout.addWidget(self.clipboard_view)
+    
+    @pyqtSlot(QModelIndex)
+    def _on_clipboard_item_clicked(self, index: QModelIndex):
+        """
+        Copy the full (untruncated) text of a clicked clipboard history row.
         
-        # Add stretch to push items to top
-        self.clipboard_content_layout.addStretch()
+        Args:
+            index (QModelIndex): The clicked row
+        """
+        self.copy_to_clipboard(index.data(ClipboardModel.FullTextRole))
     
+    @pyqtSlot(str)
     def copy_to_clipboard(self, text: str):
         """
         Copy text to the clipboard.
         
-        This method is called when a clickable label in the clipboard history
-        is clicked. It uses the clipboard manager to copy the specified text
-        to the system clipboard.
+        This method is called when a row of the clipboard history is
+        clicked, and by every GUI-thread copy of the dashboard. It writes
+        the Qt clipboard directly through the clipboard bridge (no round-trip
+        through the clipboard manager's backend), so our own copy is not
+        echoed back as a clipboard change.
         
         Args:
             text (str): The text content to copy.
         """
+        self.clipboard_bridge.set_text(text)
+        
+        # Keep the monitor's tracking in sync so the copy isn't re-added as new
         if self.clipboard_manager:
-            self.clipboard_manager.copy_to_clipboard(text)
+            self.clipboard_manager.current_clipboard = text
     
     def show_add_note_dialog(self):
         """
@@ -872,8 +927,9 @@ class Dashboard(QMainWindow):
         """
         Add a new note to the database.
         
-        This method adds a note to the database using the database manager and refreshes
-        the notes display.
+        This method queues the note with the note writer, so the caller never
+        waits on the database; the notes display refreshes through the
+        database's notes callbacks once the write is committed.
         
         Args:
             title (str, optional): The title of the note
@@ -881,128 +937,263 @@ class Dashboard(QMainWindow):
             priority (int): The priority level (1-3)
         """
         # Must have at least content to create a note
-        if content and self.database_manager:
-            note_id = self.database_manager.add_note(content, title if title else None, priority)
+        if content and self.note_writer:
+            self._pending_writes.append(None)
+            self.note_writer.add_note(content, title if title else None, priority)
+    
+    def flush_note_writes(self):
+        """
+        Apply the queued note writes and stop the note writer.
+        
+        Called on shutdown, before the database manager is closed. Waits for
+        the writer thread to commit what is still queued.
+        """
+        if self.note_writer:
+            self.note_writer.stop()
+            self.note_writer = None
+    
+    @pyqtSlot(int, bool, bool)
+    def _on_notes_committed(self, writes: int, changed: bool, complete: bool):
+        """
+        Publish note writes the note writer has committed.
+        
+        Runs on the GUI thread. The notes views refresh through the database's
+        notes callbacks; if the notes caches already mirror every committed
+        write (deletes are applied to them up front), they adopt the new notes
+        version instead of being reloaded by that refresh.
+        
+        If some of the writes never reached the database (the transaction
+        was rolled back, or a write failed), what the caches and the list
+        mirrored can't be trusted: the notes are reloaded from the database.
+        
+        Args:
+            writes (int): Number of queued writes the transaction covered
+            changed (bool): Whether any note actually changed
+            complete (bool): Whether every write reached the database
+        """
+        versions = [self._pending_writes.popleft() for _ in range(min(writes, len(self._pending_writes)))]
+        if not self.database_manager:
+            return
+        if not complete:
+            # Bumps the notes version past the caches and refreshes the list
+            self.database_manager.notify_notes_changed()
+            return
+        if not changed:
+            return
+        
+        version = self.database_manager.notes_version
+        mirrored = (self._notes_cache_version == version and
+                    all(v == version for v in versions))
+        self.database_manager.notify_notes_changed()
+        if mirrored and self.database_manager.notes_version == version + 1:
+            self._notes_cache_version = version + 1
+    
+    def _forget_note(self, note_id: int):
+        """
+        Drop a deleted note from the notes caches and the notes list.
+        
+        Only the affected row is removed from the view, so a delete neither
+        re-queries the database nor resets the list.
+        
+        Args:
+            note_id (int): The ID of the deleted note
+        """
+        if self._notes_cache is not None:
+            self._notes_cache = [note for note in self._notes_cache if note.id != note_id]
+            for key, notes in self._sorted_notes_cache.items():
+                self._sorted_notes_cache[key] = [note for note in notes if note.id != note_id]
+        if self.notes_view is not None:
+            self.notes_view.remove_note(note_id)
+    
+    def schedule_notes_refresh(self):
+        """
+        Refresh the notes list once control returns to the event loop.
+        
+        Registered as a database notes callback. Every note write in the
+        current event-loop turn shares the single pending refresh. While the
+        dashboard is hidden nothing is scheduled; the list is only marked
+        dirty and showEvent refreshes it.
+        """
+        if not self.isVisible():
+            self._notes_dirty = True
+            return
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_deferred_refresh)
+    
+    def _do_deferred_refresh(self):
+        """
+        Run the refresh scheduled by schedule_notes_refresh.
+        
+        Skipped if a direct refresh_notes call has already absorbed it.
+        """
+        if self._refresh_pending:
             self.refresh_notes()
     
-    def _filter_and_sort_notes(self, notes, search_input=None, sort_combo=None):
+    def _schedule_notes_search(self):
+        """
+        Restart the search debounce timer after a keystroke.
+        
+        Each keystroke pushes the refresh back, so typing a word results in a
+        single refresh 200 ms after the last key.
+        """
+        self._notes_search_timer.start()
+    
+    def _get_cached_notes(self):
         """
-        Filter and sort notes based on search and sort criteria.
+        Get all notes, querying the database only when they have changed.
+        
+        Every note write goes through the database manager and bumps its
+        notes_version, so comparing versions is enough to invalidate the
+        cache - including writes made from the All Notes window.
+        
+        Returns:
+            list: All NoteRec records, most recently updated first
+        """
+        version = self.database_manager.notes_version
+        if self._notes_cache is None or version != self._notes_cache_version:
+            self._notes_cache = self.database_manager.get_all_notes()
+            self._notes_cache_version = version
+            self._sorted_notes_cache.clear()
+        return self._notes_cache
+    
+    def _get_sorted_notes(self, search_term: str, sort_option: str):
+        """
+        Filter and sort the cached notes, memoizing the result.
+        
+        filter_and_sort_notes is pure, so a result can be reused for as long
+        as the notes version, search term and sort option are unchanged -
+        e.g. when refresh_notes runs after a write elsewhere or when the user
+        toggles back to a previous sort. The returned list must not be modified.
         
         Args:
-            notes: List of note dictionaries
-            search_input: The search input widget (optional)
-            sort_combo: The sort combo box widget (optional)
+            search_term (str): Lower-cased search term
+            sort_option (str): One of the NOTE_SORT_DISPATCH keys
             
         Returns:
-            List of filtered and sorted notes
-        """
-        # Filter by search term
-        search_term = ""
-        if search_input and hasattr(search_input, 'text'):
-            search_term = search_input.text().strip().lower()
-        
-        if search_term:
-            notes = [note for note in notes 
-                    if search_term in note['title'].lower() or 
-                       search_term in note['content'].lower()]
-        
-        # Sort based on selected criteria
-        sort_option = "Updated (newest)"  # Default
-        if sort_combo and hasattr(sort_combo, 'currentText'):
-            sort_option = sort_combo.currentText()
-        
-        if sort_option == "Updated (newest)":
-            notes.sort(key=lambda x: x['updated_at'], reverse=True)
-        elif sort_option == "Updated (oldest)":
-            notes.sort(key=lambda x: x['updated_at'], reverse=False)
-        elif sort_option == "Created (newest)":
-            notes.sort(key=lambda x: x['created_at'], reverse=True)
-        elif sort_option == "Created (oldest)":
-            notes.sort(key=lambda x: x['created_at'], reverse=False)
-        elif sort_option == "Priority (high)":
-            notes.sort(key=lambda x: x['priority'], reverse=True)
-        elif sort_option == "Priority (low)":
-            notes.sort(key=lambda x: x['priority'], reverse=False)
-        elif sort_option == "Title (A-Z)":
-            notes.sort(key=lambda x: x['title'].lower(), reverse=False)
-        elif sort_option == "Title (Z-A)":
-            notes.sort(key=lambda x: x['title'].lower(), reverse=True)
+            list: Matching notes in sorted order
+        """
+        all_notes = self._get_cached_notes()
+        key = (search_term, sort_option)
+        
+        notes = self._sorted_notes_cache.get(key)
+        if notes is not None:
+            self._sorted_notes_cache.move_to_end(key)
+            return notes
         
+        notes = filter_and_sort_notes(all_notes, search_term, sort_option)
+        self._sorted_notes_cache[key] = notes
+        if len(self._sorted_notes_cache) > self._sorted_notes_cache_size:
+            self._sorted_notes_cache.popitem(last=False)
         return notes
     
+    @pyqtSlot()
     def refresh_notes(self):
         """
         Refresh the display of notes in the dashboard.
         
-        This method clears existing notes and repopulates the notes list
-        with the latest notes from the database manager, applying search and sort filters.
+        This method brings the notes list up to date with the latest notes from
+        the database manager, applying search and sort filters. The list is a
+        virtualized view, so refreshing only resets its model; no widgets are
+        built per note.
+        
+        Any refresh still scheduled by schedule_notes_refresh is covered by
+        this one, so a burst of writes and direct calls rebuilds the list once.
         """
+        self._refresh_pending = False
         try:
             if not self.database_manager:
                 return
             
-            # Check if UI elements still exist (they might be deleted during rebuild)
-            if not hasattr(self, 'notes_content_layout') or self.notes_content_layout is None:
+            # Nothing to repaint while hidden - catch up in showEvent instead
+            if not self.isVisible():
+                self._notes_dirty = True
                 return
+            self._notes_dirty = False
             
-            # Additional safety check
-            try:
-                self.notes_content_layout.count()
-            except Exception as e:
+            # Check if UI elements still exist (they might be deleted during rebuild)
+            if self.notes_view is None:
                 return
-            
-            # Clear existing notes
-            for i in reversed(range(self.notes_content_layout.count())):
-                child = self.notes_content_layout.itemAt(i).widget()
-                if child:
-                    child.setParent(None)
         except Exception as e:
             print(f"Error in refresh_notes: {e}")
             return
         
-        # Get, filter, and sort notes
-        all_notes = self.database_manager.get_all_notes()
-        notes = self._filter_and_sort_notes(all_notes, self.search_input, self.sort_combo)
+        # Get (from the caches when unchanged), filter, and sort notes
+        search_term = self.search_input.text().strip().lower()
+        notes = self._get_sorted_notes(search_term, self.sort_combo.currentText())
         
-        if not notes:
-            # Check if we have notes but they're filtered out
-            if all_notes and hasattr(self, 'search_input') and self.search_input.text().strip():
-                no_notes_label = QLabel("No notes match your search criteria.")
+        # Hold repaints while the hint/view swap and the model reset happen,
+        # so the notes section is laid out and painted once
+        container = self.notes_view.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            if not notes:
+                # Check if we have notes but they're filtered out
+                if self._notes_cache and search_term:
+                    self.notes_hint_label.setText("No notes match your search criteria.")
+                else:
+                    self.notes_hint_label.setText("No notes yet. Add your first note above!")
+                self.notes_hint_label.show()
+                self.notes_view.hide()
             else:
-                no_notes_label = QLabel("No notes yet. Add your first note above!")
+                self.notes_hint_label.hide()
+                self.notes_view.show()
             
-            no_notes_label.setStyleSheet("""
-                QLabel {
-                    color: #7f8c8d; 
-                    font-style: italic; 
-                    font-size: 12px;
-                    padding: 12px;
-                    background: transparent;
-                }
-            """)
-            self.notes_content_layout.addWidget(no_notes_label)
-        else:
-            for note in notes:
-                note_widget = EditableNoteWidget(note, is_compact=True)  # Compact mode for dashboard
-                note_widget.note_updated.connect(self.update_note)
-                note_widget.note_deleted.connect(self.delete_note)
-                note_widget.note_copied.connect(self.copy_to_clipboard)
-                self.notes_content_layout.addWidget(note_widget)
+            # The view only paints the rows in its viewport, so the whole list
+            # is handed over regardless of its length
+            self.notes_view.set_notes(notes)
+        finally:
+            container.setUpdatesEnabled(True)
+    
+    def showEvent(self, event):
+        """
+        Catch up on refreshes skipped while hidden.
         
-        # Add stretch to push items to top
-        self.notes_content_layout.addStretch()
+        The clipboard history is refreshed on every show: refreshes reported
+        while hidden were skipped, and an unchanged history costs only a
+        comparison.
         
-        # Refresh notes window if it's open
-        if hasattr(self, 'notes_window') and self.notes_window and not self.notes_window.isHidden():
-            self.notes_window.refresh_all_notes()
+        Args:
+            event: The show event
+        """
+        super().showEvent(event)
+        self._build_pending_sections()
+        if self._notes_dirty:
+            self.refresh_notes()
+        self.refresh_clipboard_history()
     
+    def _create_notes_list(self, notes_layout):
+        """
+        Create the virtualized notes list and its hint label.
+        
+        Args:
+            notes_layout (QVBoxLayout): Layout of the notes section to add them to
+        """
+        self.notes_hint_label = QLabel()
+        self.notes_hint_label.setWordWrap(True)
+        self.notes_hint_label.setObjectName("emptyHint")
+        self.notes_hint_label.hide()
+        
+        # Cards are painted by the view's delegate (truncated, with a show
+        # all toggle); only a note being edited gets a real note widget. Its
+        # scrollbar is styled by the dashboard sheet, like the clipboard list's.
+        self.notes_view = NotesListView(compact=True, editor_class=EditableNoteWidget,
+                                        scrollbar_width=None)
+        self.notes_view.note_updated.connect(self.update_note)
+        self.notes_view.note_deleted.connect(self.delete_note)
+        self.notes_view.note_copied.connect(self.copy_to_clipboard)
+        
+        notes_layout.addWidget(self.notes_hint_label)
+        notes_layout.addWidget(self.notes_view)
+    
+    @pyqtSlot(int, str, str, int)
     def update_note(self, note_id: int, content: str, title: str, priority: int):
         """
         Update a note in the database.
         
         This method is called when a note widget emits a 'note_updated' signal.
-        It uses the database manager to update the note content, title, and priority in the database.
+        It queues the update of the note content, title, and priority with the note writer;
+        the notes display refreshes through the database's notes callbacks once it is committed.
         
         Args:
             note_id (int): The unique identifier of the note to update.
@@ -1010,83 +1201,199 @@ class Dashboard(QMainWindow):
             title (str): The new title for the note.
             priority (int): The new priority level for the note.
         """
-        if self.database_manager:
-            self.database_manager.update_note(note_id, content, title, priority)
+        if self.note_writer:
+            self._pending_writes.append(None)
+            self.note_writer.update_note(note_id, content, title, priority)
     
+    @pyqtSlot(int)
     def delete_note(self, note_id: int):
         """
         Delete a note from the database.
         
         This method is called when a note widget emits a 'note_deleted' signal.
-        It uses the database manager to delete the note from the database and
-        refreshes the notes display.
+        It queues the delete with the note writer and removes just that note
+        from the notes list and caches right away, so the refresh after the
+        delete is committed has nothing left to do.
         
         Args:
             note_id (int): The unique identifier of the note to delete.
         """
-        if self.database_manager:
-            self.database_manager.delete_note(note_id)
-            self.refresh_notes()
+        if self.note_writer:
+            mirrored = (self._notes_cache is not None and
+                        self._notes_cache_version == self.database_manager.notes_version)
+            self._pending_writes.append(self._notes_cache_version if mirrored else None)
+            self.note_writer.delete_note(note_id)
+            self._forget_note(note_id)
     
+    @pyqtSlot()
     def toggle_visibility(self):
         """
         Toggle the visibility of the dashboard.
         
-        This method handles the visibility hotkey trigger. It prints a message
-        to the console and toggles the visibility of the dashboard.
+        This method handles the visibility hotkey trigger. It toggles the
+        visibility of the dashboard, logging nothing unless DEBUG is enabled.
         """
-        print("Toggle visibility hotkey triggered!")
         if self.isVisible():
-            print("Dashboard is visible, hiding it")
+            log.debug("Toggle visibility hotkey: hiding dashboard")
             self.hide()
         else:
-            print("Dashboard is hidden, showing it")
-            self.show()
-            self.activateWindow()  # Bring to front
+            log.debug("Toggle visibility hotkey: showing dashboard")
+            self._bring_to_front(self)
+    
+    @staticmethod
+    def _bring_to_front(window: QWidget):
+        """
+        Show a window, restored if minimized, on top and active.
+        
+        Each window-manager request (state, show, raise, activate) is made
+        once, which matters where every one of them is a compositor round-trip.
+        
+        Args:
+            window (QWidget): The top-level window to bring to front
+        """
+        window.setWindowState((window.windowState() & ~Qt.WindowState.WindowMinimized)
+                              | Qt.WindowState.WindowActive)
+        window.show()
+        window.raise_()
+        window.activateWindow()
     
+    def _show_warning(self, title: str, text: str):
+        """
+        Show a modal warning, reusing one message box for all of them.
+        
+        Hotkey misuse (no selection, too short a selection, ...) can raise
+        the same warnings over and over; the box is built once and only its
+        title and text change.
+        
+        Args:
+            title (str): Window title of the warning
+            text (str): Warning message
+        """
+        if self._warning_box is None:
+            self._warning_box = QMessageBox(self)
+            self._warning_box.setIcon(QMessageBox.Icon.Warning)
+            self._warning_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        self._warning_box.setWindowTitle(title)
+        self._warning_box.setText(text)
+        self._warning_box.exec()
+    
+    @pyqtSlot()
     def add_note_from_clipboard(self):
         """
         Add a note from the currently selected text.
         
         This method is called when the user triggers the "Add note from clipboard"
-        hotkey. It saves the current clipboard content, simulates a Ctrl+C key
-        press to copy the selected text, and then attempts to add it as a new
-        note to the database. It also handles restoring the original clipboard
-        content if the text was successfully added.
+        hotkey. The capture (saving the clipboard, simulating Ctrl+C and waiting
+        for the copy) runs as a ClipboardCaptureTask in the thread pool so the
+        GUI stays responsive; the note is added and the original clipboard
+        content restored by _on_clipboard_captured once the task is done.
         """
-        print("Add note from selected text hotkey triggered!")
-        if self.clipboard_manager:
-            # Import keyboard module for simulating key presses
-            import keyboard
-            import time
-            
-            # Save current clipboard content
-            original_clipboard = self.clipboard_manager.get_current_clipboard()
-            print(f"Original clipboard saved: {original_clipboard[:30] if original_clipboard else 'None'}...")
-            
-            # Simulate Ctrl+C to copy selected text
-            keyboard.send('ctrl+c')
-            time.sleep(0.1)  # Small delay to ensure copy completes
-            
-            # Get the newly copied text (selected text)
-            selected_text = self.clipboard_manager.get_current_clipboard()
+        log.debug("Add note from selected text hotkey triggered!")
+        if not self.clipboard_manager:
+            return
+        self._start_clipboard_capture(self._on_clipboard_captured)
+    
+    def _start_clipboard_capture(self, on_captured: Callable[[str, str], None]) -> bool:
+        """
+        Copy the foreground application's selection in the thread pool.
+        
+        Starts a ClipboardCaptureTask; Ctrl+C and the wait for the copy run
+        off the GUI thread, and on_captured is called on the GUI thread with
+        (original clipboard, selected text) once the task is done. Only one
+        capture runs at a time, whichever hotkey started it.
+        
+        Args:
+            on_captured (Callable[[str, str], None]): Slot receiving the result
             
-            # Check if we actually got new text and it's different from original
-            if selected_text and selected_text != original_clipboard:
-                print(f"Adding note from selected text: {selected_text[:30]}...")
-                self.add_note(None, selected_text, 1)  # No title, priority 1 for clipboard notes
-                
-                # Restore original clipboard content
-                if original_clipboard:
-                    time.sleep(0.1)  # Small delay
-                    self.clipboard_manager.copy_to_clipboard(original_clipboard)
-                    print("Original clipboard content restored")
-            else:
-                print("No text selected or same as clipboard - no note added")
-                # If no text was selected, fall back to clipboard content
-                if original_clipboard:
-                    print(f"Falling back to clipboard content: {original_clipboard[:30]}...")
-                    self.add_note(None, original_clipboard, 1)  # No title, priority 1 for clipboard notes
+        Returns:
+            bool: False if a capture was already in progress (nothing started)
+        """
+        if self._capture_task is not None:
+            log.debug("Clipboard capture already in progress - ignoring hotkey")
+            return False
+        
+        task = ClipboardCaptureTask(self.clipboard_manager)
+        # Connected first, so the capture is over before on_captured runs
+        task.signals.captured.connect(self._end_clipboard_capture)
+        task.signals.captured.connect(on_captured)
+        QApplication.clipboard().dataChanged.connect(task.notify_copied)
+        self._capture_task = task
+        QThreadPool.globalInstance().start(task)
+        return True
+    
+    @pyqtSlot()
+    def _end_clipboard_capture(self):
+        """
+        Release the finished capture task (see _start_clipboard_capture).
+        """
+        if self._capture_task is not None:
+            QApplication.clipboard().dataChanged.disconnect(self._capture_task.notify_copied)
+            self._capture_task = None
+    
+    @pyqtSlot(str, str)
+    def _on_clipboard_captured(self, original_clipboard: str, selected_text: str):
+        """
+        Add the text captured by add_note_from_clipboard as a note.
+        
+        If a new selection was copied, the original clipboard content is put
+        back through copy_to_clipboard: the clipboard bridge ignores its own
+        write and the manager's tracking is synced, so the restore is not
+        recorded as a new (duplicate) history entry.
+        
+        Args:
+            original_clipboard (str): Clipboard content before the copy
+            selected_text (str): The copied selection (empty if none)
+        """
+        # Check if we actually got new text and it's different from original
+        if selected_text and selected_text != original_clipboard:
+            log.debug("Adding note from selected text: %.30s...", selected_text)
+            self.add_note(None, selected_text, 1)  # No title, priority 1 for clipboard notes
+            if original_clipboard:
+                self.copy_to_clipboard(original_clipboard)
+        else:
+            log.debug("No text selected or same as clipboard - no note added")
+            # If no text was selected, fall back to clipboard content
+            if original_clipboard:
+                log.debug("Falling back to clipboard content: %.30s...", original_clipboard)
+                self.add_note(None, original_clipboard, 1)  # No title, priority 1 for clipboard notes
+    
+    def _paste_text(self, text: str):
+        """
+        Put text on the clipboard and paste it into the focused application.
+        
+        The paste is a continuation instead of a wait: it is sent by
+        _paste_when_copied once QClipboard.dataChanged reports the clipboard
+        holds the text (other changes are ignored), or by the fallback timer if
+        no change is reported (e.g. the clipboard already held the text). The
+        caller returns right away, so no other slot runs in the middle of it.
+        A newer paste replaces one that is still waiting.
+        
+        Args:
+            text (str): The text to paste
+        """
+        self._pending_paste = text
+        self._paste_timer.start()
+        # May report the change (and paste) before returning on some platforms
+        self.copy_to_clipboard(text)
+    
+    @pyqtSlot()
+    def _paste_when_copied(self):
+        """
+        Send the pending paste once the clipboard holds its text.
+        """
+        if self._pending_paste is not None and self.clipboard_bridge.text() == self._pending_paste:
+            self._send_pending_paste()
+    
+    @pyqtSlot()
+    def _send_pending_paste(self):
+        """
+        Send Ctrl+V for the pending paste (once) and forget it.
+        """
+        if self._pending_paste is None:
+            return
+        self._pending_paste = None
+        self._paste_timer.stop()
+        send_paste()
     
     def open_all_notes(self):
         """
@@ -1094,10 +1401,9 @@ class Dashboard(QMainWindow):
         """
         # If window already exists and is visible, just bring it to front
         if self.notes_window and not self.notes_window.isHidden():
-            self.notes_window.raise_()
-            self.notes_window.activateWindow()
-            # Refresh notes when bringing to front
-            self.notes_window.refresh_all_notes()
+            self._bring_to_front(self.notes_window)
+            # Refresh the visible tab when bringing to front
+            self.notes_window.refresh_current_tab()
             return
         
         # Create new window or show existing one
@@ -1105,13 +1411,11 @@ class Dashboard(QMainWindow):
             self.notes_window = NotesWindow(self)
         
         self.notes_window.set_database_manager(self.database_manager)
-        if hasattr(self.notes_window, 'set_openai_manager') and self.openai_manager:
+        if self.openai_manager:
             self.notes_window.set_openai_manager(self.openai_manager)
-        if hasattr(self.notes_window, 'set_clipboard_manager') and self.clipboard_manager:
+        if self.clipboard_manager:
             self.notes_window.set_clipboard_manager(self.clipboard_manager)
-        self.notes_window.show()
-        self.notes_window.raise_()
-        self.notes_window.activateWindow()
+        self._bring_to_front(self.notes_window)
     
     def open_settings(self):
         """
@@ -1119,8 +1423,7 @@ class Dashboard(QMainWindow):
         """
         # If window already exists and is visible, just bring it to front
         if self.settings_window and not self.settings_window.isHidden():
-            self.settings_window.raise_()
-            self.settings_window.activateWindow()
+            self._bring_to_front(self.settings_window)
             return
         
         # Create new window or show existing one
@@ -1128,9 +1431,7 @@ class Dashboard(QMainWindow):
             self.settings_window = SettingsWindow(self)
             self.settings_window.settings_changed.connect(self.on_settings_changed)
         
-        self.settings_window.show()
-        self.settings_window.raise_()
-        self.settings_window.activateWindow()
+        self._bring_to_front(self.settings_window)
     
     def on_settings_changed(self, new_settings):
         """
@@ -1153,8 +1454,6 @@ class Dashboard(QMainWindow):
         Reload the config module to get updated settings.
         """
         try:
-            import importlib
-            import config
             importlib.reload(config)
             print("Config reloaded successfully")
         except Exception as e:
@@ -1168,7 +1467,6 @@ class Dashboard(QMainWindow):
             str: The visibility mode ('hidden' or 'popup')
         """
         try:
-            import config
             return getattr(config, 'SMART_RESPONSE_VISIBILITY', 'popup')
         except Exception as e:
             print(f"Error getting smart response visibility: {e}")
@@ -1186,33 +1484,36 @@ class Dashboard(QMainWindow):
         database_manager = self.database_manager
         openai_manager = self.openai_manager
         
-        # Stop refresh timer to prevent accessing deleted UI elements
-        if hasattr(self, 'refresh_timer'):
-            self.refresh_timer.stop()
-            self.refresh_timer.deleteLater()
-        
         # Clear current UI elements to prevent access after deletion
-        self.clipboard_content_layout = None
-        self.notes_content_layout = None
-        
-        # Clear current UI
-        central_widget = self.centralWidget()
-        if central_widget:
-            central_widget.deleteLater()
-        
-        # Rebuild UI with new settings
-        self.setup_ui_with_settings(settings)
-        
-        # Adjust dashboard width based on number of columns
-        self.adjust_dashboard_size(settings)
+        self.clipboard_view = None
+        self.clipboard_hint_label = None
+        self.notes_view = None
+        self.notes_hint_label = None
+        
+        # Hold repaints while the sections are torn down and added back one
+        # by one, so a visible dashboard is painted once with the new layout
+        self.setUpdatesEnabled(False)
+        try:
+            # Clear current UI
+            central_widget = self.centralWidget()
+            if central_widget:
+                central_widget.deleteLater()
+            
+            # Rebuild UI with new settings (frames of the old UI are gone)
+            self._pending_sections = []
+            self.setup_ui_with_settings(settings)
+            
+            # Adjust dashboard width based on number of columns
+            self.adjust_dashboard_size(settings)
+        finally:
+            self.setUpdatesEnabled(True)
         
         # Restore managers
         self.set_managers(clipboard_manager, database_manager, openai_manager)
         
-        # Create new refresh timer
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_clipboard_history)
-        self.refresh_timer.start(config.REFRESH_INTERVAL)
+        # A visible dashboard gets no showEvent, so build the AI sections now
+        if self.isVisible():
+            self._build_pending_sections()
         
         print("Dashboard rebuilt with new settings")
     
@@ -1227,12 +1528,8 @@ class Dashboard(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
-        # Set main window background
-        self.setStyleSheet("""
-            QMainWindow {
-                background: #f8f9fa;
-            }
-        """)
+        # Styles for the whole dashboard, matched by widget object name
+        self.setStyleSheet(_DASHBOARD_QSS)
         
         # Main layout - reduced margins
         main_layout = QVBoxLayout()
@@ -1247,20 +1544,7 @@ class Dashboard(QMainWindow):
         self.settings_btn.setMaximumWidth(30)
         self.settings_btn.setMaximumHeight(24)
         self.settings_btn.clicked.connect(self.open_settings)
-        self.settings_btn.setStyleSheet("""
-            QPushButton {
-                background: #95a5a6;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #7f8c8d;
-            }
-        """)
+        self.settings_btn.setObjectName("settingsBtn")
         
         header_layout.addWidget(self.settings_btn)
         header_layout.addStretch()
@@ -1280,6 +1564,7 @@ class Dashboard(QMainWindow):
             self.create_three_column_layout(main_layout, settings)
         
         central_widget.setLayout(main_layout)
+        _apply_named_fonts(central_widget)
     
     def create_single_column_layout(self, main_layout, settings):
         """
@@ -1291,20 +1576,11 @@ class Dashboard(QMainWindow):
         """
         # Create splitter for resizable sections
         splitter = QSplitter(Qt.Orientation.Vertical)
-        splitter.setStyleSheet("""
-            QSplitter::handle {
-                background-color: #bdc3c7;
-                border-radius: 1px;
-                margin: 1px;
-            }
-            QSplitter::handle:hover {
-                background-color: #95a5a6;
-            }
-        """)
+        splitter.setObjectName("sectionSplitter")
         
         # Add enabled features to splitter
         enabled_features = [f for f in settings['features'] if f['enabled']]
-        enabled_features.sort(key=lambda x: x['order'])
+        enabled_features.sort(key=itemgetter('order'))
         
         for feature in enabled_features:
             frame = self.create_feature_frame(feature)
@@ -1335,20 +1611,11 @@ class Dashboard(QMainWindow):
         right_splitter = QSplitter(Qt.Orientation.Vertical)
         
         for splitter in [left_splitter, right_splitter]:
-            splitter.setStyleSheet("""
-                QSplitter::handle {
-                    background-color: #bdc3c7;
-                    border-radius: 1px;
-                    margin: 1px;
-                }
-                QSplitter::handle:hover {
-                    background-color: #95a5a6;
-                }
-            """)
+            splitter.setObjectName("sectionSplitter")
         
         # Add enabled features to splitters
         enabled_features = [f for f in settings['features'] if f['enabled']]
-        enabled_features.sort(key=lambda x: x['order'])
+        enabled_features.sort(key=itemgetter('order'))
         
         max_features_per_column = settings['max_features_per_column']
         
@@ -1392,20 +1659,11 @@ class Dashboard(QMainWindow):
         right_splitter = QSplitter(Qt.Orientation.Vertical)
         
         for splitter in [left_splitter, middle_splitter, right_splitter]:
-            splitter.setStyleSheet("""
-                QSplitter::handle {
-                    background-color: #bdc3c7;
-                    border-radius: 1px;
-                    margin: 1px;
-                }
-                QSplitter::handle:hover {
-                    background-color: #95a5a6;
-                }
-            """)
+            splitter.setObjectName("sectionSplitter")
         
         # Add enabled features to splitters
         enabled_features = [f for f in settings['features'] if f['enabled']]
-        enabled_features.sort(key=lambda x: x['order'])
+        enabled_features.sort(key=itemgetter('order'))
         
         max_features_per_column = settings['max_features_per_column']
         
@@ -1468,62 +1726,16 @@ class Dashboard(QMainWindow):
         """
         clipboard_frame = QFrame()
         clipboard_frame.setFrameStyle(QFrame.Shape.Box)
-        clipboard_frame.setStyleSheet("""
-            QFrame {
-                border: 1px solid #d1d5db;
-                border-radius: 6px;
-                background: #ffffff;
-                padding: 4px;
-            }
-        """)
+        clipboard_frame.setObjectName("sectionFrame")
         clipboard_layout = QVBoxLayout()
         clipboard_layout.setSpacing(6)
         clipboard_layout.setContentsMargins(6, 6, 6, 6)
         
         clipboard_title = QLabel("📋 Clipboard History")
-        clipboard_title.setStyleSheet("""
-            QLabel {
-                font-weight: bold; 
-                font-size: 13px;
-                color: #2c3e50;
-                margin-bottom: 2px;
-                background: transparent;
-            }
-        """)
+        clipboard_title.setObjectName("sectionTitle")
         clipboard_layout.addWidget(clipboard_title)
         
-        self.clipboard_scroll = QScrollArea()
-        self.clipboard_scroll.setWidgetResizable(True)
-        self.clipboard_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.clipboard_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.clipboard_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #f1f3f4;
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #bdc3c7;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #95a5a6;
-            }
-        """)
-        
-        self.clipboard_content = QWidget()
-        self.clipboard_content_layout = QVBoxLayout()
-        self.clipboard_content_layout.setSpacing(2)
-        self.clipboard_content_layout.setContentsMargins(2, 2, 2, 2)
-        self.clipboard_content.setLayout(self.clipboard_content_layout)
-        self.clipboard_scroll.setWidget(self.clipboard_content)
-        
-        clipboard_layout.addWidget(self.clipboard_scroll)
+        self._create_clipboard_list(clipboard_layout)
         clipboard_frame.setLayout(clipboard_layout)
         
         return clipboard_frame
@@ -1538,14 +1750,7 @@ class Dashboard(QMainWindow):
 
         notes_frame = QFrame()
         notes_frame.setFrameStyle(QFrame.Shape.Box)
-        notes_frame.setStyleSheet("""
-            QFrame {
-                border: 1px solid #d1d5db;
-                border-radius: 6px;
-                background: #ffffff;
-                padding: 4px;
-            }
-        """)
+        notes_frame.setObjectName("sectionFrame")
         notes_layout = QVBoxLayout()
         notes_layout.setSpacing(6)
         notes_layout.setContentsMargins(6, 6, 6, 6)
@@ -1555,55 +1760,21 @@ class Dashboard(QMainWindow):
         notes_header_layout.setSpacing(10)
         
         notes_title = QLabel("📝 Notes")
-        notes_title.setStyleSheet("""
-            QLabel {
-                font-weight: bold; 
-                font-size: 13px;
-                color: #2c3e50;
-                margin-bottom: 2px;
-                background: transparent;
-            }
-        """)
+        notes_title.setObjectName("sectionTitle")
         
         # Add Note button
         self.add_note_btn = QPushButton("Add")
         self.add_note_btn.setMaximumWidth(50)
         self.add_note_btn.setMaximumHeight(24)
         self.add_note_btn.clicked.connect(self.show_add_note_dialog)
-        self.add_note_btn.setStyleSheet("""
-            QPushButton {
-                background: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #229954;
-            }
-        """)
+        self.add_note_btn.setObjectName("addNoteBtn")
         
         # Open Notes button
         self.open_notes_btn = QPushButton("Open")
         self.open_notes_btn.setMaximumWidth(60)
         self.open_notes_btn.setMaximumHeight(24)
         self.open_notes_btn.clicked.connect(self.open_all_notes)
-        self.open_notes_btn.setStyleSheet("""
-            QPushButton {
-                background: #3498db;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #2980b9;
-            }
-        """)
+        self.open_notes_btn.setObjectName("openNotesBtn")
         
         notes_header_layout.addWidget(notes_title)
         notes_header_layout.addStretch()
@@ -1619,95 +1790,23 @@ class Dashboard(QMainWindow):
         # Search bar
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search notes...")
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 12px;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QLineEdit:focus {
-                border-color: #4a90e2;
-            }
-        """)
-        self.search_input.textChanged.connect(self.refresh_notes)
+        self.search_input.setObjectName("notesSearch")
+        self.search_input.textChanged.connect(self._schedule_notes_search)
         
         # Sort dropdown
         self.sort_combo = QComboBox()
-        self.sort_combo.addItems([
-            "Updated (newest)",
-            "Updated (oldest)", 
-            "Created (newest)",
-            "Created (oldest)",
-            "Priority (high)",
-            "Priority (low)",
-            "Title (A-Z)",
-            "Title (Z-A)"
-        ])
+        self.sort_combo.setModel(note_sort_model())
         self.sort_combo.setCurrentIndex(0)
         self.sort_combo.setMaximumWidth(120)
-        self.sort_combo.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 12px;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QComboBox:focus {
-                border-color: #4a90e2;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-            }
-        """)
+        self.sort_combo.setObjectName("notesSort")
         self.sort_combo.currentTextChanged.connect(self.refresh_notes)
         
-        search_sort_layout.addWidget(self.search_input)
-        search_sort_layout.addWidget(self.sort_combo)
-        notes_layout.addLayout(search_sort_layout)
-        
-        # Notes scroll area
-        self.notes_scroll = QScrollArea()
-        self.notes_scroll.setWidgetResizable(True)
-        self.notes_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.notes_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.notes_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #f1f3f4;
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #bdc3c7;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #95a5a6;
-            }
-        """)
-        
-        self.notes_content = QWidget()
-        self.notes_content_layout = QVBoxLayout()
-        self.notes_content_layout.setSpacing(2)
-        self.notes_content_layout.setContentsMargins(2, 2, 2, 2)
-
-        self.notes_content.setLayout(self.notes_content_layout)
-        self.notes_scroll.setWidget(self.notes_content)
+        search_sort_layout.addWidget(self.search_input)
+        search_sort_layout.addWidget(self.sort_combo)
+        notes_layout.addLayout(search_sort_layout)
         
-        notes_layout.addWidget(self.notes_scroll)
+        # Notes list
+        self._create_notes_list(notes_layout)
         notes_frame.setLayout(notes_layout)
         
 
@@ -1720,20 +1819,25 @@ class Dashboard(QMainWindow):
         Returns:
             QFrame: The prompt frame or None if OpenAI is not enabled
         """
-        import config
         if not config.OPENAI_ENABLED:
             return None
         
         prompt_frame = QFrame()
         prompt_frame.setFrameStyle(QFrame.Shape.Box)
-        prompt_frame.setStyleSheet("""
-            QFrame {
-                border: 1px solid #d1d5db;
-                border-radius: 6px;
-                background: #ffffff;
-                padding: 4px;
-            }
-        """)
+        prompt_frame.setObjectName("sectionFrame")
+        
+        # The section's widgets are only built once they are needed
+        self._pending_sections.append((prompt_frame, self._build_prompt_section))
+        
+        return prompt_frame
+    
+    def _build_prompt_section(self, prompt_frame):
+        """
+        Build the prompt enhancement widgets into their (empty) section frame.
+        
+        Args:
+            prompt_frame (QFrame): The frame created by create_prompt_frame
+        """
         prompt_layout = QVBoxLayout()
         prompt_layout.setSpacing(6)
         prompt_layout.setContentsMargins(6, 6, 6, 6)
@@ -1743,15 +1847,7 @@ class Dashboard(QMainWindow):
         prompt_header_layout.setSpacing(10)
         
         prompt_title = QLabel("🤖 AI Prompt Enhancement")
-        prompt_title.setStyleSheet("""
-            QLabel {
-                font-weight: bold; 
-                font-size: 13px;
-                color: #2c3e50;
-                margin-bottom: 2px;
-                background: transparent;
-            }
-        """)
+        prompt_title.setObjectName("sectionTitle")
         
         prompt_header_layout.addWidget(prompt_title)
         prompt_header_layout.addStretch()
@@ -1760,31 +1856,13 @@ class Dashboard(QMainWindow):
         
         # Prompt input area
         prompt_input_label = QLabel("Paste your prompt here:")
-        prompt_input_label.setStyleSheet("""
-            QLabel {
-                font-size: 11px;
-                color: #7f8c8d;
-                background: transparent;
-            }
-        """)
+        prompt_input_label.setObjectName("fieldLabel")
         prompt_layout.addWidget(prompt_input_label)
         
         self.prompt_input = QTextEdit()
         self.prompt_input.setMaximumHeight(80)
         self.prompt_input.setPlaceholderText("Paste your prompt here and click 'Enhance' to get an improved version...")
-        self.prompt_input.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 12px;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QTextEdit:focus {
-                border-color: #4a90e2;
-            }
-        """)
+        self.prompt_input.setObjectName("promptInput")
         prompt_layout.addWidget(self.prompt_input)
         
         # Loading spinner
@@ -1794,92 +1872,33 @@ class Dashboard(QMainWindow):
         # Enhance button
         self.enhance_btn = QPushButton("Enhance Prompt")
         self.enhance_btn.clicked.connect(self.enhance_prompt)
-        self.enhance_btn.setStyleSheet("""
-            QPushButton {
-                background: #e67e22;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #d35400;
-            }
-            QPushButton:disabled {
-                background: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """)
+        self.enhance_btn.setObjectName("enhanceBtn")
         prompt_layout.addWidget(self.enhance_btn)
         
         # Enhanced prompt display
         enhanced_label = QLabel("Enhanced prompt:")
-        enhanced_label.setStyleSheet("""
-            QLabel {
-                font-size: 11px;
-                color: #7f8c8d;
-                background: transparent;
-            }
-        """)
+        enhanced_label.setObjectName("fieldLabel")
         prompt_layout.addWidget(enhanced_label)
         
         self.enhanced_prompt_display = QTextEdit()
         self.enhanced_prompt_display.setMaximumHeight(120)
         self.enhanced_prompt_display.setReadOnly(True)
         self.enhanced_prompt_display.setPlaceholderText("Enhanced prompt will appear here...")
-        self.enhanced_prompt_display.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 12px;
-                background-color: #f8f9fa;
-                color: #2c3e50;
-            }
-        """)
+        self.enhanced_prompt_display.setObjectName("promptOutput")
         prompt_layout.addWidget(self.enhanced_prompt_display)
         
         # Copy enhanced prompt button
         self.copy_enhanced_btn = QPushButton("Copy Enhanced")
         self.copy_enhanced_btn.clicked.connect(self.copy_enhanced_prompt)
-        self.copy_enhanced_btn.setStyleSheet("""
-            QPushButton {
-                background: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #229954;
-            }
-            QPushButton:disabled {
-                background: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """)
+        self.copy_enhanced_btn.setObjectName("copyResultBtn")
         prompt_layout.addWidget(self.copy_enhanced_btn)
         
         # Status label for feedback
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #27ae60;
-                font-size: 10px;
-                font-style: italic;
-                background: transparent;
-                padding: 2px;
-            }
-        """)
+        self.status_label.setObjectName("statusLabel")
         prompt_layout.addWidget(self.status_label)
         
         prompt_frame.setLayout(prompt_layout)
-        
-        return prompt_frame
     
     def create_smart_response_frame(self):
         """
@@ -1888,20 +1907,25 @@ class Dashboard(QMainWindow):
         Returns:
             QFrame: The smart response frame or None if OpenAI is not enabled
         """
-        import config
         if not config.OPENAI_ENABLED or not config.SMART_RESPONSE_ENABLED:
             return None
         
         smart_response_frame = QFrame()
         smart_response_frame.setFrameStyle(QFrame.Shape.Box)
-        smart_response_frame.setStyleSheet("""
-            QFrame {
-                border: 1px solid #d1d5db;
-                border-radius: 6px;
-                background: #ffffff;
-                padding: 4px;
-            }
-        """)
+        smart_response_frame.setObjectName("sectionFrame")
+        
+        # The section's widgets are only built once they are needed
+        self._pending_sections.append((smart_response_frame, self._build_smart_response_section))
+        
+        return smart_response_frame
+    
+    def _build_smart_response_section(self, smart_response_frame):
+        """
+        Build the smart response widgets into their (empty) section frame.
+        
+        Args:
+            smart_response_frame (QFrame): The frame created by create_smart_response_frame
+        """
         smart_response_layout = QVBoxLayout()
         smart_response_layout.setSpacing(6)
         smart_response_layout.setContentsMargins(6, 6, 6, 6)
@@ -1911,15 +1935,7 @@ class Dashboard(QMainWindow):
         smart_response_header_layout.setSpacing(10)
         
         smart_response_title = QLabel("🧠 AI Smart Response")
-        smart_response_title.setStyleSheet("""
-            QLabel {
-                font-weight: bold; 
-                font-size: 13px;
-                color: #2c3e50;
-                margin-bottom: 2px;
-                background: transparent;
-            }
-        """)
+        smart_response_title.setObjectName("sectionTitle")
         
         smart_response_header_layout.addWidget(smart_response_title)
         smart_response_header_layout.addStretch()
@@ -1928,31 +1944,13 @@ class Dashboard(QMainWindow):
         
         # Smart response input area
         smart_response_input_label = QLabel("Enter your question, code, or prompt:")
-        smart_response_input_label.setStyleSheet("""
-            QLabel {
-                font-size: 11px;
-                color: #7f8c8d;
-                background: transparent;
-            }
-        """)
+        smart_response_input_label.setObjectName("fieldLabel")
         smart_response_layout.addWidget(smart_response_input_label)
         
         self.smart_response_input = QTextEdit()
         self.smart_response_input.setMaximumHeight(80)
         self.smart_response_input.setPlaceholderText("Ask a question, paste code for review, or enter any prompt for AI response...")
-        self.smart_response_input.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 12px;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QTextEdit:focus {
-                border-color: #4a90e2;
-            }
-        """)
+        self.smart_response_input.setObjectName("promptInput")
         smart_response_layout.addWidget(self.smart_response_input)
         
         # Smart response loading spinner
@@ -1962,92 +1960,46 @@ class Dashboard(QMainWindow):
         # Generate response button
         self.generate_response_btn = QPushButton("Generate Response")
         self.generate_response_btn.clicked.connect(self.generate_smart_response)
-        self.generate_response_btn.setStyleSheet("""
-            QPushButton {
-                background: #9b59b6;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #8e44ad;
-            }
-            QPushButton:disabled {
-                background: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """)
+        self.generate_response_btn.setObjectName("generateResponseBtn")
         smart_response_layout.addWidget(self.generate_response_btn)
         
         # Generated response display
         generated_response_label = QLabel("AI Response:")
-        generated_response_label.setStyleSheet("""
-            QLabel {
-                font-size: 11px;
-                color: #7f8c8d;
-                background: transparent;
-            }
-        """)
+        generated_response_label.setObjectName("fieldLabel")
         smart_response_layout.addWidget(generated_response_label)
         
         self.generated_response_display = QTextEdit()
         self.generated_response_display.setMaximumHeight(120)
         self.generated_response_display.setReadOnly(True)
         self.generated_response_display.setPlaceholderText("AI response will appear here...")
-        self.generated_response_display.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #d1d5db;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 12px;
-                background-color: #f8f9fa;
-                color: #2c3e50;
-            }
-        """)
+        self.generated_response_display.setObjectName("promptOutput")
         smart_response_layout.addWidget(self.generated_response_display)
         
         # Copy generated response button
         self.copy_response_btn = QPushButton("Copy Response")
         self.copy_response_btn.clicked.connect(self.copy_generated_response)
-        self.copy_response_btn.setStyleSheet("""
-            QPushButton {
-                background: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 11px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #229954;
-            }
-            QPushButton:disabled {
-                background: #bdc3c7;
-                color: #7f8c8d;
-            }
-        """)
+        self.copy_response_btn.setObjectName("copyResultBtn")
         smart_response_layout.addWidget(self.copy_response_btn)
         
         # Status label for feedback
         self.smart_response_status_label = QLabel("")
-        self.smart_response_status_label.setStyleSheet("""
-            QLabel {
-                color: #27ae60;
-                font-size: 10px;
-                font-style: italic;
-                background: transparent;
-                padding: 2px;
-            }
-        """)
+        self.smart_response_status_label.setObjectName("statusLabel")
         smart_response_layout.addWidget(self.smart_response_status_label)
         
         smart_response_frame.setLayout(smart_response_layout)
+    
+    def _build_pending_sections(self):
+        """
+        Build the widgets of AI sections whose frames are still empty.
         
-        return smart_response_frame
+        The prompt enhancement and smart response sections are only placeholder
+        frames until the dashboard is first shown or one of their hotkeys is
+        used, so users who never touch them don't pay for their widgets.
+        """
+        pending, self._pending_sections = self._pending_sections, []
+        for frame, build in pending:
+            build(frame)
+            _apply_named_fonts(frame)
     
     def adjust_dashboard_size(self, settings):
         """
@@ -2056,8 +2008,6 @@ class Dashboard(QMainWindow):
         Args:
             settings (dict): The settings configuration
         """
-        import config
-        
         # Base width for single column
         base_width = config.DASHBOARD_WIDTH
         
@@ -2076,8 +2026,7 @@ class Dashboard(QMainWindow):
         self.resize(new_width, config.DASHBOARD_HEIGHT)
         
         # Reposition window to stay on the right side
-        screen = QApplication.primaryScreen()
-        screen_geometry = screen.geometry()
+        screen_geometry = self._primary_screen_geometry()
         
         x = screen_geometry.width() - new_width - config.DASHBOARD_POSITION_X_OFFSET
         y = (screen_geometry.height() - self.height()) // 2
@@ -2090,7 +2039,6 @@ class Dashboard(QMainWindow):
         Load settings and apply them to the dashboard.
         """
         try:
-            from .settings import SettingsWindow
             # Create a temporary settings window to load settings
             temp_settings = SettingsWindow()
             settings = temp_settings.get_settings()
@@ -2149,16 +2097,16 @@ class Dashboard(QMainWindow):
         Enhance the prompt in the input field using OpenAI API.
         """
         if not self.openai_manager:
-            QMessageBox.warning(self, "OpenAI Not Available", 
-                              "OpenAI features are not enabled or configured.")
+            self._show_warning("OpenAI Not Available", 
+                               "OpenAI features are not enabled or configured.")
             return
         
         # Get the prompt from input
         original_prompt = self.prompt_input.toPlainText().strip()
         
         if not original_prompt:
-            QMessageBox.warning(self, "No Prompt", 
-                              "Please enter a prompt to enhance.")
+            self._show_warning("No Prompt", 
+                               "Please enter a prompt to enhance.")
             return
         
         # Show loading spinner and disable button
@@ -2166,14 +2114,28 @@ class Dashboard(QMainWindow):
         self.enhance_btn.setEnabled(False)
         self.enhance_btn.setText("Enhancing...")
         self.copy_enhanced_btn.setEnabled(False)
+        self.enhanced_prompt_display.clear()
         
-        # Create and start worker thread
-        self.openai_worker = OpenAIWorker(self.openai_manager, original_prompt)
+        # Create and start worker thread; the response is streamed into the
+        # display as it arrives
+        self.openai_worker = OpenAIWorker(self.openai_manager, original_prompt, stream=True)
+        self.openai_worker.chunk_received.connect(self._append_enhanced_chunk)
         self.openai_worker.enhancement_complete.connect(self.on_enhancement_complete)
         self.openai_worker.enhancement_failed.connect(self.on_enhancement_failed)
         self.openai_worker.finished.connect(self.on_worker_finished)
         self.openai_worker.start()
     
+    def _append_enhanced_chunk(self, chunk: str):
+        """
+        Append a streamed piece of the enhanced prompt to its display.
+        
+        Args:
+            chunk (str): The next piece of the response
+        """
+        cursor = self.enhanced_prompt_display.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk)
+    
     def on_enhancement_complete(self, enhanced_prompt):
         """
         Handle successful prompt enhancement.
@@ -2185,30 +2147,22 @@ class Dashboard(QMainWindow):
         self.enhanced_prompt_display.setPlainText(enhanced_prompt)
         self.copy_enhanced_btn.setEnabled(True)
         
-        # Automatically copy the enhanced prompt to clipboard
-        if self.clipboard_manager:
-            self.clipboard_manager.copy_to_clipboard(enhanced_prompt)
-            print(f"Enhanced prompt automatically copied to clipboard: {enhanced_prompt[:50]}...")
-        
         # Replace the original prompt with the enhanced version
         self.prompt_input.setPlainText(enhanced_prompt)
         
-        # Automatically paste the enhanced text to replace selected text
-        import keyboard
-        import time
-        time.sleep(0.1)  # Small delay to ensure clipboard is ready
-        keyboard.send('ctrl+v')
-        print("Enhanced prompt automatically pasted to replace selected text")
+        # Automatically copy the enhanced prompt to the clipboard and paste it
+        # to replace the selected text once it is there
+        self._paste_text(enhanced_prompt)
+        log.debug("Enhanced prompt copied to clipboard for pasting: %.50s...", enhanced_prompt)
         
         # Show success status message
         self.status_label.setText("✓ Enhanced prompt pasted and input updated")
         
         # Clear status message after 3 seconds
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(3000, lambda: self.status_label.setText(""))
         
-        print(f"Enhancement completed successfully: {enhanced_prompt[:50]}...")
-        print("Original prompt replaced with enhanced version")
+        log.debug("Enhancement completed successfully: %.50s...", enhanced_prompt)
+        log.debug("Original prompt replaced with enhanced version")
     
     def on_enhancement_failed(self, error_message):
         """
@@ -2217,9 +2171,9 @@ class Dashboard(QMainWindow):
         Args:
             error_message (str): The error message
         """
-        QMessageBox.warning(self, "Enhancement Failed", 
-                          f"Failed to enhance prompt: {error_message}")
-        print(f"Enhancement failed: {error_message}")
+        self._show_warning("Enhancement Failed", 
+                           f"Failed to enhance prompt: {error_message}")
+        log.warning("Enhancement failed: %s", error_message)
     
     def on_worker_finished(self):
         """
@@ -2228,7 +2182,7 @@ class Dashboard(QMainWindow):
         self.loading_spinner.stop_animation()
         self.enhance_btn.setEnabled(True)
         self.enhance_btn.setText("Enhance Prompt")
-        print("OpenAI worker finished")
+        log.debug("OpenAI worker finished")
     
     def copy_enhanced_prompt(self):
         """
@@ -2236,94 +2190,154 @@ class Dashboard(QMainWindow):
         """
         enhanced_text = self.enhanced_prompt_display.toPlainText()
         if enhanced_text and self.clipboard_manager:
-            self.clipboard_manager.copy_to_clipboard(enhanced_text)
-            print("Enhanced prompt copied to clipboard")
+            self.copy_to_clipboard(enhanced_text)
+            log.debug("Enhanced prompt copied to clipboard")
             
             # Show feedback for manual copy
             self.status_label.setText("✓ Enhanced prompt copied to clipboard")
-            from PyQt6.QtCore import QTimer
             QTimer.singleShot(2000, lambda: self.status_label.setText(""))
     
+    @pyqtSlot()
     def enhance_prompt_from_clipboard(self):
         """
         Enhance a prompt from the currently selected text.
         
         This method is called when the user triggers the "Enhance prompt from clipboard"
-        hotkey. It saves the current clipboard content, simulates a Ctrl+C key
-        press to copy the selected text, and then attempts to enhance it using OpenAI.
+        hotkey. The selected text is copied (saving the clipboard and simulating
+        Ctrl+C) by a ClipboardCaptureTask in the thread pool, so the GUI thread
+        never waits for the copy; _on_enhance_text_captured then validates it
+        and starts the enhancement using OpenAI.
+        
+        Presses while an earlier one is still being handled (from the copy
+        until its OpenAI request finishes) are ignored, so mashing the hotkey
+        doesn't race extra Ctrl+C presses or send duplicate requests.
+        """
+        log.debug("Enhance prompt from selected text hotkey triggered!")
+        if self._clipboard_hotkey_busy:
+            log.debug("Clipboard hotkey already in progress - ignoring")
+            return
+        if not self._ai_hotkey_ready():
+            return
+        if self._start_clipboard_capture(self._on_enhance_text_captured):
+            self._clipboard_hotkey_busy = True
+    
+    def _ai_hotkey_ready(self) -> bool:
         """
-        print("Enhance prompt from selected text hotkey triggered!")
+        Check that the managers an AI hotkey needs are available, warning if not.
         
+        Returns:
+            bool: True if OpenAI and the clipboard manager are both available
+        """
         if not self.openai_manager:
-            QMessageBox.warning(self, "OpenAI Not Available", 
-                              "OpenAI features are not enabled or configured.")
-            return
+            self._show_warning("OpenAI Not Available", 
+                               "OpenAI features are not enabled or configured.")
+            return False
         
         if not self.clipboard_manager:
-            QMessageBox.warning(self, "Clipboard Not Available", 
-                              "Clipboard manager not available.")
-            return
-        
-        # Import keyboard module for simulating key presses
-        import keyboard
-        import time
-        
-        # Save current clipboard content
-        original_clipboard = self.clipboard_manager.get_current_clipboard()
-        print(f"Original clipboard saved: {original_clipboard[:30] if original_clipboard else 'None'}...")
+            self._show_warning("Clipboard Not Available", 
+                               "Clipboard manager not available.")
+            return False
+        return True
+    
+    @pyqtSlot(str, str)
+    def _on_enhance_text_captured(self, original_clipboard: str, selected_text: str):
+        """
+        Enhance the text captured for the enhance-prompt hotkey.
         
-        # Simulate Ctrl+C to copy selected text
-        keyboard.send('ctrl+c')
-        time.sleep(0.2)  # Longer delay to ensure copy completes
+        Args:
+            original_clipboard (str): Clipboard content before the copy
+            selected_text (str): The copied selection (empty if none)
+        """
+        started = False
+        try:
+            started = self._enhance_selected_text(original_clipboard, selected_text)
+        finally:
+            if not started:
+                self._clipboard_hotkey_busy = False
+    
+    def _enhance_selected_text(self, original_clipboard: str, selected_text: str) -> bool:
+        """
+        Validate the captured selection and start its enhancement.
         
-        # Get the newly copied text (selected text)
-        selected_text = self.clipboard_manager.get_current_clipboard()
-        print(f"Selected text: '{selected_text[:50]}...' (length: {len(selected_text) if selected_text else 0})")
+        Args:
+            original_clipboard (str): Clipboard content before the copy
+            selected_text (str): The copied selection (empty if none)
+            
+        Returns:
+            bool: True if a worker was started (on_worker_finished_silent clears the busy flag)
+        """
+        log.debug("Original clipboard saved: %.30s...", original_clipboard)
+        if log.isEnabledFor(logging.DEBUG):  # Skip the length argument unless logged
+            log.debug("Selected text: '%.50s...' (length: %d)", selected_text, len(selected_text or ''))
         
         # Additional validation: check if the selected text is meaningful
         if selected_text and len(selected_text.strip()) < 2:
-            print("Selected text too short - likely not meaningful selection")
-            QMessageBox.warning(self, "Invalid Selection", 
-                              "Please select more text (at least 2 characters) before using Ctrl+Alt+E.")
-            return
+            log.debug("Selected text too short - likely not meaningful selection")
+            self._show_warning("Invalid Selection", 
+                               "Please select more text (at least 2 characters) before using Ctrl+Alt+E.")
+            return False
         
         # Check if we actually got new text and it's different from original
         if not selected_text:
-            print("No text selected - clipboard is empty")
-            QMessageBox.warning(self, "No Text Selected", 
-                              "Please select some text before using Ctrl+Alt+E to enhance it.")
-            return
+            log.debug("No text selected - clipboard is empty")
+            self._show_warning("No Text Selected", 
+                               "Please select some text before using Ctrl+Alt+E to enhance it.")
+            return False
         
         if selected_text == original_clipboard:
-            print("Selected text is same as clipboard - likely no selection")
-            QMessageBox.warning(self, "No Text Selected", 
-                              "Please select some text before using Ctrl+Alt+E to enhance it.")
-            return
+            log.debug("Selected text is same as clipboard - likely no selection")
+            self._show_warning("No Text Selected", 
+                               "Please select some text before using Ctrl+Alt+E to enhance it.")
+            return False
         
         # Show loading message
         self.show_enhancement_loading_message()
         
         # Create and start worker thread for enhancement
+        self._last_selected_text = selected_text
         self.openai_worker = OpenAIWorker(self.openai_manager, selected_text)
         self.openai_worker.enhancement_complete.connect(self.on_enhancement_complete_with_replacement)
         self.openai_worker.enhancement_failed.connect(self.on_enhancement_failed_silent)
         self.openai_worker.finished.connect(self.on_worker_finished_silent)
         self.openai_worker.start()
+        return True
     
     def show_enhancement_loading_message(self):
         """
         Show a loading message for clipboard enhancement.
+        
+        The floating popup is built on first use and then only moved next to
+        the cursor and shown again on later enhancements.
+        """
+        if self.loading_widget is None:
+            self.loading_widget = self._create_loading_popup(
+                "Enhancing Prompt", "Enhancing selected text...",
+                "rgba(52, 73, 94, 0.95)", "#e67e22")
+        self._show_loading_popup(self.loading_widget)
+    
+    def _create_loading_popup(self, title: str, text: str, background: str, accent: str) -> QWidget:
+        """
+        Build a floating loading popup (shown by _show_loading_popup).
+        
+        Args:
+            title (str): Window title of the popup
+            text (str): Message shown next to the progress bar
+            background (str): CSS color of the popup body
+            accent (str): CSS color of the progress bar chunk
+            
+        Returns:
+            QWidget: The hidden popup widget
         """
         # Create a floating loading widget instead of a modal dialog
-        self.loading_widget = QWidget()
-        self.loading_widget.setWindowTitle("Enhancing Prompt")
-        self.loading_widget.setFixedSize(250, 80)
-        self.loading_widget.setWindowFlags(
+        popup = QWidget()
+        popup.setWindowTitle(title)
+        popup.setFixedSize(250, 80)
+        popup.setWindowFlags(
             Qt.WindowType.FramelessWindowHint | 
             Qt.WindowType.Tool | 
             Qt.WindowType.WindowStaysOnTopHint
         )
-        self.loading_widget.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        popup.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         
         # Create the main layout
         layout = QVBoxLayout()
@@ -2331,33 +2345,40 @@ class Dashboard(QMainWindow):
         
         # Create a styled container
         container = QWidget()
-        container.setStyleSheet("""
-            QWidget {
-                background: rgba(52, 73, 94, 0.95);
+        container.setStyleSheet(f"""
+            QWidget {{
+                background: {background};
                 border-radius: 8px;
                 border: 1px solid rgba(255, 255, 255, 0.2);
-            }
+            }}
         """)
         container_layout = QVBoxLayout()
         container_layout.setContentsMargins(15, 15, 15, 15)
         
-        # Loading label with spinner
+        # Loading label with progress bar
         loading_layout = QHBoxLayout()
         
-        # Spinner dots
-        self.spinner_label = QLabel("⠋")
-        self.spinner_label.setStyleSheet("""
-            QLabel {
-                color: #e67e22;
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-            }
+        # Indeterminate progress bar - the style animates the busy
+        # indicator natively, so no Python timer ticks while we wait
+        loading_bar = QProgressBar()
+        loading_bar.setRange(0, 0)
+        loading_bar.setTextVisible(False)
+        loading_bar.setFixedSize(40, 8)
+        loading_bar.setStyleSheet(f"""
+            QProgressBar {{
+                background: rgba(255, 255, 255, 0.2);
+                border: none;
+                border-radius: 4px;
+            }}
+            QProgressBar::chunk {{
+                background: {accent};
+                border-radius: 4px;
+            }}
         """)
         
         # Loading text
-        self.loading_label = QLabel("Enhancing selected text...")
-        self.loading_label.setStyleSheet("""
+        loading_label = QLabel(text)
+        loading_label.setStyleSheet("""
             QLabel {
                 color: white;
                 font-size: 12px;
@@ -2366,70 +2387,59 @@ class Dashboard(QMainWindow):
             }
         """)
         
-        loading_layout.addWidget(self.spinner_label)
-        loading_layout.addWidget(self.loading_label)
+        loading_layout.addWidget(loading_bar)
+        loading_layout.addWidget(loading_label)
         loading_layout.addStretch()
         
         container_layout.addLayout(loading_layout)
         container.setLayout(container_layout)
         layout.addWidget(container)
-        self.loading_widget.setLayout(layout)
+        popup.setLayout(layout)
+        
+        return popup
+    
+    def _show_loading_popup(self, popup: QWidget):
+        """
+        Move a loading popup next to the cursor and show it.
         
+        Args:
+            popup (QWidget): A popup built by _create_loading_popup
+        """
         # Position the widget near the cursor
         cursor_pos = self.cursor().pos()
-        screen_geometry = self.screen().geometry()
+        screen_geometry = self._primary_screen_geometry()
         
         # Calculate position to ensure widget stays on screen
         x = min(max(cursor_pos.x() - 125, 10), screen_geometry.width() - 260)
         y = min(max(cursor_pos.y() - 40, 10), screen_geometry.height() - 90)
         
-        self.loading_widget.move(x, y)
-        
-        # Timer for updating loading animation
-        self.loading_timer = QTimer()
-        self.loading_timer.timeout.connect(self.update_loading_animation)
-        self.loading_timer.start(100)
-        
-        # Animation state
-        self.current_dot = 0
-        self.dots = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+        popup.move(x, y)
         
         # Show the widget
-        self.loading_widget.show()
-    
-    def update_loading_animation(self):
-        """
-        Update the loading animation.
-        """
-        # Update spinner animation
-        self.current_dot = (self.current_dot + 1) % len(self.dots)
-        self.spinner_label.setText(self.dots[self.current_dot])
-        
-        # Simple text animation
-        current_text = self.loading_label.text()
-        if current_text.endswith("..."):
-            self.loading_label.setText("Enhancing selected text")
-        else:
-            self.loading_label.setText(current_text + ".")
+        popup.show()
     
     def on_enhancement_complete_with_replacement(self, enhanced_text):
         """
         Handle successful clipboard enhancement with clipboard replacement.
         
+        If the enhancement came back unchanged, the selection already holds
+        it and the clipboard still does too, so nothing is copied or pasted
+        (copying identical text would not even fire dataChanged, leaving the
+        paste to its fallback timer).
+        
         Args:
             enhanced_text (str): The enhanced text
         """
-        if self.clipboard_manager:
-            # Copy enhanced text to clipboard
-            self.clipboard_manager.copy_to_clipboard(enhanced_text)
-            print(f"Enhanced text copied to clipboard: {enhanced_text[:50]}...")
+        selected_text, self._last_selected_text = self._last_selected_text, None
+        if enhanced_text == selected_text:
+            log.debug("Enhanced text is unchanged - nothing to replace")
+            self.close_enhancement_loading_message()
+            return
         
-        # Automatically paste the enhanced text to replace selected text
-        import keyboard
-        import time
-        time.sleep(0.2)  # Slightly longer delay to ensure clipboard is ready and user sees the process
-        keyboard.send('ctrl+v')
-        print("Enhanced text automatically pasted to replace selected text")
+        # Copy the enhanced text to the clipboard and paste it over the
+        # selected text once it is there
+        self._paste_text(enhanced_text)
+        log.debug("Enhanced text copied to clipboard for pasting: %.50s...", enhanced_text)
         
         # Close loading dialog
         self.close_enhancement_loading_message()
@@ -2441,7 +2451,7 @@ class Dashboard(QMainWindow):
         Args:
             error_message (str): The error message
         """
-        print(f"Silent enhancement failed: {error_message}")
+        log.warning("Silent enhancement failed: %s", error_message)
         # Close loading dialog
         self.close_enhancement_loading_message()
     
@@ -2449,17 +2459,17 @@ class Dashboard(QMainWindow):
         """
         Handle silent worker thread completion.
         """
-        print("Silent OpenAI worker finished")
+        log.debug("Silent OpenAI worker finished")
+        self._clipboard_hotkey_busy = False
     
     def close_enhancement_loading_message(self):
         """
         Close the enhancement loading message.
+        
+        The popup is only hidden, to be shown again by the next enhancement.
         """
-        if hasattr(self, 'loading_timer'):
-            self.loading_timer.stop()
-        if hasattr(self, 'loading_widget'):
-            self.loading_widget.close()
-            self.loading_widget = None
+        if self.loading_widget:
+            self.loading_widget.hide()
     
     def force_close_loading_message(self):
         """
@@ -2476,16 +2486,16 @@ class Dashboard(QMainWindow):
         Generate a smart response to the user input using OpenAI API.
         """
         if not self.openai_manager:
-            QMessageBox.warning(self, "OpenAI Not Available", 
-                              "OpenAI features are not enabled or configured.")
+            self._show_warning("OpenAI Not Available", 
+                               "OpenAI features are not enabled or configured.")
             return
         
         # Get the user input
         user_input = self.smart_response_input.toPlainText().strip()
         
         if not user_input:
-            QMessageBox.warning(self, "No Input", 
-                              "Please enter some text to generate a response for.")
+            self._show_warning("No Input", 
+                               "Please enter some text to generate a response for.")
             return
         
         # Check smart response visibility setting
@@ -2493,7 +2503,7 @@ class Dashboard(QMainWindow):
         
         if visibility_mode == 'hidden':
             # Hidden mode: no visual feedback, just generate and copy
-            print("Smart response in hidden mode - generating without visual feedback")
+            log.debug("Smart response in hidden mode - generating without visual feedback")
             self.smart_response_worker = SmartResponseWorker(self.openai_manager, user_input, "general")
             self.smart_response_worker.response_complete.connect(self.on_smart_response_complete_hidden_ui)
             self.smart_response_worker.response_failed.connect(self.on_smart_response_failed_hidden_ui)
@@ -2526,7 +2536,6 @@ class Dashboard(QMainWindow):
         self.copy_response_btn.setEnabled(True)
         
         # Show popup with response
-        from .components import SmartResponsePopup
         self.smart_response_popup = SmartResponsePopup(generated_response, self)
         self.smart_response_popup.set_clipboard_manager(self.clipboard_manager)
         self.smart_response_popup.show()
@@ -2535,11 +2544,10 @@ class Dashboard(QMainWindow):
         self.smart_response_status_label.setText("✓ Generated response popup shown")
         
         # Clear status message after 3 seconds
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(3000, lambda: self.smart_response_status_label.setText(""))
         
-        print(f"Smart response generation completed successfully: {generated_response[:50]}...")
-        print("Response popup shown")
+        log.debug("Smart response generation completed successfully: %.50s...", generated_response)
+        log.debug("Response popup shown")
     
     def on_smart_response_failed(self, error_message):
         """
@@ -2548,9 +2556,9 @@ class Dashboard(QMainWindow):
         Args:
             error_message (str): The error message
         """
-        QMessageBox.warning(self, "Response Generation Failed", 
-                          f"Failed to generate response: {error_message}")
-        print(f"Response generation failed: {error_message}")
+        self._show_warning("Response Generation Failed", 
+                           f"Failed to generate response: {error_message}")
+        log.warning("Response generation failed: %s", error_message)
     
     def on_smart_response_worker_finished(self):
         """
@@ -2559,7 +2567,7 @@ class Dashboard(QMainWindow):
         self.smart_response_loading_spinner.stop_animation()
         self.generate_response_btn.setEnabled(True)
         self.generate_response_btn.setText("Generate Response")
-        print("Smart response worker finished")
+        log.debug("Smart response worker finished")
     
     def copy_generated_response(self):
         """
@@ -2567,76 +2575,96 @@ class Dashboard(QMainWindow):
         """
         response_text = self.generated_response_display.toPlainText()
         if response_text and self.clipboard_manager:
-            self.clipboard_manager.copy_to_clipboard(response_text)
-            print("Generated response copied to clipboard")
+            self.copy_to_clipboard(response_text)
+            log.debug("Generated response copied to clipboard")
             
             # Show feedback for manual copy
             self.smart_response_status_label.setText("✓ Generated response copied to clipboard")
-            from PyQt6.QtCore import QTimer
             QTimer.singleShot(2000, lambda: self.smart_response_status_label.setText(""))
     
+    @pyqtSlot()
     def generate_smart_response_from_clipboard(self):
         """
         Generate a smart response from the currently selected text.
         
         This method is called when the user triggers the "Generate smart response from clipboard"
-        hotkey. It saves the current clipboard content, simulates a Ctrl+C key
-        press to copy the selected text, and then attempts to generate a smart response using OpenAI.
-        """
-        print("Generate smart response from selected text hotkey triggered!")
+        hotkey. The selected text is copied by a ClipboardCaptureTask in the
+        thread pool, like for the enhance-prompt hotkey; _on_response_text_captured
+        then validates it and starts generating a smart response using OpenAI.
         
-        if not self.openai_manager:
-            QMessageBox.warning(self, "OpenAI Not Available", 
-                              "OpenAI features are not enabled or configured.")
+        Presses while an earlier one is still being handled (from the copy
+        until its OpenAI request finishes) are ignored, so mashing the hotkey
+        doesn't race extra Ctrl+C presses or send duplicate requests.
+        """
+        log.debug("Generate smart response from selected text hotkey triggered!")
+        if self._clipboard_hotkey_busy:
+            log.debug("Clipboard hotkey already in progress - ignoring")
             return
-        
-        if not self.clipboard_manager:
-            QMessageBox.warning(self, "Clipboard Not Available", 
-                              "Clipboard manager not available.")
+        if not self._ai_hotkey_ready():
             return
+        if self._start_clipboard_capture(self._on_response_text_captured):
+            self._clipboard_hotkey_busy = True
+    
+    @pyqtSlot(str, str)
+    def _on_response_text_captured(self, original_clipboard: str, selected_text: str):
+        """
+        Generate a smart response for the text captured for the smart-response hotkey.
         
-        # Import keyboard module for simulating key presses
-        import keyboard
-        import time
-        
-        # Save current clipboard content
-        original_clipboard = self.clipboard_manager.get_current_clipboard()
-        print(f"Original clipboard saved: {original_clipboard[:30] if original_clipboard else 'None'}...")
+        Args:
+            original_clipboard (str): Clipboard content before the copy
+            selected_text (str): The copied selection (empty if none)
+        """
+        started = False
+        try:
+            started = self._respond_to_selected_text(original_clipboard, selected_text)
+        finally:
+            if not started:
+                self._clipboard_hotkey_busy = False
+    
+    def _respond_to_selected_text(self, original_clipboard: str, selected_text: str) -> bool:
+        """
+        Validate the captured selection and start generating a response.
         
-        # Simulate Ctrl+C to copy selected text
-        keyboard.send('ctrl+c')
-        time.sleep(0.2)  # Longer delay to ensure copy completes
+        Args:
+            original_clipboard (str): Clipboard content before the copy
+            selected_text (str): The copied selection (empty if none)
+            
+        Returns:
+            bool: True if a worker was started (its worker's finished handler clears the busy flag)
+        """
+        # The result is shown in the section's widgets, even while hidden
+        self._build_pending_sections()
         
-        # Get the newly copied text (selected text)
-        selected_text = self.clipboard_manager.get_current_clipboard()
-        print(f"Selected text: '{selected_text[:50]}...' (length: {len(selected_text) if selected_text else 0})")
+        log.debug("Original clipboard saved: %.30s...", original_clipboard)
+        if log.isEnabledFor(logging.DEBUG):  # Skip the length argument unless logged
+            log.debug("Selected text: '%.50s...' (length: %d)", selected_text, len(selected_text or ''))
         
         # Additional validation: check if the selected text is meaningful
         if selected_text and len(selected_text.strip()) < 2:
-            print("Selected text too short - likely not meaningful selection")
-            QMessageBox.warning(self, "Invalid Selection", 
-                              "Please select more text (at least 2 characters) before using Ctrl+Alt+R.")
-            return
+            log.debug("Selected text too short - likely not meaningful selection")
+            self._show_warning("Invalid Selection", 
+                               "Please select more text (at least 2 characters) before using Ctrl+Alt+R.")
+            return False
         
         # Check if we actually got new text and it's different from original
         if not selected_text:
-            print("No text selected - clipboard is empty")
-            QMessageBox.warning(self, "No Text Selected", 
-                              "Please select some text before using Ctrl+Alt+R to generate a response.")
-            return
+            log.debug("No text selected - clipboard is empty")
+            self._show_warning("No Text Selected", 
+                               "Please select some text before using Ctrl+Alt+R to generate a response.")
+            return False
         
         if selected_text == original_clipboard:
-            print("Selected text is same as clipboard - likely no selection")
-            QMessageBox.warning(self, "No Text Selected", 
-                              "Please select some text before using Ctrl+Alt+R to generate a response.")
-            return
+            log.debug("Selected text is same as clipboard - likely no selection")
+            self._show_warning("No Text Selected", 
+                               "Please select some text before using Ctrl+Alt+R to generate a response.")
+            return False
         
         # Check smart response visibility setting
         visibility_mode = self.get_smart_response_visibility()
         
         if visibility_mode == 'hidden':
             # Hidden mode: no visual feedback, just generate and copy
-            print("Smart response in hidden mode - generating without visual feedback")
+            log.debug("Smart response in hidden mode - generating without visual feedback")
             self.smart_response_worker = SmartResponseWorker(self.openai_manager, selected_text, "general")
             self.smart_response_worker.response_complete.connect(self.on_smart_response_complete_hidden)
             self.smart_response_worker.response_failed.connect(self.on_smart_response_failed_hidden)
@@ -2650,108 +2678,19 @@ class Dashboard(QMainWindow):
             self.smart_response_worker.response_failed.connect(self.on_smart_response_failed_silent)
             self.smart_response_worker.finished.connect(self.on_smart_response_worker_finished_silent)
             self.smart_response_worker.start()
+        return True
     
     def show_smart_response_loading_message(self):
         """
         Show a loading message for smart response generation.
-        """
-        # Create a floating loading widget instead of a modal dialog
-        self.smart_response_loading_widget = QWidget()
-        self.smart_response_loading_widget.setWindowTitle("Generating Response")
-        self.smart_response_loading_widget.setFixedSize(250, 80)
-        self.smart_response_loading_widget.setWindowFlags(
-            Qt.WindowType.FramelessWindowHint | 
-            Qt.WindowType.Tool | 
-            Qt.WindowType.WindowStaysOnTopHint
-        )
-        self.smart_response_loading_widget.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        
-        # Create the main layout
-        layout = QVBoxLayout()
-        layout.setContentsMargins(10, 10, 10, 10)
-        
-        # Create a styled container
-        container = QWidget()
-        container.setStyleSheet("""
-            QWidget {
-                background: rgba(155, 89, 182, 0.95);
-                border-radius: 8px;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }
-        """)
-        container_layout = QVBoxLayout()
-        container_layout.setContentsMargins(15, 15, 15, 15)
-        
-        # Loading label with spinner
-        loading_layout = QHBoxLayout()
-        
-        # Spinner dots
-        self.smart_response_spinner_label = QLabel("⠋")
-        self.smart_response_spinner_label.setStyleSheet("""
-            QLabel {
-                color: #f39c12;
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-            }
-        """)
         
-        # Loading text
-        self.smart_response_loading_label = QLabel("Generating smart response...")
-        self.smart_response_loading_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 12px;
-                font-weight: bold;
-                background: transparent;
-            }
-        """)
-        
-        loading_layout.addWidget(self.smart_response_spinner_label)
-        loading_layout.addWidget(self.smart_response_loading_label)
-        loading_layout.addStretch()
-        
-        container_layout.addLayout(loading_layout)
-        container.setLayout(container_layout)
-        layout.addWidget(container)
-        self.smart_response_loading_widget.setLayout(layout)
-        
-        # Position the widget near the cursor
-        cursor_pos = self.cursor().pos()
-        screen_geometry = self.screen().geometry()
-        
-        # Calculate position to ensure widget stays on screen
-        x = min(max(cursor_pos.x() - 125, 10), screen_geometry.width() - 260)
-        y = min(max(cursor_pos.y() - 40, 10), screen_geometry.height() - 90)
-        
-        self.smart_response_loading_widget.move(x, y)
-        
-        # Timer for updating loading animation
-        self.smart_response_loading_timer = QTimer()
-        self.smart_response_loading_timer.timeout.connect(self.update_smart_response_loading_animation)
-        self.smart_response_loading_timer.start(100)
-        
-        # Animation state
-        self.smart_response_current_dot = 0
-        self.smart_response_dots = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-        
-        # Show the widget
-        self.smart_response_loading_widget.show()
-    
-    def update_smart_response_loading_animation(self):
-        """
-        Update the smart response loading animation.
+        Like the enhancement popup, it is built once and reused.
         """
-        # Update spinner animation
-        self.smart_response_current_dot = (self.smart_response_current_dot + 1) % len(self.smart_response_dots)
-        self.smart_response_spinner_label.setText(self.smart_response_dots[self.smart_response_current_dot])
-        
-        # Simple text animation
-        current_text = self.smart_response_loading_label.text()
-        if current_text.endswith("..."):
-            self.smart_response_loading_label.setText("Generating smart response")
-        else:
-            self.smart_response_loading_label.setText(current_text + ".")
+        if self.smart_response_loading_widget is None:
+            self.smart_response_loading_widget = self._create_loading_popup(
+                "Generating Response", "Generating smart response...",
+                "rgba(155, 89, 182, 0.95)", "#f39c12")
+        self._show_loading_popup(self.smart_response_loading_widget)
     
     def on_smart_response_complete_with_replacement(self, generated_response):
         """
@@ -2764,12 +2703,11 @@ class Dashboard(QMainWindow):
         self.close_smart_response_loading_message()
         
         # Show popup with response
-        from .components import SmartResponsePopup
         self.smart_response_popup = SmartResponsePopup(generated_response, self)
         self.smart_response_popup.set_clipboard_manager(self.clipboard_manager)
         self.smart_response_popup.show()
         
-        print(f"Smart response popup shown with: {generated_response[:50]}...")
+        log.debug("Smart response popup shown with: %.50s...", generated_response)
     
     def on_smart_response_failed_silent(self, error_message):
         """
@@ -2778,7 +2716,7 @@ class Dashboard(QMainWindow):
         Args:
             error_message (str): The error message
         """
-        print(f"Silent smart response generation failed: {error_message}")
+        log.warning("Silent smart response generation failed: %s", error_message)
         # Close loading dialog
         self.close_smart_response_loading_message()
     
@@ -2786,17 +2724,15 @@ class Dashboard(QMainWindow):
         """
         Handle silent smart response worker thread completion.
         """
-        print("Silent smart response worker finished")
+        log.debug("Silent smart response worker finished")
+        self._clipboard_hotkey_busy = False
     
     def close_smart_response_loading_message(self):
         """
         Close the smart response loading message.
         """
-        if hasattr(self, 'smart_response_loading_timer'):
-            self.smart_response_loading_timer.stop()
-        if hasattr(self, 'smart_response_loading_widget'):
-            self.smart_response_loading_widget.close()
-            self.smart_response_loading_widget = None
+        if self.smart_response_loading_widget:
+            self.smart_response_loading_widget.hide()
     
     def on_smart_response_complete_hidden(self, generated_response):
         """
@@ -2805,17 +2741,11 @@ class Dashboard(QMainWindow):
         Args:
             generated_response (str): The generated response
         """
-        if self.clipboard_manager:
-            # Copy generated response to clipboard
-            self.clipboard_manager.copy_to_clipboard(generated_response)
-            print(f"Generated response copied to clipboard (hidden mode): {generated_response[:50]}...")
-        
-        # Automatically paste the generated response to replace selected text
-        import keyboard
-        import time
-        time.sleep(0.2)  # Slightly longer delay to ensure clipboard is ready
-        keyboard.send('ctrl+v')
-        print("Generated response automatically pasted to replace selected text (hidden mode)")
+        # Copy the generated response to the clipboard and paste it over the
+        # selected text once it is there
+        self._paste_text(generated_response)
+        log.debug("Generated response copied to clipboard for pasting (hidden mode): %.50s...",
+                  generated_response)
     
     def on_smart_response_failed_hidden(self, error_message):
         """
@@ -2824,13 +2754,14 @@ class Dashboard(QMainWindow):
         Args:
             error_message (str): The error message
         """
-        print(f"Hidden smart response generation failed: {error_message}")
+        log.warning("Hidden smart response generation failed: %s", error_message)
     
     def on_smart_response_worker_finished_hidden(self):
         """
         Handle hidden smart response worker thread completion.
         """
-        print("Hidden smart response worker finished")
+        log.debug("Hidden smart response worker finished")
+        self._clipboard_hotkey_busy = False
     
     def on_smart_response_complete_hidden_ui(self, generated_response):
         """
@@ -2845,8 +2776,8 @@ class Dashboard(QMainWindow):
         
         # Automatically copy the generated response to clipboard
         if self.clipboard_manager:
-            self.clipboard_manager.copy_to_clipboard(generated_response)
-            print(f"Generated response automatically copied to clipboard (hidden UI mode): {generated_response[:50]}...")
+            self.copy_to_clipboard(generated_response)
+            log.debug("Generated response automatically copied to clipboard (hidden UI mode): %.50s...", generated_response)
         
         # Replace the original input with the generated response
         self.smart_response_input.setPlainText(generated_response)
@@ -2855,10 +2786,9 @@ class Dashboard(QMainWindow):
         self.smart_response_status_label.setText("✓ Generated response copied to clipboard")
         
         # Clear status message after 3 seconds
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(3000, lambda: self.smart_response_status_label.setText(""))
         
-        print(f"Smart response generation completed successfully (hidden UI mode): {generated_response[:50]}...")
+        log.debug("Smart response generation completed successfully (hidden UI mode): %.50s...", generated_response)
     
     def on_smart_response_failed_hidden_ui(self, error_message):
         """
@@ -2867,12 +2797,12 @@ class Dashboard(QMainWindow):
         Args:
             error_message (str): The error message
         """
-        QMessageBox.warning(self, "Response Generation Failed", 
-                          f"Failed to generate response: {error_message}")
-        print(f"Response generation failed (hidden UI mode): {error_message}")
+        self._show_warning("Response Generation Failed", 
+                           f"Failed to generate response: {error_message}")
+        log.warning("Response generation failed (hidden UI mode): %s", error_message)
     
     def on_smart_response_worker_finished_hidden_ui(self):
         """
         Handle hidden smart response worker thread completion (UI).
         """
-        print("Hidden smart response worker finished (UI)")
\ No newline at end of file
+        log.debug("Hidden smart response worker finished (UI)")
\ No newline at end of file
@@ -4,13 +4,366 @@ Notes UI Components for SnapPad
 This module contains UI components related to note management.
 """
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QLineEdit, QPushButton, QTextEdit, QMessageBox, 
-                             QFrame, QComboBox, QDialog)
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
-from typing import Dict
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, 
+                             QLineEdit, QPushButton, QTextEdit, QPlainTextEdit, QMessageBox,
+                             QFrame, QComboBox, QDialog, QApplication,
+                             QStyledItemDelegate, QListView, QAbstractItemView)
+from PyQt6.QtCore import (Qt, pyqtSignal, pyqtSlot, QAbstractListModel, QModelIndex,
+                          QStringListModel, QRect, QRectF, QSize, QEvent)
+from PyQt6.QtGui import QFont, QFontMetrics, QPixmap, QPixmapCache, QPainter, QColor
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Optional
+
+from database import NoteRec
+from .components import make_font
+
+
+# Shared fonts for EditableNoteWidget - set via setFont() instead of QSS so
+# Qt doesn't resolve font-size through the stylesheet cascade per instance
+_TITLE_FONT = make_font(14, bold=True)
+_CONTENT_FONT = make_font(13)
+_DATE_FONT = make_font(10, italic=True)
+_BADGE_FONT = make_font(10, bold=True)
+_BTN_FONT = make_font(11)
+
+# Priority badge text and colors indexed by priority level (index 0 is the fallback)
+_PRIORITY_TEXT = ("1", "1", "2", "3")
+_PRIORITY_COLORS = ("#95a5a6", "#95a5a6", "#f39c12", "#e74c3c")
+
+# Character limit above which compact views truncate note content
+_COMPACT_PREVIEW_CHARS = 150
+
+# Number of wrapped lines the truncated preview is elided to fit
+_COMPACT_PREVIEW_LINES = 3
+
+
+def _elide_preview(content: str, metrics: QFontMetrics, width: int) -> str:
+    """
+    Elide note content to roughly _COMPACT_PREVIEW_LINES wrapped lines.
+    
+    Qt's elidedText measures and cuts the text in C++, fitting the preview to
+    the actual pixel width instead of a fixed character count. Line breaks
+    are folded to spaces since elision works on a single line of text.
+    
+    Args:
+        content (str): Full note content
+        metrics (QFontMetrics): Metrics of the font the preview is drawn with
+        width (int): Width of the preview area in pixels
+        
+    Returns:
+        str: Elided preview text ending in an ellipsis when cut
+    """
+    return metrics.elidedText(content.replace('\n', ' '), Qt.TextElideMode.ElideRight,
+                              width * _COMPACT_PREVIEW_LINES)
+
+# Size of the rendered priority pill in device-independent pixels
+_PRIORITY_PILL_SIZE = (22, 16)
+
+# Stylesheet for a whole note card. It is installed once on the NotesListView
+# that hosts the card editors and reaches every card through object-name
+# selectors, so opening an editor doesn't parse a sheet at all. Being set on
+# the view, it still outranks the rules of the window around it.
+_NOTE_CARD_QSS = """
+    QFrame#noteCard {
+        border: 1px solid #e0e0e0;
+        border-radius: 6px;
+        margin: 1px;
+        background: #ffffff;
+    }
+    QFrame#noteCard:hover {
+        border-color: #d0d0d0;
+    }
+    
+    QLabel#noteTitle, QLabel#noteContent, QLabel#noteDate,
+    QLabel#notePriority {
+        border: none;
+        background: transparent;
+    }
+    QLabel#noteTitle {
+        padding: 1px;
+        color: #2c3e50;
+        line-height: 1.2;
+    }
+    QLabel#noteContent {
+        padding: 2px;
+        color: #333333;
+        line-height: 1.3;
+    }
+    QLabel#noteDate {
+        padding: 1px;
+        color: #7f8c8d;
+    }
+    QLabel#notePriority {
+        padding: 0px;
+    }
+    
+    QLineEdit#noteTitleEdit, QComboBox#notePriorityEdit, QTextEdit#noteContentEdit {
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        padding: 4px;
+        background-color: #ffffff;
+        color: #2c3e50;
+    }
+    QTextEdit#noteContentEdit {
+        color: #333333;
+    }
+    QLineEdit#noteTitleEdit:focus, QComboBox#notePriorityEdit:focus, QTextEdit#noteContentEdit:focus {
+        border-color: #4a90e2;
+    }
+    QComboBox#notePriorityEdit::drop-down {
+        border: none;
+    }
+    QComboBox#notePriorityEdit::down-arrow {
+        image: none;
+        border: none;
+    }
+    
+    QPushButton#noteEditBtn, QPushButton#noteSaveBtn,
+    QPushButton#noteCancelBtn, QPushButton#noteCopyBtn {
+        color: white;
+        border: none;
+        border-radius: 3px;
+        padding: 4px 8px;
+    }
+    QPushButton#noteEditBtn { background: #4a90e2; }
+    QPushButton#noteEditBtn:hover { background: #357abd; }
+    QPushButton#noteSaveBtn { background: #27ae60; }
+    QPushButton#noteSaveBtn:hover { background: #229954; }
+    QPushButton#noteCancelBtn { background: #95a5a6; }
+    QPushButton#noteCancelBtn:hover { background: #7f8c8d; }
+    QPushButton#noteCopyBtn { background: #8e44ad; }
+    QPushButton#noteCopyBtn:hover { background: #7d3c98; }
+    
+"""
+
+# Stylesheet for AddNoteDialog, set once on the dialog itself
+_ADD_NOTE_DIALOG_QSS = """
+    QLabel#addNoteHeading {
+        font-size: 16px;
+        font-weight: bold;
+        color: #2c3e50;
+        margin-bottom: 10px;
+    }
+    QLabel#addNoteContentLabel {
+        font-size: 13px;
+        color: #2c3e50;
+        margin-top: 5px;
+    }
+    
+    QLineEdit#addNoteTitle, QComboBox#addNotePriority, QPlainTextEdit#addNoteContent {
+        border: 1px solid #d1d5db;
+        border-radius: 6px;
+        padding: 10px;
+        font-size: 14px;
+        background-color: #ffffff;
+        color: #2c3e50;
+    }
+    QLineEdit#addNoteTitle {
+        font-weight: bold;
+    }
+    QComboBox#addNotePriority {
+        font-size: 13px;
+    }
+    QPlainTextEdit#addNoteContent {
+        line-height: 1.4;
+    }
+    QLineEdit#addNoteTitle:focus, QComboBox#addNotePriority:focus, QPlainTextEdit#addNoteContent:focus {
+        border-color: #4a90e2;
+    }
+    QComboBox#addNotePriority::drop-down {
+        border: none;
+    }
+    QComboBox#addNotePriority::down-arrow {
+        image: none;
+        border: none;
+    }
+    
+    QPushButton#addNoteCancelBtn, QPushButton#addNoteAddBtn {
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    QPushButton#addNoteCancelBtn { background: #95a5a6; }
+    QPushButton#addNoteCancelBtn:hover { background: #7f8c8d; }
+    QPushButton#addNoteAddBtn { background: #27ae60; }
+    QPushButton#addNoteAddBtn:hover { background: #229954; }
+"""
+
+
+# Notes sort options mapped to (key function, reverse). Shared by the dashboard
+# and the All Notes window so sorting is a single dict lookup instead of an
+# if/elif chain. ISO timestamps sort lexicographically, so they need no parsing,
+# and every key is a C-level attrgetter rather than a Python function.
+NOTE_SORT_DISPATCH = {
+    "Updated (newest)": (attrgetter('updated_at'), True),
+    "Updated (oldest)": (attrgetter('updated_at'), False),
+    "Created (newest)": (attrgetter('created_at'), True),
+    "Created (oldest)": (attrgetter('created_at'), False),
+    "Priority (high)": (attrgetter('priority'), True),
+    "Priority (low)": (attrgetter('priority'), False),
+    "Title (A-Z)": (attrgetter('title_lc'), False),  # Lower-cased once per NoteRec
+    "Title (Z-A)": (attrgetter('title_lc'), True),
+}
+
+# Sort used when no (or an unknown) sort option is selected
+DEFAULT_NOTE_SORT = "Updated (newest)"
+
+# List model shared by every notes sort combo box (created on first use)
+_sort_options_model = None
+
+
+def note_sort_model() -> QStringListModel:
+    """
+    Get the item model listing the notes sort options.
+    
+    Every sort combo box uses this one model instead of building its own
+    item list with addItems(); each combo still keeps its own selection.
+    
+    Returns:
+        QStringListModel: Model holding the NOTE_SORT_DISPATCH keys in order
+    """
+    global _sort_options_model
+    if _sort_options_model is None:
+        _sort_options_model = QStringListModel(list(NOTE_SORT_DISPATCH))
+    return _sort_options_model
+
+
+def filter_and_sort_notes(notes, search_term: str = "", sort_option: str = DEFAULT_NOTE_SORT) -> list:
+    """
+    Filter notes by a search term and sort them in a single pass.
+    
+    Matching notes and their sort keys are collected together, so each note
+    is visited once and no intermediate filtered list is built.
+    
+    Args:
+        notes: Iterable of NoteRec records
+        search_term (str): Lower-cased search term (empty matches everything)
+        sort_option (str): One of the NOTE_SORT_DISPATCH keys
+        
+    Returns:
+        list: Matching notes in sorted order
+    """
+    key_fn, reverse = NOTE_SORT_DISPATCH.get(sort_option, NOTE_SORT_DISPATCH[DEFAULT_NOTE_SORT])
+    
+    if not search_term:
+        # Nothing to filter: sort the notes directly instead of building
+        # and unwrapping (key, note) pairs
+        return sorted(notes, key=key_fn, reverse=reverse)
+    
+    # One substring test per note against its precomputed title + content
+    # text (the newline between them keeps a single-line term from matching
+    # across the two)
+    pairs = [(key_fn(note), note) for note in notes if search_term in note.search_text]
+    pairs.sort(key=itemgetter(0), reverse=reverse)
+    return [note for _, note in pairs]
+
+
+def _format_iso_timestamp(timestamp: str) -> str:
+    """
+    Format an ISO timestamp as "MM/DD/YYYY HH:MM".
+    
+    Timestamps written by DatabaseManager (datetime.isoformat()) have a fixed
+    layout, so the fields are sliced out directly without parsing. Anything
+    else falls back to datetime.fromisoformat.
+    
+    Args:
+        timestamp (str): ISO format timestamp (e.g. "2024-01-31T14:05:09.123456")
+        
+    Returns:
+        str: Formatted timestamp
+        
+    Raises:
+        ValueError: If the timestamp is not valid ISO format
+    """
+    if (len(timestamp) >= 16 and timestamp[4] == '-' and timestamp[7] == '-'
+            and timestamp[10] in 'T ' and timestamp[13] == ':'):
+        return f"{timestamp[5:7]}/{timestamp[8:10]}/{timestamp[0:4]} {timestamp[11:16]}"
+    
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime("%m/%d/%Y %H:%M")
+
+
+@lru_cache(maxsize=1024)
+def _format_note_dates(created_at: str, updated_at: str) -> str:
+    """
+    Build the "Created: ... | Updated: ..." line shown under a note.
+    
+    Cached per (created_at, updated_at) pair: NoteDelegate.paint asks for
+    every visible row on each repaint, and a note's text only changes when
+    one of its timestamps does. The cache is bounded, so timestamps of
+    edited or deleted notes age out.
+    
+    Args:
+        created_at (str): Creation timestamp (ISO format)
+        updated_at (str): Last update timestamp (ISO format)
+        
+    Returns:
+        str: Formatted date information
+    """
+    try:
+        created_str = _format_iso_timestamp(created_at)
+        
+        # Never-edited notes share one raw timestamp - nothing more to format
+        if updated_at == created_at:
+            return f"Created: {created_str}"
+        
+        # Check if the note was updated after creation (edits within the same
+        # minute format identically)
+        updated_str = _format_iso_timestamp(updated_at)
+        if created_str == updated_str:
+            return f"Created: {created_str}"
+        return f"Created: {created_str} | Updated: {updated_str}"
+            
+    except (ValueError, AttributeError):
+        # Fallback for malformed dates
+        return "Date information unavailable"
+
+
+def _priority_pixmap(priority: int) -> QPixmap:
+    """
+    Get the pre-rendered priority pill for a priority level.
+    
+    The pill is drawn once per priority level and stored in QPixmapCache, so
+    every note widget blits the same bitmap instead of having QSS paint a
+    rounded rect and text on each repaint. Rendering is deferred to first use
+    because pixmaps need a running QApplication.
+    
+    Args:
+        priority (int): Priority level (1-3)
+        
+    Returns:
+        QPixmap: The cached pill pixmap
+    """
+    if not 1 <= priority <= 3:
+        priority = 1
+    key = f"snappad_prio{priority}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+    
+    # Render at the screen's pixel ratio so the pill stays crisp on HiDPI displays
+    ratio = QApplication.instance().devicePixelRatio()
+    width, height = _PRIORITY_PILL_SIZE
+    pixmap = QPixmap(int(width * ratio), int(height * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(_PRIORITY_COLORS[priority]))
+    painter.drawRoundedRect(0, 0, width, height, height / 2, height / 2)
+    painter.setPen(QColor("white"))
+    painter.setFont(_BADGE_FONT)
+    painter.drawText(0, 0, width, height, Qt.AlignmentFlag.AlignCenter, _PRIORITY_TEXT[priority])
+    painter.end()
+    
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 
 class EditableNoteWidget(QWidget):
@@ -20,25 +373,29 @@ class EditableNoteWidget(QWidget):
     This widget provides a complete note management interface including:
     - Display mode: Shows note title, content, and date info with action buttons
     - Edit mode: Provides text editing for both title and content with save/cancel options
-    - Action buttons: Edit, delete, copy, and save functionality
+    - Action buttons: Edit, copy, and save functionality (deleting is done
+      from the painted card, see NoteDelegate)
     - Visual feedback: Hover effects and state transitions
     - Signal communication: Emits signals for parent coordination
     
     The widget automatically switches between display and edit modes,
     providing a seamless user experience for note management.
+    
+    Both notes lists use it as their in-place editor; it always shows the
+    full content (truncated previews are painted by NoteDelegate).
     """
     
     # Signals for communicating with the parent widget
     note_updated = pyqtSignal(int, str, str, int)  # Emitted when note is updated (id, content, title, priority)
-    note_deleted = pyqtSignal(int)       # Emitted when note is deleted
     note_copied = pyqtSignal(str)        # Emitted when note content is copied
+    editing_finished = pyqtSignal()      # Emitted when the widget leaves edit mode
     
-    def __init__(self, note_data: Dict, parent=None, is_compact=False):
+    def __init__(self, note_data: NoteRec, parent=None):
         """
         Initialize the editable note widget.
         
         Args:
-            note_data (Dict): Dictionary containing note information with keys:
+            note_data (NoteRec): Note record with attributes:
                             - id: Unique note identifier
                             - title: Note title
                             - content: Note text content
@@ -46,7 +403,6 @@ class EditableNoteWidget(QWidget):
                             - created_at: Creation timestamp
                             - updated_at: Last update timestamp
             parent: Parent widget (optional)
-            is_compact (bool): If True, show truncated content with "show all" button (for dashboard)
         """
         super().__init__(parent)
         
@@ -56,9 +412,8 @@ class EditableNoteWidget(QWidget):
         # Track editing state
         self.is_editing = False
         
-        # Store compact mode setting
-        self.is_compact = is_compact
-        self.is_content_expanded = False  # Track if content is expanded in compact mode
+        # Content last applied to the display label - skips redundant setText calls
+        self._last_preview_key = None
         
         # Set up the user interface
         self.setup_ui()
@@ -72,7 +427,7 @@ class EditableNoteWidget(QWidget):
         - Title display and editing
         - Content display and editing
         - Date information
-        - Action buttons (Edit, Delete, Copy, Save, Cancel)
+        - Action buttons (Edit, Copy, Save, Cancel)
         - Layout management and styling
         """
         # Main layout - compact margins for better space usage
@@ -82,162 +437,118 @@ class EditableNoteWidget(QWidget):
         # Create main container frame with border and styling
         self.container = QFrame()
         self.container.setFrameStyle(QFrame.Shape.Box)
-        self.container.setStyleSheet("""
-            QFrame {
-                border: 1px solid #e0e0e0;
-                border-radius: 6px;
-                margin: 1px;
-                background: #ffffff;
-            }
-            QFrame:hover {
-                border-color: #d0d0d0;
-            }
-        """)
-        
-        # Container layout with compact spacing
-        container_layout = QVBoxLayout()
-        container_layout.setSpacing(3)  # Reduced from 4px
+        self.container.setObjectName("noteCard")  # Styled by _NOTE_CARD_QSS on the hosting view
+        
+        # Single grid layout for the whole card. Display and edit widgets share
+        # cells and are toggled by visibility, so no nested layouts are needed:
+        #   row 0: title / title editor (cols 0-2) | priority / priority editor (col 3)
+        #   row 1: content / content editor (cols 0-3)
+        #   row 2: date (cols 0-3)
+        #   row 3: Edit/Save (col 0) | Cancel (col 1) | stretch (col 2) | Copy (col 3)
+        container_layout = QGridLayout()
+        container_layout.setHorizontalSpacing(3)  # Reduced from 4px
+        container_layout.setVerticalSpacing(3)  # Reduced from 4px
         container_layout.setContentsMargins(4, 4, 4, 4)  # Reduced from 6px
-        
-        # Header layout for title and priority
-        header_layout = QHBoxLayout()
-        header_layout.setSpacing(6)  # Reduced from 8px
+        container_layout.setColumnStretch(2, 1)
         
         # Title display label (shown in display mode)
-        self.title_display_label = QLabel(self.note_data['title'])
+        self.title_display_label = QLabel(self.note_data.title)
         self.title_display_label.setWordWrap(True)
-        self.title_display_label.setStyleSheet("""
-            QLabel {
-                border: none; 
-                background: transparent; 
-                padding: 1px;
-                color: #2c3e50;
-                font-size: 14px;
-                font-weight: bold;
-                line-height: 1.2;
-            }
-        """)
+        self.title_display_label.setObjectName("noteTitle")
+        self.title_display_label.setFont(_TITLE_FONT)
         
         # Priority display label (shown in display mode)
-        self.priority_display_label = QLabel(self._get_priority_text(self.note_data['priority']))
-        self.priority_display_label.setStyleSheet(f"""
-            QLabel {{
-                border: none; 
-                background: {self._get_priority_color(self.note_data['priority'])}; 
-                padding: 2px 6px;
-                color: white;
-                font-size: 10px;
-                font-weight: bold;
-                border-radius: 8px;
-                max-width: 50px;
-            }}
-        """)
+        self.priority_display_label = QLabel()
+        self.priority_display_label.setObjectName("notePriority")
+        self.priority_display_label.setPixmap(_priority_pixmap(self.note_data.priority))
+        self.priority_display_label.setToolTip(
+            f"Priority {self._get_priority_text(self.note_data.priority)}")
+        
+        # Note content display label (shown in display mode)
+        self.content_display_label = QLabel()
+        self.content_display_label.setWordWrap(True)
+        self.content_display_label.setObjectName("noteContent")
+        self.content_display_label.setFont(_CONTENT_FONT)
+        
+        # Date information label
+        self.date_label = QLabel(self._format_date_info())
+        self.date_label.setObjectName("noteDate")
+        self.date_label.setFont(_DATE_FONT)
         
-        header_layout.addWidget(self.title_display_label)
-        header_layout.addStretch()
-        header_layout.addWidget(self.priority_display_label)
+        # Edit button - switches to edit mode
+        self.edit_btn = QPushButton("Edit")
+        self.edit_btn.setMaximumWidth(50)
+        self.edit_btn.setMaximumHeight(24)
+        self.edit_btn.clicked.connect(self.toggle_edit_mode)
+        self.edit_btn.setObjectName("noteEditBtn")
+        self.edit_btn.setFont(_BTN_FONT)
+        
+        # Copy button - copies note content to clipboard
+        self.copy_btn = QPushButton("Copy")
+        self.copy_btn.setMaximumWidth(50)
+        self.copy_btn.setMaximumHeight(24)
+        self.copy_btn.clicked.connect(self.copy_note)
+        self.copy_btn.setObjectName("noteCopyBtn")
+        self.copy_btn.setFont(_BTN_FONT)
         
-        # Edit mode header layout
-        edit_header_layout = QHBoxLayout()
-        edit_header_layout.setSpacing(6)  # Reduced from 8px
+        # Header row - editors share the cells of the display widgets
+        container_layout.addWidget(self.title_display_label, 0, 0, 1, 3)
+        container_layout.addWidget(self.priority_display_label, 0, 3, Qt.AlignmentFlag.AlignRight)
         
+        # Content row - the content editor shares its cell
+        container_layout.addWidget(self.content_display_label, 1, 0, 1, 4)
+        
+        container_layout.addWidget(self.date_label, 2, 0, 1, 4)
+        
+        # Action row - Save shares its cell with Edit
+        container_layout.addWidget(self.edit_btn, 3, 0)
+        container_layout.addWidget(self.copy_btn, 3, 3, Qt.AlignmentFlag.AlignRight)
+        
+        # Set layout for the container frame
+        self.container.setLayout(container_layout)
+        self._grid = container_layout
+        
+        # Editors and Save/Cancel, placed over the display widgets
+        self._build_edit_widgets()
+        
+        # Add container to the main layout
+        layout.addWidget(self.container)
+        
+        # Set the main layout for the widget
+        self.setLayout(layout)
+        
+        # Set initial content display
+        self._update_content_display()
+    
+    def _build_edit_widgets(self):
+        """
+        Build the edit-mode widgets, filled from the note and hidden.
+        
+        Note widgets only exist as in-place editors that open straight into
+        edit mode, so the editors and the Save/Cancel buttons are built with
+        the card and placed in the cells of the display widgets.
+        """
         # Title editor (shown in edit mode)
         self.title_edit = QLineEdit()
-        self.title_edit.setText(self.note_data['title'])
+        self.title_edit.setText(self.note_data.title)
         self.title_edit.setPlaceholderText("Note title...")
-        self.title_edit.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 14px;
-                font-weight: bold;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QLineEdit:focus {
-                border-color: #4a90e2;
-            }
-        """)
+        self.title_edit.setObjectName("noteTitleEdit")
+        self.title_edit.setFont(_TITLE_FONT)
         
         # Priority editor (shown in edit mode)
         self.priority_edit = QComboBox()
         self.priority_edit.addItems(["1", "2", "3"])
-        self.priority_edit.setCurrentIndex(self.note_data['priority'] - 1)  # Convert to 0-based index
+        self.priority_edit.setCurrentIndex(self.note_data.priority - 1)  # Convert to 0-based index
         self.priority_edit.setMaximumWidth(80)
-        self.priority_edit.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 11px;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QComboBox:focus {
-                border-color: #4a90e2;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-            }
-        """)
-        
-        edit_header_layout.addWidget(self.title_edit)
-        edit_header_layout.addWidget(self.priority_edit)
+        self.priority_edit.setObjectName("notePriorityEdit")
+        self.priority_edit.setFont(_BTN_FONT)
         
-        # Create containers for the headers
-        self.display_header_widget = QWidget()
-        self.display_header_widget.setLayout(header_layout)
-        
-        self.edit_header_widget = QWidget()
-        self.edit_header_widget.setLayout(edit_header_layout)
-        self.edit_header_widget.hide()  # Hidden by default
-        
-        # Note content display label (shown in display mode)
-        self.content_display_label = QLabel()
-        self.content_display_label.setWordWrap(True)
-        self.content_display_label.setStyleSheet("""
-            QLabel {
-                border: none; 
-                background: transparent; 
-                padding: 2px;
-                color: #333333;
-                font-size: 13px;
-                line-height: 1.3;
-            }
-        """)
-        
-        # Show all button for compact mode (hidden by default)
-        self.show_all_btn = QPushButton("show all")
-        self.show_all_btn.setMaximumWidth(60)
-        self.show_all_btn.setMaximumHeight(20)
-        self.show_all_btn.clicked.connect(self._toggle_content_display)
-        self.show_all_btn.setStyleSheet("""
-            QPushButton {
-                background: #d1d0cf;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 2px 4px;
-                font-size: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #bcbab9;
-            }
-        """)
-        self.show_all_btn.hide()  # Hidden by default
-        
-        # Set initial content based on compact mode
-        self._update_content_display()
+        self.title_edit.hide()  # Hidden by default
+        self.priority_edit.hide()  # Hidden by default
         
         # Note content text editor (shown in edit mode)
         self.content_edit_text = QTextEdit()
-        self.content_edit_text.setPlainText(self.note_data['content'])
+        self.content_edit_text.setPlainText(self.note_data.content)
         self.content_edit_text.setMinimumHeight(80)  # Minimum height for visibility
         self.content_edit_text.setMaximumHeight(400)  # Allow expansion but prevent excessive height
         
@@ -245,94 +556,17 @@ class EditableNoteWidget(QWidget):
         self.content_edit_text.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.content_edit_text.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.content_edit_text.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
-        self.content_edit_text.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #d0d0d0;
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 13px;
-                background-color: #ffffff;
-                color: #333333;
-            }
-            QTextEdit:focus {
-                border-color: #4a90e2;
-            }
-        """)
+        self.content_edit_text.setObjectName("noteContentEdit")
+        self.content_edit_text.setFont(_CONTENT_FONT)
         self.content_edit_text.hide()  # Hidden by default
         
-        # Date information label
-        self.date_label = QLabel(self._format_date_info())
-        self.date_label.setStyleSheet("""
-            QLabel {
-                border: none; 
-                background: transparent; 
-                padding: 1px;
-                color: #7f8c8d;
-                font-size: 10px;
-                font-style: italic;
-            }
-        """)
-        
-        # Button container layout
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(3)  # Reduced from 4px
-        
-        # Edit button - switches to edit mode
-        self.edit_btn = QPushButton("Edit")
-        self.edit_btn.setMaximumWidth(50)
-        self.edit_btn.setMaximumHeight(24)
-        self.edit_btn.clicked.connect(self.toggle_edit_mode)
-        self.edit_btn.setStyleSheet("""
-            QPushButton {
-                background: #4a90e2;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 4px 8px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background: #357abd;
-            }
-        """)
-        
-        # Delete button - removes the note
-        self.delete_btn = QPushButton("Del")
-        self.delete_btn.setMaximumWidth(40)
-        self.delete_btn.setMaximumHeight(24)
-        self.delete_btn.clicked.connect(self.delete_note)
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 4px 8px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background: #c0392b;
-            }
-        """)
-        
         # Save button - saves changes (hidden in display mode)
         self.save_btn = QPushButton("Save")
         self.save_btn.setMaximumWidth(50)
         self.save_btn.setMaximumHeight(24)
         self.save_btn.clicked.connect(self.save_note)
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 4px 8px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background: #229954;
-            }
-        """)
+        self.save_btn.setObjectName("noteSaveBtn")
+        self.save_btn.setFont(_BTN_FONT)
         self.save_btn.hide()  # Hidden by default
         
         # Cancel button - cancels editing (hidden in display mode)
@@ -340,102 +574,28 @@ class EditableNoteWidget(QWidget):
         self.cancel_btn.setMaximumWidth(55)
         self.cancel_btn.setMaximumHeight(24)
         self.cancel_btn.clicked.connect(self.cancel_edit)
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background: #95a5a6;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 4px 8px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background: #7f8c8d;
-            }
-        """)
+        self.cancel_btn.setObjectName("noteCancelBtn")
+        self.cancel_btn.setFont(_BTN_FONT)
         self.cancel_btn.hide()  # Hidden by default
         
-        # Copy button - copies note content to clipboard
-        self.copy_btn = QPushButton("Copy")
-        self.copy_btn.setMaximumWidth(50)
-        self.copy_btn.setMaximumHeight(24)
-        self.copy_btn.clicked.connect(self.copy_note)
-        self.copy_btn.setStyleSheet("""
-            QPushButton {
-                background: #8e44ad;
-                color: white;
-                border: none;
-                border-radius: 3px;
-                padding: 4px 8px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background: #7d3c98;
-            }
-        """)
-        
-        button_layout.addWidget(self.edit_btn)
-        button_layout.addWidget(self.delete_btn)
-        button_layout.addWidget(self.save_btn)
-        button_layout.addWidget(self.cancel_btn)
-        button_layout.addStretch()
-        button_layout.addWidget(self.copy_btn)
-        
-        # Content section with show all button
-        content_section_layout = QVBoxLayout()
-        content_section_layout.setSpacing(2)
-        content_section_layout.setContentsMargins(0, 0, 0, 0)
-        content_section_layout.addWidget(self.content_display_label)
-        
-        # Show all button layout (right-aligned)
-        show_all_layout = QHBoxLayout()
-        show_all_layout.setContentsMargins(0, 0, 0, 0)
-        show_all_layout.addStretch()
-        show_all_layout.addWidget(self.show_all_btn)
-        content_section_layout.addLayout(show_all_layout)
-        
-        # Add widgets to container layout
-        container_layout.addWidget(self.display_header_widget)
-        container_layout.addWidget(self.edit_header_widget)
-        container_layout.addLayout(content_section_layout)
-        container_layout.addWidget(self.content_edit_text)
-        container_layout.addWidget(self.date_label)
-        container_layout.addLayout(button_layout)
-        
-        # Set layout for the container frame
-        self.container.setLayout(container_layout)
-        
-        # Add container to the main layout
-        layout.addWidget(self.container)
-        
-        # Set the main layout for the widget
-        self.setLayout(layout)
+        grid = self._grid
+        grid.addWidget(self.title_edit, 0, 0, 1, 3)
+        grid.addWidget(self.priority_edit, 0, 3, Qt.AlignmentFlag.AlignRight)
+        grid.addWidget(self.content_edit_text, 1, 0, 1, 4)
+        grid.addWidget(self.save_btn, 3, 0)
+        grid.addWidget(self.cancel_btn, 3, 1)
     
     def _format_date_info(self) -> str:
         """
         Format the date information for display.
         
+        _format_note_dates caches the result per (created_at, updated_at)
+        pair, so repeated calls for an unchanged note skip parsing entirely.
+        
         Returns:
             str: Formatted date string showing creation and update times
         """
-        try:
-            # Parse the ISO format timestamps
-            created_dt = datetime.fromisoformat(self.note_data['created_at'].replace('Z', '+00:00'))
-            updated_dt = datetime.fromisoformat(self.note_data['updated_at'].replace('Z', '+00:00'))
-            
-            # Format for display
-            created_str = created_dt.strftime("%m/%d/%Y %H:%M")
-            updated_str = updated_dt.strftime("%m/%d/%Y %H:%M")
-            
-            # Check if the note was updated after creation
-            if created_str == updated_str:
-                return f"Created: {created_str}"
-            else:
-                return f"Created: {created_str} | Updated: {updated_str}"
-                
-        except (ValueError, KeyError):
-            # Fallback for malformed dates
-            return "Date information unavailable"
+        return _format_note_dates(self.note_data.created_at, self.note_data.updated_at)
     
     def _get_priority_text(self, priority: int) -> str:
         """
@@ -447,59 +607,51 @@ class EditableNoteWidget(QWidget):
         Returns:
             str: Display text for the priority
         """
-        return str(priority) if priority in [1, 2, 3] else "1"
-    
-    def _get_priority_color(self, priority: int) -> str:
-        """
-        Get the display color for a priority level.
-        
-        Args:
-            priority (int): Priority level (1-3)
-            
-        Returns:
-            str: CSS color code for the priority
-        """
-        color_map = {1: "#95a5a6", 2: "#f39c12", 3: "#e74c3c"}
-        return color_map.get(priority, "#95a5a6")
+        return _PRIORITY_TEXT[priority] if 1 <= priority <= 3 else _PRIORITY_TEXT[0]
     
+    @pyqtSlot()
     def toggle_edit_mode(self):
         """
         Toggle between display and edit mode for the note widget.
         
         This method handles the state transitions for the note widget,
         showing the editors and hiding the display headers, and vice versa.
-        It also manages the visibility of action buttons (Edit, Delete, Save, Cancel)
+        It also manages the visibility of action buttons (Edit, Save, Cancel)
         based on the current mode.
         """
         self.is_editing = not self.is_editing
         
         if self.is_editing:
-            self.display_header_widget.hide()
+            self.title_display_label.hide()
+            self.priority_display_label.hide()
             self.content_display_label.hide()
-            self.edit_header_widget.show()
+            self.title_edit.show()
+            self.priority_edit.show()
             self.content_edit_text.show()
             self.edit_btn.hide()
-            self.delete_btn.hide()
             self.save_btn.show()
             self.cancel_btn.show()
             self.title_edit.setFocus()
         else:
-            self.display_header_widget.show()
+            self.title_display_label.show()
+            self.priority_display_label.show()
             self.content_display_label.show()
-            self.edit_header_widget.hide()
+            self.title_edit.hide()
+            self.priority_edit.hide()
             self.content_edit_text.hide()
             self.edit_btn.show()
-            self.delete_btn.show()
             self.save_btn.hide()
             self.cancel_btn.hide()
+            self.editing_finished.emit()
     
+    @pyqtSlot()
     def save_note(self):
         """
         Save the edited note title, content, and priority to the database.
         
         This method is called when the user clicks the "Save" button in edit mode.
-        It retrieves the new title, content, and priority from the editors, updates the note data,
-        and emits a signal to notify the parent widget.
+        It retrieves the new title, content, and priority from the editors, replaces the
+        (immutable) note record with an edited copy, and emits a signal to notify the parent widget.
         """
         new_title = self.title_edit.text().strip()
         new_content = self.content_edit_text.toPlainText().strip()
@@ -513,31 +665,18 @@ class EditableNoteWidget(QWidget):
             if not new_content:
                 new_content = new_title
                 
-            self.note_data['title'] = new_title
-            self.note_data['content'] = new_content
-            self.note_data['priority'] = new_priority
+            self.note_data = self.note_data.with_changes(new_title, new_content, new_priority)
             
             # Update display elements
             self.title_display_label.setText(new_title)
-            self.content_display_label.setText(new_content)
-            self.priority_display_label.setText(self._get_priority_text(new_priority))
-            self.priority_display_label.setStyleSheet(f"""
-                QLabel {{
-                    border: none; 
-                    background: {self._get_priority_color(new_priority)}; 
-                    padding: 2px 6px;
-                    color: white;
-                    font-size: 10px;
-                    font-weight: bold;
-                    border-radius: 8px;
-                    max-width: 50px;
-                }}
-            """)
+            self.priority_display_label.setPixmap(_priority_pixmap(new_priority))
+            self.priority_display_label.setToolTip(f"Priority {self._get_priority_text(new_priority)}")
             
-            self.note_updated.emit(self.note_data['id'], new_content, new_title, new_priority)
+            self.note_updated.emit(self.note_data.id, new_content, new_title, new_priority)
             self._update_content_display()  # Refresh content display after update
             self.toggle_edit_mode()
     
+    @pyqtSlot()
     def cancel_edit(self):
         """
         Cancel editing and revert changes for the note widget.
@@ -545,29 +684,12 @@ class EditableNoteWidget(QWidget):
         This method is called when the user clicks the "Cancel" button in edit mode.
         It restores the original title, content, and priority from the note data and reverts to display mode.
         """
-        self.title_edit.setText(self.note_data['title'])
-        self.content_edit_text.setPlainText(self.note_data['content'])
-        self.priority_edit.setCurrentIndex(self.note_data['priority'] - 1)  # Convert to 0-based index
+        self.title_edit.setText(self.note_data.title)
+        self.content_edit_text.setPlainText(self.note_data.content)
+        self.priority_edit.setCurrentIndex(self.note_data.priority - 1)  # Convert to 0-based index
         self.toggle_edit_mode()
     
-    def delete_note(self):
-        """
-        Delete the note from the database after confirmation.
-        
-        This method is called when the user clicks the "Delete" button.
-        It shows a confirmation dialog and, if confirmed, emits a signal to
-        notify the parent widget to delete the note from the database.
-        """
-        reply = QMessageBox.question(
-            self, 
-            "Delete Note", 
-            "Are you sure you want to delete this note?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        
-        if reply == QMessageBox.StandardButton.Yes:
-            self.note_deleted.emit(self.note_data['id'])
-    
+    @pyqtSlot()
     def copy_note(self):
         """
         Copy the current note content to the clipboard.
@@ -576,38 +698,677 @@ class EditableNoteWidget(QWidget):
         It emits a signal to notify the parent widget to copy the content
         to the clipboard.
         """
-        self.note_copied.emit(self.note_data['content'])
+        self.note_copied.emit(self.note_data.content)
     
     def _update_content_display(self):
         """
-        Update the content display based on compact mode and expansion state.
-        """
-        content = self.note_data['content']
-        max_chars = 150  # Character limit for compact mode
-        
-        if self.is_compact and not self.is_content_expanded and len(content) > max_chars:
-            # Show truncated content with "..."
-            truncated_content = content[:max_chars].rstrip() + "..."
-            self.content_display_label.setText(truncated_content)
-            self.show_all_btn.show()
-            self.show_all_btn.setText("show all")
-        elif self.is_compact and self.is_content_expanded:
-            # Show full content in compact mode
-            self.content_display_label.setText(content)
-            self.show_all_btn.show()
-            self.show_all_btn.setText("show less")
+        Update the content display label with the full note content.
+        """
+        content = self.note_data.content
+        
+        # Skip the label update entirely if the content is unchanged
+        if content == self._last_preview_key:
+            return
+        self._last_preview_key = content
+        
+        self.content_display_label.setText(content)
+
+
+class NotesModel(QAbstractListModel):
+    """
+    List model exposing NoteRec records to a QListView.
+    
+    The display role carries the note title; NoteRole carries the NoteRec
+    itself for NoteDelegate to paint.
+    """
+    
+    # Custom role returning the NoteRec for a row
+    NoteRole = Qt.ItemDataRole.UserRole + 1
+    
+    def __init__(self, parent=None):
+        """
+        Initialize an empty notes model.
+        
+        Args:
+            parent: Parent QObject (optional)
+        """
+        super().__init__(parent)
+        self._notes = []
+    
+    def set_notes(self, notes):
+        """
+        Replace the model contents.
+        
+        Args:
+            notes: List of NoteRec records in display order
+        """
+        self.beginResetModel()
+        self._notes = list(notes)
+        self.endResetModel()
+    
+    def update_note(self, note_id: int, title: str, content: str, priority: int) -> bool:
+        """
+        Replace a note's record with an edited copy and repaint its row.
+        
+        Args:
+            note_id (int): The ID of the edited note
+            title (str): New note title
+            content (str): New note content
+            priority (int): New priority level
+            
+        Returns:
+            bool: True if the note was in the model
+        """
+        row = self.row_for_id(note_id)
+        if row < 0:
+            return False
+        self._notes[row] = self._notes[row].with_changes(title, content, priority)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
+    
+    def remove_note(self, note_id: int) -> bool:
+        """
+        Remove a single note's row without resetting the model.
+        
+        Args:
+            note_id (int): The ID of the note to remove
+            
+        Returns:
+            bool: True if the note was in the model
+        """
+        row = self.row_for_id(note_id)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._notes[row]
+        self.endRemoveRows()
+        return True
+    
+    def notes(self) -> list:
+        """
+        Get the notes currently in the model.
+        
+        Returns:
+            list: NoteRec records in display order
+        """
+        return self._notes
+    
+    def row_for_id(self, note_id: int) -> int:
+        """
+        Find the row holding a note.
+        
+        Args:
+            note_id (int): The note ID to look for
+            
+        Returns:
+            int: Row index, or -1 if the note is not in the model
+        """
+        for row, note in enumerate(self._notes):
+            if note.id == note_id:
+                return row
+        return -1
+    
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Get the number of notes (flat list, so children have none).
+        """
+        return 0 if parent.isValid() else len(self._notes)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Get the data for a row.
+        
+        Args:
+            index (QModelIndex): The row index
+            role: Qt.ItemDataRole.DisplayRole or NotesModel.NoteRole
+            
+        Returns:
+            The note title, the NoteRec, or None
+        """
+        if not index.isValid() or not 0 <= index.row() < len(self._notes):
+            return None
+        
+        note = self._notes[index.row()]
+        if role == self.NoteRole:
+            return note
+        if role == Qt.ItemDataRole.DisplayRole:
+            return note.title
+        return None
+
+
+class NoteDelegate(QStyledItemDelegate):
+    """
+    Paints note cards directly with QPainter for a virtualized notes list.
+    
+    Only rows in the viewport are painted and no child widgets exist per
+    note, so layout and paint cost scale with the visible rows rather than
+    the total note count. Card buttons (Edit, Del, Copy and the inline
+    delete confirmation) are painted too and hit-tested in editorEvent.
+    Editing is delegated back to the view owner through edit_requested,
+    which typically shows a real note widget for that single row.
+    """
+    
+    # Signals for the view owner
+    edit_requested = pyqtSignal(int)     # Emitted with the note ID when Edit is clicked
+    delete_requested = pyqtSignal(int)   # Emitted with the note ID once deletion is confirmed
+    copy_requested = pyqtSignal(str)     # Emitted with the note content when Copy is clicked
+    
+    # Card geometry (pixels)
+    _CARD_MARGIN = 3
+    _PADDING = 8
+    _SPACING = 4
+    _PILL_GAP = 6
+    _BUTTON_HEIGHT = 22
+    _SHOW_ALL_SIZE = (60, 18)
+    
+    # Button name -> (label, width, color). One set of painted buttons serves
+    # every row: clicks are hit-tested in editorEvent and emitted with the
+    # row's note ID, so no button widgets or per-note connections exist.
+    _BUTTONS = {
+        'edit': ("Edit", 50, QColor("#4a90e2")),
+        'delete': ("Del", 40, QColor("#e74c3c")),
+        'copy': ("Copy", 50, QColor("#8e44ad")),
+        'confirm_yes': ("Yes", 45, QColor("#e74c3c")),
+        'confirm_no': ("No", 45, QColor("#95a5a6")),
+    }
+    
+    # Paint colors, built once instead of parsed from strings on every paint
+    _CARD_BORDER_COLOR = QColor("#e0e0e0")
+    _CARD_COLOR = QColor("#ffffff")
+    _TITLE_COLOR = QColor("#2c3e50")
+    _CONTENT_COLOR = QColor("#333333")
+    _DATE_COLOR = QColor("#7f8c8d")
+    _CONFIRM_COLOR = QColor("#c0392b")
+    _SHOW_ALL_COLOR = QColor("#d1d0cf")
+    _BUTTON_TEXT_COLOR = QColor("white")
+    
+    # Text layout flags (plain ints so they can be combined)
+    _WRAP_FLAGS = (Qt.AlignmentFlag.AlignLeft.value | Qt.AlignmentFlag.AlignTop.value
+                   | Qt.TextFlag.TextWordWrap.value)
+    _CENTER_FLAGS = Qt.AlignmentFlag.AlignCenter.value
+    _MAX_TEXT_HEIGHT = 1 << 20
+    
+    def __init__(self, parent=None, compact: bool = False):
+        """
+        Initialize the note delegate.
+        
+        Args:
+            parent: Parent QObject (usually the view)
+            compact (bool): If True, truncate long content behind a "show all" toggle
+        """
+        super().__init__(parent)
+        self.compact = compact
+        
+        # Per-note view state
+        self._expanded_ids = set()      # Compact notes expanded with "show all"
+        self._confirm_delete_id = None  # Note showing the inline delete confirmation
+        self.editor_heights = {}        # note_id -> height of an open editor widget
+        
+        # Measured card heights for the current view width
+        self._height_cache = {}
+        self._height_cache_width = None
+    
+    def reset_state(self):
+        """
+        Forget per-note view state (call when the model is reset).
+        """
+        self._expanded_ids.clear()
+        self._confirm_delete_id = None
+        self.editor_heights.clear()
+        self._height_cache.clear()
+    
+    def forget_note(self, note_id: int):
+        """
+        Forget the view state of a single note (call when its row is removed).
+        
+        Args:
+            note_id (int): The ID of the removed note
+        """
+        self._expanded_ids.discard(note_id)
+        if self._confirm_delete_id == note_id:
+            self._confirm_delete_id = None
+        self.editor_heights.pop(note_id, None)
+    
+    def _fonts(self, option):
+        """
+        Resolve the shared note fonts against the view's font.
+        
+        Returns:
+            tuple: (title, content, date, button, badge) fonts
+        """
+        base = option.font
+        return (_TITLE_FONT.resolve(base), _CONTENT_FONT.resolve(base),
+                _DATE_FONT.resolve(base), _BTN_FONT.resolve(base),
+                _BADGE_FONT.resolve(base))
+    
+    def _content_text(self, note: NoteRec, metrics: QFontMetrics, width: int):
+        """
+        Get the content text to show and whether a show all/less toggle applies.
+        
+        Args:
+            note (NoteRec): The note being laid out
+            metrics (QFontMetrics): Metrics of the content font
+            width (int): Width of the content area in pixels
+        
+        Returns:
+            tuple: (text, has_toggle)
+        """
+        content = note.content
+        if not self.compact or len(content) <= _COMPACT_PREVIEW_CHARS:
+            return content, False
+        if note.id in self._expanded_ids:
+            return content, True
+        return _elide_preview(content, metrics, width), True
+    
+    def _layout(self, rect: QRect, note: NoteRec, option) -> dict:
+        """
+        Compute the card geometry for a note.
+        
+        Shared by sizeHint, paint and editorEvent so hit-testing always matches
+        what was painted.
+        
+        Args:
+            rect (QRect): The item rectangle (only left, top and width are used)
+            note (NoteRec): The note to lay out
+            option: The style option (for fonts)
+            
+        Returns:
+            dict: Rectangles, texts and the total item height
+        """
+        title_font, content_font, date_font, btn_font, badge_font = self._fonts(option)
+        
+        card = QRect(rect.left() + self._CARD_MARGIN, rect.top() + self._CARD_MARGIN,
+                     max(rect.width() - 2 * self._CARD_MARGIN, 1), 0)
+        left = card.left() + self._PADDING
+        width = max(card.width() - 2 * self._PADDING, 1)
+        y = card.top() + self._PADDING
+        
+        # Header: wrapped title with the priority pill on the right
+        pill_w, pill_h = _PRIORITY_PILL_SIZE
+        title_w = max(width - pill_w - self._PILL_GAP, 1)
+        title_h = QFontMetrics(title_font).boundingRect(
+            QRect(0, 0, title_w, self._MAX_TEXT_HEIGHT), self._WRAP_FLAGS, note.title).height()
+        title_rect = QRect(left, y, title_w, max(title_h, pill_h))
+        pill_rect = QRect(left + width - pill_w, y, pill_w, pill_h)
+        y += title_rect.height() + self._SPACING
+        
+        # Content, optionally truncated, with the show all/less toggle below it
+        content_metrics = QFontMetrics(content_font)
+        content_text, has_toggle = self._content_text(note, content_metrics, width)
+        content_h = content_metrics.boundingRect(
+            QRect(0, 0, width, self._MAX_TEXT_HEIGHT), self._WRAP_FLAGS, content_text).height()
+        content_rect = QRect(left, y, width, content_h)
+        y += content_h + self._SPACING
+        
+        show_all_rect = None
+        if has_toggle:
+            toggle_w, toggle_h = self._SHOW_ALL_SIZE
+            show_all_rect = QRect(left + width - toggle_w, y, toggle_w, toggle_h)
+            y += toggle_h + self._SPACING
+        
+        # Date line
+        date_h = QFontMetrics(date_font).height()
+        date_rect = QRect(left, y, width, date_h)
+        y += date_h + self._SPACING
+        
+        # Action row: Edit/Del on the left, Copy on the right - or the delete confirmation
+        buttons = {}
+        confirm_rect = None
+        if note.id == self._confirm_delete_id:
+            right = left + width
+            for name in ('confirm_no', 'confirm_yes'):
+                button_w = self._BUTTONS[name][1]
+                right -= button_w
+                buttons[name] = QRect(right, y, button_w, self._BUTTON_HEIGHT)
+                right -= 3
+            confirm_rect = QRect(left, y, max(right - left, 1), self._BUTTON_HEIGHT)
         else:
-            # Show full content (non-compact mode)
-            self.content_display_label.setText(content)
-            self.show_all_btn.hide()
+            x = left
+            for name in ('edit', 'delete'):
+                button_w = self._BUTTONS[name][1]
+                buttons[name] = QRect(x, y, button_w, self._BUTTON_HEIGHT)
+                x += button_w + 3
+            copy_w = self._BUTTONS['copy'][1]
+            buttons['copy'] = QRect(left + width - copy_w, y, copy_w, self._BUTTON_HEIGHT)
+        y += self._BUTTON_HEIGHT + self._PADDING
+        
+        card.setBottom(y)
+        return {
+            'height': y + self._CARD_MARGIN - rect.top(),
+            'card': card,
+            'title': title_rect,
+            'pill': pill_rect,
+            'content': content_rect,
+            'content_text': content_text,
+            'show_all': show_all_rect,
+            'date': date_rect,
+            'buttons': buttons,
+            'confirm': confirm_rect,
+            'fonts': (title_font, content_font, date_font, btn_font, badge_font),
+        }
+    
+    def _view_width(self, option) -> int:
+        """
+        Get the width available to a card.
+        """
+        if option.rect.width() > 0:
+            return option.rect.width()
+        if option.widget is not None:
+            return option.widget.viewport().width()
+        return 300
+    
+    def sizeHint(self, option, index):
+        """
+        Get the card size for a row, using cached measurements when possible.
+        """
+        note = index.data(NotesModel.NoteRole)
+        if note is None:
+            return super().sizeHint(option, index)
+        
+        width = self._view_width(option)
+        
+        # Rows with an open editor widget take the editor's height
+        if note.id in self.editor_heights:
+            return QSize(width, self.editor_heights[note.id] + 2 * self._CARD_MARGIN)
+        
+        if width != self._height_cache_width:
+            self._height_cache.clear()
+            self._height_cache_width = width
+        
+        key = (note.id, note.title, note.content, note.id in self._expanded_ids)
+        height = self._height_cache.get(key)
+        if height is None:
+            height = self._layout(QRect(0, 0, width, 0), note, option)['height']
+            self._height_cache[key] = height
+        return QSize(width, height)
+    
+    def paint(self, painter, option, index):
+        """
+        Paint a note card.
+        """
+        note = index.data(NotesModel.NoteRole)
+        if note is None:
+            super().paint(painter, option, index)
+            return
+        
+        # Rows with an open editor are covered by the editor widget
+        if note.id in self.editor_heights:
+            return
+        
+        parts = self._layout(option.rect, note, option)
+        title_font, content_font, date_font, btn_font, badge_font = parts['fonts']
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Card background and border
+        painter.setPen(self._CARD_BORDER_COLOR)
+        painter.setBrush(self._CARD_COLOR)
+        painter.drawRoundedRect(QRectF(parts['card']).adjusted(0.5, 0.5, -0.5, -0.5), 6, 6)
+        
+        # Title and priority pill
+        painter.setFont(title_font)
+        painter.setPen(self._TITLE_COLOR)
+        painter.drawText(parts['title'], self._WRAP_FLAGS, note.title)
+        painter.drawPixmap(parts['pill'].topLeft(), _priority_pixmap(note.priority))
+        
+        # Content
+        painter.setFont(content_font)
+        painter.setPen(self._CONTENT_COLOR)
+        painter.drawText(parts['content'], self._WRAP_FLAGS, parts['content_text'])
+        
+        if parts['show_all'] is not None:
+            label = "show less" if note.id in self._expanded_ids else "show all"
+            self._draw_button(painter, parts['show_all'], label, self._SHOW_ALL_COLOR, badge_font)
+        
+        # Date
+        painter.setFont(date_font)
+        painter.setPen(self._DATE_COLOR)
+        painter.drawText(parts['date'], self._WRAP_FLAGS, _format_note_dates(note.created_at, note.updated_at))
+        
+        # Action row
+        if parts['confirm'] is not None:
+            painter.setFont(btn_font)
+            painter.setPen(self._CONFIRM_COLOR)
+            painter.drawText(parts['confirm'], Qt.AlignmentFlag.AlignLeft.value | Qt.AlignmentFlag.AlignVCenter.value,
+                             "Delete this note?")
+        for name, rect in parts['buttons'].items():
+            label, _, color = self._BUTTONS[name]
+            self._draw_button(painter, rect, label, color, btn_font)
+        
+        painter.restore()
+    
+    def _draw_button(self, painter, rect: QRect, label: str, color: QColor, font: QFont):
+        """
+        Paint a flat rounded button.
+        """
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(QRectF(rect), 3, 3)
+        painter.setFont(font)
+        painter.setPen(self._BUTTON_TEXT_COLOR)
+        painter.drawText(rect, self._CENTER_FLAGS, label)
+    
+    def editorEvent(self, event, model, option, index):
+        """
+        Hit-test clicks against the painted card buttons.
+        """
+        if (event.type() != QEvent.Type.MouseButtonRelease
+                or event.button() != Qt.MouseButton.LeftButton):
+            return False
+        
+        note = index.data(NotesModel.NoteRole)
+        if note is None or note.id in self.editor_heights:
+            return False
+        
+        parts = self._layout(option.rect, note, option)
+        pos = event.position().toPoint()
+        
+        if parts['show_all'] is not None and parts['show_all'].contains(pos):
+            self._expanded_ids.symmetric_difference_update((note.id,))
+            self.sizeHintChanged.emit(index)
+            return True
+        
+        for name, rect in parts['buttons'].items():
+            if not rect.contains(pos):
+                continue
+            if name == 'edit':
+                self.edit_requested.emit(note.id)
+            elif name == 'copy':
+                self.copy_requested.emit(note.content)
+            elif name == 'delete':
+                self._confirm_delete_id = note.id
+                self.sizeHintChanged.emit(index)
+            elif name == 'confirm_no':
+                self._confirm_delete_id = None
+                self.sizeHintChanged.emit(index)
+            elif name == 'confirm_yes':
+                self._confirm_delete_id = None
+                self.delete_requested.emit(note.id)
+            return True
+        
+        return False
+
+
+class NotesListView(QListView):
+    """
+    Virtualized notes list shared by the dashboard and the notes window.
+    
+    Wires a NotesModel to a NoteDelegate so only the rows inside the
+    viewport are painted, and owns the single in-place editor widget that
+    is shown over a row while its note is being edited. Database writes are
+    left to the owner through the re-emitted note signals.
+    """
+    
+    # Signals for the view owner
+    note_updated = pyqtSignal(int, str, str, int)  # Emitted when a note is saved (id, content, title, priority)
+    note_deleted = pyqtSignal(int)                 # Emitted once deletion of a note is confirmed
+    note_copied = pyqtSignal(str)                  # Emitted with the note content when Copy is clicked
+    
+    def __init__(self, parent=None, compact: bool = False, editor_class=EditableNoteWidget,
+                 scrollbar_width: Optional[int] = 12):
+        """
+        Initialize the notes list view.
+        
+        Args:
+            parent: Parent widget (optional)
+            compact (bool): If True, paint truncated cards with a "show all" toggle
+            editor_class: EditableNoteWidget subclass used as the in-place editor
+            scrollbar_width (Optional[int]): Width of the vertical scrollbar in pixels,
+                                             or None to leave the scrollbar to the
+                                             owning window's stylesheet
+        """
+        super().__init__(parent)
+        self.editor_class = editor_class
+        
+        # ID of the note whose editor widget is open
+        self._editing_note_id = None
+        
+        self.notes_model = NotesModel(self)
+        self.note_delegate = NoteDelegate(self, compact=compact)
+        # Queued so the model isn't reset from inside the view's own mouse handling
+        self.note_delegate.edit_requested.connect(
+            self._open_note_editor, Qt.ConnectionType.QueuedConnection)
+        self.note_delegate.delete_requested.connect(
+            self.note_deleted, Qt.ConnectionType.QueuedConnection)
+        self.note_delegate.copy_requested.connect(self.note_copied)
+        
+        self.setModel(self.notes_model)
+        self.setItemDelegate(self.note_delegate)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        qss = _NOTE_CARD_QSS + """
+            QListView {
+                border: none;
+                background: transparent;
+            }
+        """
+        if scrollbar_width is not None:
+            radius = scrollbar_width // 2
+            qss += f"""
+            QScrollBar:vertical {{
+                background: #f1f3f4;
+                width: {scrollbar_width}px;
+                border-radius: {radius}px;
+            }}
+            QScrollBar::handle:vertical {{
+                background: #bdc3c7;
+                border-radius: {radius}px;
+                min-height: 20px;
+            }}
+            QScrollBar::handle:vertical:hover {{
+                background: #95a5a6;
+            }}
+        """
+        self.setStyleSheet(qss)
+    
+    def set_notes(self, notes):
+        """
+        Replace the listed notes.
+        
+        Resetting the model drops any open editor widget along with the
+        delegate's per-row view state. Notes equal to the ones already listed
+        (e.g. a refresh after remove_note) leave the model untouched.
+        
+        Args:
+            notes: List of NoteRec records in display order
+        """
+        if notes == self.notes_model.notes():
+            return
+        self._editing_note_id = None
+        self.note_delegate.reset_state()
+        self.notes_model.set_notes(notes)
+    
+    def remove_note(self, note_id: int):
+        """
+        Remove a single note from the list, leaving the other rows alone.
+        
+        Args:
+            note_id (int): The ID of the deleted note
+        """
+        if note_id == self._editing_note_id:
+            self._close_note_editor()
+        self.note_delegate.forget_note(note_id)
+        self.notes_model.remove_note(note_id)
+    
+    def _open_note_editor(self, note_id: int):
+        """
+        Show an editable note widget over a row of the list.
+        
+        The list itself is painted by NoteDelegate; only the note being edited
+        gets a real widget, installed as the row's index widget.
+        
+        Args:
+            note_id (int): The ID of the note to edit
+        """
+        # Only one editor at a time
+        self._close_note_editor()
+        
+        row = self.notes_model.row_for_id(note_id)
+        if row < 0:
+            return
+        index = self.notes_model.index(row)
+        note = self.notes_model.notes()[row]
+        
+        # Parented to the viewport up front so the view's card stylesheet
+        # applies before the editor's size hint is taken
+        editor = self.editor_class(note, self.viewport())
+        editor.note_updated.connect(self._on_note_saved)
+        editor.note_updated.connect(self.note_updated)
+        editor.note_copied.connect(self.note_copied)
+        editor.editing_finished.connect(self._close_note_editor)
+        editor.toggle_edit_mode()
+        
+        # Size the row to the editor before showing it
+        self.note_delegate.editor_heights[note_id] = editor.sizeHint().height()
+        self.note_delegate.sizeHintChanged.emit(index)
+        
+        self._editing_note_id = note_id
+        self.setIndexWidget(index, editor)
+        self.scrollTo(index)
     
-    def _toggle_content_display(self):
+    @pyqtSlot(int, str, str, int)
+    def _on_note_saved(self, note_id: int, content: str, title: str, priority: int):
         """
-        Toggle between truncated and full content display in compact mode.
+        Show a saved edit right away by putting an edited record in the model.
+        
+        Records are immutable, so the row would otherwise keep painting the
+        old record until the owner reloads the notes after the write is
+        committed.
+        
+        Args:
+            note_id (int): The ID of the saved note
+            content (str): The new content
+            title (str): The new title
+            priority (int): The new priority level
         """
-        if self.is_compact:
-            self.is_content_expanded = not self.is_content_expanded
-            self._update_content_display()
+        self.notes_model.update_note(note_id, title, content, priority)
+    
+    @pyqtSlot()
+    def _close_note_editor(self):
+        """
+        Remove the open note editor (if any) and restore the painted card.
+        """
+        note_id = self._editing_note_id
+        if note_id is None:
+            return
+        self._editing_note_id = None
+        self.note_delegate.editor_heights.pop(note_id, None)
+        
+        row = self.notes_model.row_for_id(note_id)
+        if row < 0:
+            return
+        index = self.notes_model.index(row)
+        editor = self.indexWidget(index)
+        if editor is not None:
+            editor.deleteLater()
+        self.note_delegate.sizeHintChanged.emit(index)
 
 
 class AddNoteDialog(QDialog):
@@ -633,6 +1394,9 @@ class AddNoteDialog(QDialog):
         """
         Set up the user interface for the add note dialog.
         """
+        # One stylesheet for the whole dialog (children are styled by object name)
+        self.setStyleSheet(_ADD_NOTE_DIALOG_QSS)
+        
         # Main layout
         layout = QVBoxLayout()
         layout.setSpacing(12)
@@ -640,14 +1404,7 @@ class AddNoteDialog(QDialog):
         
         # Title label
         title_label = QLabel("Add New Note")
-        title_label.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                color: #2c3e50;
-                margin-bottom: 10px;
-            }
-        """)
+        title_label.setObjectName("addNoteHeading")
         layout.addWidget(title_label)
         
         # Title and priority input layout
@@ -657,47 +1414,14 @@ class AddNoteDialog(QDialog):
         # Title input
         self.title_input = QLineEdit()
         self.title_input.setPlaceholderText("Note title (optional)...")
-        self.title_input.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #d1d5db;
-                border-radius: 6px;
-                padding: 10px;
-                font-size: 14px;
-                font-weight: bold;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QLineEdit:focus {
-                border-color: #4a90e2;
-                outline: none;
-            }
-        """)
+        self.title_input.setObjectName("addNoteTitle")
         
         # Priority input
         self.priority_input = QComboBox()
         self.priority_input.addItems(["1", "2", "3"])
         self.priority_input.setCurrentIndex(0)  # Default to 1
         self.priority_input.setMaximumWidth(80)
-        self.priority_input.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #d1d5db;
-                border-radius: 6px;
-                padding: 10px;
-                font-size: 13px;
-                background-color: #ffffff;
-                color: #2c3e50;
-            }
-            QComboBox:focus {
-                border-color: #4a90e2;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-            }
-        """)
+        self.priority_input.setObjectName("addNotePriority")
         
         title_priority_layout.addWidget(self.title_input)
         title_priority_layout.addWidget(self.priority_input)
@@ -705,33 +1429,13 @@ class AddNoteDialog(QDialog):
         
         # Content input
         content_label = QLabel("Content:")
-        content_label.setStyleSheet("""
-            QLabel {
-                font-size: 13px;
-                color: #2c3e50;
-                margin-top: 5px;
-            }
-        """)
+        content_label.setObjectName("addNoteContentLabel")
         layout.addWidget(content_label)
         
-        self.content_input = QTextEdit()
+        self.content_input = QPlainTextEdit()  # Plain text only - no rich-text document
         self.content_input.setPlaceholderText("Enter note content...")
         self.content_input.setMaximumHeight(120)
-        self.content_input.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #d1d5db;
-                border-radius: 6px;
-                padding: 10px;
-                font-size: 14px;
-                background-color: #ffffff;
-                color: #2c3e50;
-                line-height: 1.4;
-            }
-            QTextEdit:focus {
-                border-color: #4a90e2;
-                outline: none;
-            }
-        """)
+        self.content_input.setObjectName("addNoteContent")
         layout.addWidget(self.content_input)
         
         # Button layout
@@ -742,39 +1446,13 @@ class AddNoteDialog(QDialog):
         cancel_btn = QPushButton("Cancel")
         cancel_btn.setMinimumHeight(35)
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background: #95a5a6;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #7f8c8d;
-            }
-        """)
+        cancel_btn.setObjectName("addNoteCancelBtn")
         
         # Add button
         add_btn = QPushButton("Add Note")
         add_btn.setMinimumHeight(35)
         add_btn.clicked.connect(self.accept_note)
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background: #27ae60;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #229954;
-            }
-        """)
+        add_btn.setObjectName("addNoteAddBtn")
         
         button_layout.addWidget(cancel_btn)
         button_layout.addStretch()
@@ -7,6 +7,7 @@ dashboard features, their order, and layout.
 
 import json
 import os
+import re
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QListWidget, QListWidgetItem,
                              QComboBox, QSpinBox, QCheckBox, QFrame, QMessageBox,
@@ -15,6 +16,12 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
 
+# Patterns used to rewrite the smart response visibility line in config.py,
+# compiled once instead of on every save
+_VISIBILITY_SETTING_RE = re.compile(r'SMART_RESPONSE_VISIBILITY\s*=\s*["\']([^"\']+)["\']')
+_DEFAULT_TYPE_SETTING_RE = re.compile(r'(SMART_RESPONSE_DEFAULT_TYPE\s*=\s*["\'][^"\']+["\']\s*\n)')
+
+
 class SettingsWindow(QMainWindow):
     """
     Settings window for configuring dashboard features and layout.
@@ -537,18 +544,14 @@ class SettingsWindow(QMainWindow):
             visibility = self.current_settings.get('smart_response_visibility', 'popup')
             
             # Update the SMART_RESPONSE_VISIBILITY line
-            import re
-            pattern = r'SMART_RESPONSE_VISIBILITY\s*=\s*["\']([^"\']+)["\']'
             replacement = f'SMART_RESPONSE_VISIBILITY = "{visibility}"'
             
-            if re.search(pattern, config_content):
-                # Replace existing setting
-                new_content = re.sub(pattern, replacement, config_content)
-            else:
+            # subn does the search and the replace in a single scan
+            new_content, count = _VISIBILITY_SETTING_RE.subn(replacement, config_content)
+            if not count:
                 # Add setting after SMART_RESPONSE_DEFAULT_TYPE
-                pattern = r'(SMART_RESPONSE_DEFAULT_TYPE\s*=\s*["\'][^"\']+["\']\s*\n)'
                 replacement = f'\\1\n# Smart response visibility mode\n# Options: "hidden" - show nothing, no spinner or popup\n#          "popup" - show loading spinner and popup with response\nSMART_RESPONSE_VISIBILITY = "{visibility}"\n\n'
-                new_content = re.sub(pattern, replacement, config_content)
+                new_content = _DEFAULT_TYPE_SETTING_RE.sub(replacement, config_content)
             
             # Write updated config file
             with open(config_file, 'w', encoding='utf-8') as f:
@@ -5,10 +5,12 @@ This module contains window classes for the SnapPad application.
 """
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QLabel, QLineEdit, QComboBox, QFrame, QScrollArea, 
+                             QLabel, QLineEdit, QComboBox, QFrame, 
                              QTabWidget, QApplication, QMessageBox, QPushButton, QTextEdit)
-from PyQt6.QtCore import Qt
-from .notes import EditableNoteWidget
+from PyQt6.QtCore import Qt, QTimer, QThreadPool, pyqtSlot
+from PyQt6.QtGui import QTextCursor
+from .notes import EditableNoteWidget, NotesListView, DEFAULT_NOTE_SORT, note_sort_model
+from .workers import FilterSortTask
 
 
 class NotesWindow(QMainWindow):
@@ -33,6 +35,23 @@ class NotesWindow(QMainWindow):
         self.parent_dashboard = parent
         self.database_manager = None
         
+        # Notes from the last database fetch, reused until the database's
+        # notes_version changes (searching/sorting never re-queries)
+        self._cached_notes = None
+        self._cached_notes_version = -1
+        
+        # Filtering runs in the thread pool; only the newest generation's
+        # result is shown, and the newest task is kept alive until it reports
+        self._filter_generation = 0
+        self._filter_task = None
+        
+        # Set while a deferred refresh after a note write is queued
+        self._refresh_pending = False
+        
+        # Set when a refresh was skipped because another tab was showing;
+        # the All Notes tab catches up when it is selected
+        self._notes_dirty = False
+        
         # Setup UI and window properties
         self.setup_ui()
         self.setup_window_properties()
@@ -117,20 +136,17 @@ class NotesWindow(QMainWindow):
                 border-color: #4a90e2;
             }
         """)
-        self.all_notes_search_input.textChanged.connect(self.refresh_all_notes)
+        
+        # Debounce search typing - refilter once the user pauses instead of per keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._refilter_all_notes)
+        self.all_notes_search_input.textChanged.connect(self._schedule_search_refilter)
         
         # Sort dropdown for All Notes
         self.all_notes_sort_combo = QComboBox()
-        self.all_notes_sort_combo.addItems([
-            "Updated (newest)",
-            "Updated (oldest)", 
-            "Created (newest)",
-            "Created (oldest)",
-            "Priority (high)",
-            "Priority (low)",
-            "Title (A-Z)",
-            "Title (Z-A)"
-        ])
+        self.all_notes_sort_combo.setModel(note_sort_model())
         self.all_notes_sort_combo.setCurrentIndex(0)
         self.all_notes_sort_combo.setMaximumWidth(150)
         self.all_notes_sort_combo.setStyleSheet("""
@@ -153,7 +169,7 @@ class NotesWindow(QMainWindow):
                 border: none;
             }
         """)
-        self.all_notes_sort_combo.currentTextChanged.connect(self.refresh_all_notes)
+        self.all_notes_sort_combo.currentTextChanged.connect(self._refilter_all_notes)
         
         all_notes_search_layout.addWidget(self.all_notes_search_input)
         all_notes_search_layout.addWidget(self.all_notes_sort_combo)
@@ -174,39 +190,30 @@ class NotesWindow(QMainWindow):
         all_notes_container_layout.setSpacing(6)
         all_notes_container_layout.setContentsMargins(4, 4, 4, 4)
         
-        # Notes scroll area for All Notes tab
-        self.all_notes_scroll = QScrollArea()
-        self.all_notes_scroll.setWidgetResizable(True)
-        self.all_notes_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.all_notes_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.all_notes_scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
+        # Empty-state label, shown in place of the notes list when there is nothing to list
+        self.all_notes_empty_label = QLabel()
+        self.all_notes_empty_label.setStyleSheet("""
+            QLabel {
+                color: #7f8c8d; 
+                font-style: italic; 
+                font-size: 14px;
+                padding: 20px;
                 background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #f1f3f4;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical {
-                background: #bdc3c7;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #95a5a6;
+                text-align: center;
             }
         """)
-        
-        self.all_notes_content = QWidget()
-        self.all_notes_content_layout = QVBoxLayout()
-        self.all_notes_content_layout.setSpacing(6)
-        self.all_notes_content_layout.setContentsMargins(4, 4, 4, 4)
-        self.all_notes_content.setLayout(self.all_notes_content_layout)
-        self.all_notes_scroll.setWidget(self.all_notes_content)
-        
-        all_notes_container_layout.addWidget(self.all_notes_scroll)
+        self.all_notes_empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.all_notes_empty_label.hide()
+        
+        # Virtualized notes list: cards are painted by NoteDelegate, so only
+        # visible rows cost anything and no widgets are built per note
+        self.all_notes_view = NotesListView(editor_class=EditableNoteWidget)
+        self.all_notes_view.note_updated.connect(self.update_note)
+        self.all_notes_view.note_deleted.connect(self.delete_note)
+        self.all_notes_view.note_copied.connect(self.copy_to_clipboard)
+        
+        all_notes_container_layout.addWidget(self.all_notes_empty_label)
+        all_notes_container_layout.addWidget(self.all_notes_view)
         self.all_notes_container.setLayout(all_notes_container_layout)
         
         all_notes_layout.addLayout(all_notes_search_layout)
@@ -549,6 +556,7 @@ class NotesWindow(QMainWindow):
         self.tab_widget.addTab(self.all_notes_tab, "📝 All Notes")
         self.tab_widget.addTab(self.enhanced_prompts_tab, "🤖 Enhanced Prompts")
         self.tab_widget.addTab(self.smart_response_tab, "🧠 Smart Response")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         # Add to main layout
         main_layout.addLayout(header_layout)
@@ -583,100 +591,134 @@ class NotesWindow(QMainWindow):
             database_manager: The database manager instance
         """
         self.database_manager = database_manager
-        self.refresh_all_notes()
+        # Note writes from anywhere (this window, the dashboard, hotkeys)
+        # schedule a refresh of this window
+        database_manager.add_notes_callback(self._schedule_refresh)
+        self.refresh_current_tab()
+    
+    def refresh_current_tab(self):
+        """
+        Refresh the tab being shown.
+        
+        Only the All Notes tab shows database content; while another tab is
+        showing, the notes are just marked dirty and refreshed once the All
+        Notes tab is selected.
+        """
+        if self.tab_widget.currentWidget() is self.all_notes_tab:
+            self.refresh_all_notes()
+        else:
+            self._notes_dirty = True
     
-    def _filter_and_sort_notes(self, notes, search_input=None, sort_combo=None):
+    def _on_tab_changed(self, index: int):
         """
-        Filter and sort notes based on search and sort criteria.
+        Catch up on a notes refresh skipped while another tab was showing.
+        
+        Args:
+            index (int): Index of the newly selected tab
+        """
+        if self._notes_dirty and self.tab_widget.widget(index) is self.all_notes_tab:
+            self.refresh_all_notes()
+    
+    def _filter_criteria(self, search_input=None, sort_combo=None):
+        """
+        Read the search and sort criteria from the filter widgets.
         
         Args:
-            notes: List of note dictionaries
             search_input: The search input widget (optional)
             sort_combo: The sort combo box widget (optional)
             
         Returns:
-            List of filtered and sorted notes
+            tuple: (lower-cased search term, sort option)
         """
-        # Filter by search term
         search_term = ""
         if search_input and hasattr(search_input, 'text'):
             search_term = search_input.text().strip().lower()
         
-        if search_term:
-            notes = [note for note in notes 
-                    if search_term in note['title'].lower() or 
-                       search_term in note['content'].lower()]
-        
-        # Sort based on selected criteria
-        sort_option = "Updated (newest)"  # Default
+        sort_option = DEFAULT_NOTE_SORT
         if sort_combo and hasattr(sort_combo, 'currentText'):
             sort_option = sort_combo.currentText()
         
-        if sort_option == "Updated (newest)":
-            notes.sort(key=lambda x: x['updated_at'], reverse=True)
-        elif sort_option == "Updated (oldest)":
-            notes.sort(key=lambda x: x['updated_at'], reverse=False)
-        elif sort_option == "Created (newest)":
-            notes.sort(key=lambda x: x['created_at'], reverse=True)
-        elif sort_option == "Created (oldest)":
-            notes.sort(key=lambda x: x['created_at'], reverse=False)
-        elif sort_option == "Priority (high)":
-            notes.sort(key=lambda x: x['priority'], reverse=True)
-        elif sort_option == "Priority (low)":
-            notes.sort(key=lambda x: x['priority'], reverse=False)
-        elif sort_option == "Title (A-Z)":
-            notes.sort(key=lambda x: x['title'].lower(), reverse=False)
-        elif sort_option == "Title (Z-A)":
-            notes.sort(key=lambda x: x['title'].lower(), reverse=True)
-        
-        return notes
+        return search_term, sort_option
+    
+    def _schedule_search_refilter(self):
+        """
+        Restart the search debounce timer after a keystroke.
+        
+        Each keystroke pushes the refilter back, so a burst of typing results
+        in a single refresh 150 ms after the last key.
+        """
+        self._search_timer.start()
+    
+    def _refilter_all_notes(self):
+        """
+        Re-apply search and sort to the notes list.
+        
+        Connected to the search box and sort combo. Notes only change through
+        the database, so this reuses the cached notes unless they are stale.
+        """
+        self.refresh_all_notes()
     
     def refresh_all_notes(self):
         """
         Refresh the display of all notes in the All Notes tab.
+        
+        Notes are fetched from the database only when its notes_version has
+        changed since the last fetch; otherwise the cached notes are reused.
+        Filtering and sorting run in the thread pool and the list is updated
+        by _on_notes_filtered once the result arrives.
         """
         if not self.database_manager:
             return
+        self._notes_dirty = False
+        
+        # Get (only if changed), filter, and sort notes
+        version = self.database_manager.notes_version
+        if self._cached_notes is None or version != self._cached_notes_version:
+            self._cached_notes = self.database_manager.get_all_notes()
+            self._cached_notes_version = version
+        
+        # Hand filtering to the pool; any task still running becomes stale
+        search_term, sort_option = self._filter_criteria(self.all_notes_search_input,
+                                                         self.all_notes_sort_combo)
+        self._filter_generation += 1
+        task = FilterSortTask(self._filter_generation, self._cached_notes, search_term, sort_option)
+        task.signals.finished.connect(self._on_notes_filtered, Qt.ConnectionType.QueuedConnection)
+        self._filter_task = task
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_notes_filtered(self, generation: int, notes: list):
+        """
+        Show the result of a filter task if it is still the newest one.
         
-        # Clear existing notes
-        for i in reversed(range(self.all_notes_content_layout.count())):
-            child = self.all_notes_content_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
-        
-        # Get, filter, and sort notes
-        all_notes = self.database_manager.get_all_notes()
-        notes = self._filter_and_sort_notes(all_notes, self.all_notes_search_input, self.all_notes_sort_combo)
-        
-        if not notes:
-            # Check if we have notes but they're filtered out
-            if all_notes and self.all_notes_search_input.text().strip():
-                no_notes_label = QLabel("No notes match your search criteria.")
+        Args:
+            generation (int): Generation the task was started with
+            notes (list): Filtered and sorted notes
+        """
+        if generation != self._filter_generation:
+            return  # A newer search or refresh superseded this result
+        self._filter_task = None
+        all_notes = self._cached_notes
+        
+        # Hold repaints while the label/view swap and the model reset happen,
+        # so the tab is laid out and painted once instead of once per change
+        container = self.all_notes_view.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            if not notes:
+                # Check if we have notes but they're filtered out
+                if all_notes and self.all_notes_search_input.text().strip():
+                    self.all_notes_empty_label.setText("No notes match your search criteria.")
+                else:
+                    self.all_notes_empty_label.setText("No notes yet. Add your first note in the main dashboard!")
+                self.all_notes_empty_label.show()
+                self.all_notes_view.hide()
             else:
-                no_notes_label = QLabel("No notes yet. Add your first note in the main dashboard!")
+                self.all_notes_empty_label.hide()
+                self.all_notes_view.show()
             
-            no_notes_label.setStyleSheet("""
-                QLabel {
-                    color: #7f8c8d; 
-                    font-style: italic; 
-                    font-size: 14px;
-                    padding: 20px;
-                    background: transparent;
-                    text-align: center;
-                }
-            """)
-            no_notes_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.all_notes_content_layout.addWidget(no_notes_label)
-        else:
-            for note in notes:
-                note_widget = EditableNoteWidget(note)
-                note_widget.note_updated.connect(self.update_note)
-                note_widget.note_deleted.connect(self.delete_note)
-                note_widget.note_copied.connect(self.copy_to_clipboard)
-                self.all_notes_content_layout.addWidget(note_widget)
-        
-        # Add stretch to push items to top
-        self.all_notes_content_layout.addStretch()
+            self.all_notes_view.set_notes(notes)
+        finally:
+            container.setUpdatesEnabled(True)
     
     def enhance_prompt(self):
         """
@@ -700,15 +742,29 @@ class NotesWindow(QMainWindow):
         self.enhance_btn.setEnabled(False)
         self.enhance_btn.setText("Enhancing...")
         self.copy_enhanced_btn.setEnabled(False)
+        self.enhanced_prompt_display.clear()
         
-        # Create and start worker thread
+        # Create and start worker thread; the response is streamed into the
+        # display as it arrives
         from .workers import OpenAIWorker
-        self.openai_worker = OpenAIWorker(self.openai_manager, original_prompt)
+        self.openai_worker = OpenAIWorker(self.openai_manager, original_prompt, stream=True)
+        self.openai_worker.chunk_received.connect(self._append_enhanced_chunk)
         self.openai_worker.enhancement_complete.connect(self.on_enhancement_complete)
         self.openai_worker.enhancement_failed.connect(self.on_enhancement_failed)
         self.openai_worker.finished.connect(self.on_worker_finished)
         self.openai_worker.start()
     
+    def _append_enhanced_chunk(self, chunk: str):
+        """
+        Append a streamed piece of the enhanced prompt to its display.
+        
+        Args:
+            chunk (str): The next piece of the response
+        """
+        cursor = self.enhanced_prompt_display.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk)
+    
     def on_enhancement_complete(self, enhanced_prompt):
         """
         Handle successful prompt enhancement.
@@ -722,7 +778,7 @@ class NotesWindow(QMainWindow):
         
         # Automatically copy the enhanced prompt to clipboard
         if hasattr(self, 'clipboard_manager') and self.clipboard_manager:
-            self.clipboard_manager.copy_to_clipboard(enhanced_prompt)
+            self.copy_to_clipboard(enhanced_prompt)
             print(f"Enhanced prompt automatically copied to clipboard: {enhanced_prompt[:50]}...")
         
         # Replace the original prompt with the enhanced version
@@ -771,7 +827,7 @@ class NotesWindow(QMainWindow):
         """
         enhanced_text = self.enhanced_prompt_display.toPlainText()
         if enhanced_text and hasattr(self, 'clipboard_manager') and self.clipboard_manager:
-            self.clipboard_manager.copy_to_clipboard(enhanced_text)
+            self.copy_to_clipboard(enhanced_text)
             print("Enhanced prompt copied to clipboard")
             
             # Show feedback for manual copy
@@ -797,9 +853,16 @@ class NotesWindow(QMainWindow):
         """
         self.clipboard_manager = clipboard_manager
     
+    @pyqtSlot(int, str, str, int)
     def update_note(self, note_id: int, content: str, title: str, priority: int):
         """
-        Update a note in the database and refresh parent dashboard.
+        Update a note in the database.
+        
+        The write is handed to the dashboard, which queues it with its note
+        writer, so notes edited from either window are written in the order
+        they were made and the GUI thread never waits on the write lock.
+        The database manager notifies every notes view once the write is
+        committed, so no refresh is triggered here.
         
         Args:
             note_id (int): The unique identifier of the note to update
@@ -807,36 +870,69 @@ class NotesWindow(QMainWindow):
             title (str): The new title for the note
             priority (int): The new priority level for the note
         """
-        if self.database_manager:
-            self.database_manager.update_note(note_id, content, title, priority)
-            self.refresh_all_notes()
-            # Refresh parent dashboard if available
-            if self.parent_dashboard:
-                self.parent_dashboard.refresh_notes()
+        if self.parent_dashboard:
+            self.parent_dashboard.update_note(note_id, content, title, priority)
     
+    @pyqtSlot(int)
     def delete_note(self, note_id: int):
         """
-        Delete a note from the database and refresh displays.
+        Delete a note from the database.
+        
+        Like update_note, the delete is queued through the dashboard's note
+        writer. The row is removed from the list right away; the refresh that
+        the database manager's notes callbacks trigger once the delete is
+        committed then finds the list already up to date and leaves it alone.
+        The note is dropped from the cached notes as well.
         
         Args:
             note_id (int): The unique identifier of the note to delete
         """
-        if self.database_manager:
-            self.database_manager.delete_note(note_id)
-            self.refresh_all_notes()
-            # Refresh parent dashboard if available
-            if self.parent_dashboard:
-                self.parent_dashboard.refresh_notes()
+        if self.parent_dashboard:
+            self.parent_dashboard.delete_note(note_id)
+            self.all_notes_view.remove_note(note_id)
+            # Keep a search or sort before the commit from bringing it back
+            if self._cached_notes is not None:
+                self._cached_notes = [note for note in self._cached_notes if note.id != note_id]
+    
+    def _schedule_refresh(self):
+        """
+        Refresh this window once control returns to the event loop.
+        
+        Registered as a database notes callback. Every note write in the
+        current event-loop turn shares the single pending refresh. Nothing is
+        scheduled while the window is closed: reopening it goes through
+        set_database_manager, which refreshes it. While another tab is
+        showing, the All Notes tab is only marked dirty.
+        """
+        if self.isHidden():
+            return
+        if self.tab_widget.currentWidget() is not self.all_notes_tab:
+            self._notes_dirty = True
+            return
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_deferred_refresh)
+    
+    def _do_deferred_refresh(self):
+        """
+        Run the refresh scheduled by _schedule_refresh.
+        """
+        self._refresh_pending = False
+        self.refresh_all_notes()
     
+    @pyqtSlot(str)
     def copy_to_clipboard(self, text: str):
         """
-        Copy text to clipboard using parent dashboard's clipboard manager.
+        Copy text to clipboard through the parent dashboard.
+        
+        The dashboard writes the Qt clipboard directly and keeps its clipboard
+        manager's tracking in sync.
         
         Args:
             text (str): The text content to copy
         """
-        if self.parent_dashboard and self.parent_dashboard.clipboard_manager:
-            self.parent_dashboard.clipboard_manager.copy_to_clipboard(text)
+        if self.parent_dashboard:
+            self.parent_dashboard.copy_to_clipboard(text)
     
     # =============================================================================
     # SMART RESPONSE GENERATION METHODS
@@ -941,7 +1037,7 @@ class NotesWindow(QMainWindow):
         """
         response_text = self.smart_response_display.toPlainText()
         if response_text and hasattr(self, 'clipboard_manager') and self.clipboard_manager:
-            self.clipboard_manager.copy_to_clipboard(response_text)
+            self.copy_to_clipboard(response_text)
             print("Generated response copied to clipboard")
             
             # Show feedback for manual copy
@@ -962,7 +1058,7 @@ class NotesWindow(QMainWindow):
         
         # Automatically copy the generated response to clipboard
         if hasattr(self, 'clipboard_manager') and self.clipboard_manager:
-            self.clipboard_manager.copy_to_clipboard(generated_response)
+            self.copy_to_clipboard(generated_response)
             print(f"Generated response automatically copied to clipboard (hidden mode): {generated_response[:50]}...")
         
         # Replace the original input with the generated response
@@ -1,62 +1,150 @@
 """
 Background Worker Threads for SnapPad
 
-This module contains background worker threads for handling time-consuming operations
-without blocking the UI.
+This module contains background workers for handling time-consuming operations
+without blocking the UI: OpenAI requests on long-lived API threads, and
+note filtering and clipboard capture in the global thread pool.
 """
 
-from PyQt6.QtCore import QThread, pyqtSignal
+import logging
+import threading
 
+import keyboard
+from PyQt6.QtCore import QThread, QObject, QRunnable, pyqtSignal, pyqtSlot
 
-class OpenAIWorker(QThread):
+from .notes import filter_and_sort_notes
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)  # DEBUG messages are skipped before formatting
+
+
+# One long-lived thread per kind of API job, created on first use
+_api_threads = {}
+
+# Jobs that have been started but not finished; holds the only reference to
+# them so they aren't garbage collected while their thread runs them
+_active_jobs = set()
+
+
+def stop_api_threads(timeout_ms: int = 3000):
+    """
+    Stop the API threads (call once when the application quits).
+    
+    A request still in flight is given up to timeout_ms to complete.
+    
+    Args:
+        timeout_ms (int): How long to wait for each thread, in milliseconds
+    """
+    for thread in _api_threads.values():
+        thread.quit()
+        thread.wait(timeout_ms)
+    _api_threads.clear()
+
+
+class ApiJob(QObject):
+    """
+    One OpenAI request run on a shared, long-lived worker thread.
+    
+    Instead of spawning a QThread per request, start() moves the job onto
+    its class's API thread (started once and then reused) and runs it there
+    through a queued signal. Result signals are delivered to slots in the
+    GUI thread as queued calls. Like QThread, the job emits finished when
+    it is done, after its result signal.
+    """
+    
+    # Emitted in the worker thread once the job has run
+    finished = pyqtSignal()
+    
+    # Queued into the worker thread to run the job there
+    _run_requested = pyqtSignal()
+    
+    def start(self):
+        """
+        Queue the job on its API thread.
+        """
+        thread = _api_threads.get(type(self))
+        if thread is None:
+            thread = QThread()
+            thread.setObjectName(f"{type(self).__name__}Thread")
+            thread.start()
+            _api_threads[type(self)] = thread
+        
+        _active_jobs.add(self)
+        self.moveToThread(thread)
+        self._run_requested.connect(self._run_job)  # Queued: self now lives in thread
+        self._run_requested.emit()
+    
+    @pyqtSlot()
+    def _run_job(self):
+        """
+        Run the job in the worker thread, then release it.
+        """
+        try:
+            self.run()
+        finally:
+            self.finished.emit()
+            _active_jobs.discard(self)
+    
+    def run(self):
+        """
+        Perform the request (implemented by subclasses).
+        """
+        raise NotImplementedError
+
+
+class OpenAIWorker(ApiJob):
     """
-    Background worker thread for OpenAI API calls.
+    Background job for OpenAI prompt enhancement.
     
-    This thread handles the OpenAI API requests to prevent the UI from freezing
-    during the API call. It emits signals when the request completes or fails.
+    The API call runs on the shared enhancement thread so the UI doesn't
+    freeze during the request. It emits signals when the request completes or fails.
     """
     
     # Signals for communicating with the main thread
     enhancement_complete = pyqtSignal(str)  # Emitted when enhancement succeeds
     enhancement_failed = pyqtSignal(str)    # Emitted when enhancement fails
+    chunk_received = pyqtSignal(str)        # Emitted per streamed piece (stream=True only)
     
-    def __init__(self, openai_manager, prompt):
+    def __init__(self, openai_manager, prompt, stream: bool = False):
         """
-        Initialize the worker thread.
+        Initialize the job.
         
         Args:
             openai_manager: The OpenAI manager instance
             prompt: The prompt to enhance
+            stream (bool): Stream the response, emitting chunk_received as the
+                text arrives (enhancement_complete still carries the full text)
         """
         super().__init__()
         self.openai_manager = openai_manager
         self.prompt = prompt
+        self.stream = stream
     
     def run(self):
         """
         Run the enhancement in the background thread.
         """
-        print(f"OpenAI worker starting with prompt: {self.prompt[:50]}...")
+        log.debug("OpenAI worker starting with prompt: %.50s...", self.prompt)
         try:
-            enhanced_prompt = self.openai_manager.enhance_prompt(self.prompt)
+            on_chunk = self.chunk_received.emit if self.stream else None
+            enhanced_prompt = self.openai_manager.enhance_prompt(self.prompt, on_chunk=on_chunk)
             if enhanced_prompt:
-                print(f"Enhancement successful, emitting signal with: {enhanced_prompt[:50]}...")
+                log.debug("Enhancement successful, emitting signal with: %.50s...", enhanced_prompt)
                 self.enhancement_complete.emit(enhanced_prompt)
             else:
-                print("Enhancement failed - no result returned")
+                log.debug("Enhancement failed - no result returned")
                 self.enhancement_failed.emit("Failed to enhance prompt")
         except Exception as e:
-            print(f"Enhancement exception: {e}")
+            log.warning("Enhancement exception: %s", e)
             self.enhancement_failed.emit(str(e)) 
 
 
-class SmartResponseWorker(QThread):
+class SmartResponseWorker(ApiJob):
     """
-    Background worker thread for OpenAI smart response generation.
+    Background job for OpenAI smart response generation.
     
-    This thread handles the OpenAI API requests for generating smart responses
-    to prevent the UI from freezing during the API call. It emits signals when 
-    the request completes or fails.
+    The API call runs on the shared smart response thread so the UI doesn't
+    freeze during the request. It emits signals when the request completes or fails.
     """
     
     # Signals for communicating with the main thread
@@ -65,7 +153,7 @@ class SmartResponseWorker(QThread):
     
     def __init__(self, openai_manager, user_input, response_type="general"):
         """
-        Initialize the worker thread.
+        Initialize the job.
         
         Args:
             openai_manager: The OpenAI manager instance
@@ -81,15 +169,128 @@ class SmartResponseWorker(QThread):
         """
         Run the response generation in the background thread.
         """
-        print(f"Smart response worker starting with input: {self.user_input[:50]}...")
+        log.debug("Smart response worker starting with input: %.50s...", self.user_input)
         try:
             generated_response = self.openai_manager.generate_smart_response(self.user_input, self.response_type)
             if generated_response:
-                print(f"Response generation successful, emitting signal with: {generated_response[:50]}...")
+                log.debug("Response generation successful, emitting signal with: %.50s...", generated_response)
                 self.response_complete.emit(generated_response)
             else:
-                print("Response generation failed - no result returned")
+                log.debug("Response generation failed - no result returned")
                 self.response_failed.emit("Failed to generate response")
         except Exception as e:
-            print(f"Response generation exception: {e}")
-            self.response_failed.emit(str(e)) 
\ No newline at end of file
+            log.warning("Response generation exception: %s", e)
+            self.response_failed.emit(str(e))
+
+
+class FilterSortSignals(QObject):
+    """
+    Signals for FilterSortTask (QRunnable is not a QObject and cannot own signals).
+    """
+    
+    # Emitted with the task's generation and the filtered, sorted notes
+    finished = pyqtSignal(int, list)
+
+
+class FilterSortTask(QRunnable):
+    """
+    Thread pool task that filters and sorts notes off the GUI thread.
+    
+    Each task carries a generation number chosen by the caller. Only the
+    result whose generation is still current should be displayed, so results
+    of superseded searches are simply dropped.
+    
+    NoteRec records are immutable (an edit replaces the record), so the pool
+    thread reads the caller's records directly; the caller must replace its
+    notes list rather than change it while a task holds it.
+    """
+    
+    def __init__(self, generation: int, notes, search_term: str, sort_option: str):
+        """
+        Initialize the task.
+        
+        Args:
+            generation (int): Caller's sequence number for this request
+            notes: List of NoteRec records to filter (not modified)
+            search_term (str): Lower-cased search term
+            sort_option (str): One of the NOTE_SORT_DISPATCH keys
+        """
+        super().__init__()
+        self.signals = FilterSortSignals()
+        self.generation = generation
+        self.notes = notes
+        self.search_term = search_term
+        self.sort_option = sort_option
+    
+    def run(self):
+        """
+        Filter and sort the notes in a pool thread and emit the result.
+        """
+        try:
+            results = filter_and_sort_notes(self.notes, self.search_term, self.sort_option)
+        except Exception as e:
+            log.warning("Filter/sort task failed: %s", e)
+            results = []
+        self.signals.finished.emit(self.generation, results)
+
+
+class ClipboardCaptureSignals(QObject):
+    """
+    Signals for ClipboardCaptureTask.
+    """
+    
+    # Emitted with the original clipboard text and the copied selection
+    # (empty strings when there was none)
+    captured = pyqtSignal(str, str)
+
+
+class ClipboardCaptureTask(QRunnable):
+    """
+    Thread pool task that copies the selected text of the foreground application.
+    
+    The task saves the clipboard, sends Ctrl+C and waits until notify_copied()
+    is called (connect it to QClipboard.dataChanged) or the timeout runs out,
+    then reads the selection. None of the key sending, clipboard reads or
+    waiting happens on the GUI thread; the result is delivered to it through
+    the captured signal.
+    
+    The task never writes the clipboard. Putting the original content back,
+    if wanted, is left to the receiver on the GUI thread, where it can go
+    through the dashboard's ClipboardBridge and not be recorded as a new copy.
+    """
+    
+    def __init__(self, clipboard_manager, timeout_ms: int = 250):
+        """
+        Initialize the task.
+        
+        Args:
+            clipboard_manager: ClipboardManager used to read the clipboard
+            timeout_ms (int): Longest time to wait for the copy, in milliseconds
+        """
+        super().__init__()
+        self.signals = ClipboardCaptureSignals()
+        self.clipboard_manager = clipboard_manager
+        self.timeout_ms = timeout_ms
+        self._copied = threading.Event()
+    
+    def notify_copied(self):
+        """
+        Tell the task the clipboard changed (safe to call from any thread).
+        """
+        self._copied.set()
+    
+    def run(self):
+        """
+        Copy the selection in a pool thread and emit the result.
+        """
+        original = ''
+        selected = ''
+        try:
+            original = self.clipboard_manager.get_current_clipboard() or ''
+            self._copied.clear()
+            keyboard.send('ctrl+c')
+            self._copied.wait(self.timeout_ms / 1000)
+            selected = self.clipboard_manager.get_current_clipboard() or ''
+        except Exception as e:
+            log.warning("Clipboard capture failed: %s", e)
+        self.signals.captured.emit(original, selected)